@@ -3,6 +3,9 @@ from typing import Any, Dict, Optional
 
 import requests
 
+from src.utils.deadline import remaining_timeout
+from src.utils.http import get_session
+
 
 def extract_token(data: Any) -> Optional[str]:
     if isinstance(data, dict):
@@ -58,7 +61,8 @@ def login_and_get_token(
     def _do_login(force_flag: bool) -> requests.Response:
         p = dict(payload)
         p["isForceLogin"] = bool(force_flag)
-        r = requests.post(login_url, headers=headers, json=p, timeout=timeout)
+        # 도구 호출의 마감 시간 안에서만 로그인 (마감이 지났으면 DeadlineExceeded)
+        r = get_session().post(login_url, headers=headers, json=p, timeout=remaining_timeout(timeout))
         return r
 
     resp = _do_login(is_force_login)
@@ -2,13 +2,16 @@
 인증 관리자 - JWT 토큰 관리 및 자동 로그인 처리
 """
 
-import os
+import asyncio
 import logging
 from typing import Optional
-from datetime import datetime, timedelta
+from datetime import datetime
 
 # 같은 패키지 내의 login 모듈에서 import
 from .login import login_and_get_token
+# 토큰 저장소는 client 가 헤더를 읽는 src.auth.token 과 같은 모듈이어야 하므로 절대 경로로 import
+# (top-level auth 패키지로 로드되어도 저장소가 둘로 나뉘지 않도록)
+from src.auth.token import get_token_store, token_identity
 
 logger = logging.getLogger(__name__)
 
@@ -35,12 +38,16 @@ class AuthManager:
 
         try:
             logger.info(f"로그인 시도: {uid}")
-            token = login_and_get_token(login_url, uid, pwd, force, self.config.timeout)
+            # 블로킹 HTTP 호출은 스레드에서 실행해 이벤트 루프를 막지 않음
+            token = await asyncio.to_thread(login_and_get_token, login_url, uid, pwd, force, self.config.timeout)
 
-            # 토큰 저장
-            self.token = token
-            self.token_expires = datetime.now() + timedelta(hours=1)  # 보통 1시간 유효
-            os.environ["EDB_TOKEN"] = token
+            # 토큰 저장 (만료 시각은 JWT exp 클레임 기준, 토큰 파일에는 실제 로그인한 사용자로 기록)
+            # 후 만료 전 백그라운드 갱신 등록
+            identity = token_identity(login_url, uid)
+            self._set_token(token, identity)
+            get_token_store().enable_refresh(
+                lambda: login_and_get_token(login_url, uid, pwd, False, self.config.timeout), identity
+            )
 
             logger.info(f"로그인 성공: {uid}")
             return token
@@ -55,19 +62,17 @@ class AuthManager:
             logger.debug("자동 로그인 비활성화됨")
             return None
 
-        # 기존 토큰이 유효한지 확인
-        if self.token and self.token_expires:
-            if datetime.now() < self.token_expires:
-                logger.debug("기존 토큰 유효")
-                return self.token
-
-        # 환경 변수에서 토큰 확인
-        env_token = os.getenv("EDB_TOKEN")
-        if env_token:
-            self.token = env_token
-            self.token_expires = datetime.now() + timedelta(hours=1)
-            logger.debug("환경 변수에서 토큰 로드")
-            return env_token
+        # 기존 토큰이 유효한지 확인 (EDB_TOKEN 환경변수, 토큰 파일, 백그라운드 갱신 결과 모두 저장소에 있음)
+        store = get_token_store()
+        if store.is_fresh():
+            # 로그인 없이 재사용한 토큰도 만료 전에 갱신되도록 로그인 함수 등록
+            config = self.config
+            store.enable_refresh(
+                lambda: login_and_get_token(config.login_url, config.user_id, config.password, False, config.timeout)
+            )
+            self._sync_from_store()
+            logger.debug("기존 토큰 유효")
+            return self.token
 
         # 새로 로그인
         try:
@@ -76,14 +81,59 @@ class AuthManager:
             logger.warning(f"자동 로그인 실패: {e}")
             return None
 
+    def start_auto_login(self) -> None:
+        """auto_login() 을 백그라운드 스레드에서 실행합니다 (서버 시작을 막지 않음)."""
+        if not self.config.auto_login_enabled:
+            return
+        # 스레드에는 이벤트 루프가 없으므로 자체 루프로 실행 (저장된 토큰이 유효하면 곧바로 끝남)
+        get_token_store().start_login(lambda: asyncio.run(self.auto_login()))
+
+    async def wait_for_login(self) -> None:
+        """start_auto_login() 이 진행 중이면 현재 마감 시간 안에서 끝날 때까지 기다립니다."""
+        await get_token_store().await_login()
+
+    async def reauthenticate(self, failed_generation: Optional[int] = None) -> Optional[str]:
+        """
+        401 로 거절된 토큰 세대에 대해 재로그인합니다. 동시에 실패한 호출들은 로그인 1회를 공유하고,
+        이미 새 세대로 교체되었다면 로그인 없이 새 토큰을 반환합니다.
+        """
+        if not self.config.auto_login_enabled or not self.config.login_url:
+            return None
+        store = get_token_store()
+        generation = store.generation if failed_generation is None else failed_generation
+        uid, pwd, login_url = self.config.user_id, self.config.password, self.config.login_url
+
+        def _login() -> str:
+            return login_and_get_token(login_url, uid, pwd, False, self.config.timeout)
+
+        try:
+            token = await asyncio.to_thread(store.reauthenticate, generation, _login)
+        except Exception as e:
+            logger.warning(f"재인증 실패: {e}")
+            return None
+        if token:
+            store.enable_refresh(_login)
+            self._sync_from_store()
+        return token
+
     def get_token(self) -> Optional[str]:
         """현재 토큰 반환"""
-        return self.token or os.getenv("EDB_TOKEN")
+        self._sync_from_store()
+        return self.token
 
     def clear_token(self):
         """토큰 초기화"""
         self.token = None
         self.token_expires = None
-        if "EDB_TOKEN" in os.environ:
-            del os.environ["EDB_TOKEN"]
-        logger.debug("토큰 초기화됨")
\ No newline at end of file
+        get_token_store().clear()
+        logger.debug("토큰 초기화됨")
+
+    def _set_token(self, token: str, identity: Optional[str] = None) -> None:
+        get_token_store().set(token, identity)
+        self._sync_from_store()
+
+    def _sync_from_store(self) -> None:
+        store = get_token_store()
+        self.token = store.get()
+        expires_at = store.expires_at
+        self.token_expires = datetime.fromtimestamp(expires_at) if expires_at is not None else None
\ No newline at end of file
@@ -0,0 +1,362 @@
+"""
+JWT 토큰 저장소와 만료 전 백그라운드 갱신.
+
+토큰의 exp 클레임을 로컬에서 디코딩해(서명 검증 없음, 만료 시각 확인 용도) 만료 직전에
+백그라운드 스레드가 다시 로그인하고, 새 토큰을 락 안에서 한 번에 교체합니다.
+API 호출은 재로그인을 기다리지 않고 항상 현재 토큰을 사용합니다.
+토큰은 소유자만 읽을 수 있는 파일(0600)에도 저장해, 재시작 시 아직 유효하면 로그인 없이 재사용합니다.
+"""
+
+import asyncio
+import base64
+import json
+import logging
+import os
+import threading
+import time
+from typing import Any, Callable, Dict, Optional, Tuple
+
+from src.utils.config import Config
+from src.utils.deadline import current_deadline
+from src.utils.warmer import start_warmer
+
+logger = logging.getLogger(__name__)
+
+# exp 클레임이 없는 토큰의 만료 추정 (기존 AuthManager 가정과 동일)
+DEFAULT_TOKEN_LIFETIME = 3600.0
+
+# 갱신 성공 후 다음 갱신까지 최소 간격 (수명이 아주 짧은 토큰으로 로그인을 연달아 하지 않도록)
+MIN_REFRESH_INTERVAL = 30.0
+
+
+def jwt_claims(token: str) -> Optional[dict]:
+    """JWT payload 를 디코딩합니다. JWT 형식이 아니면 None."""
+    parts = token.split(".")
+    if len(parts) != 3:
+        return None
+    payload = parts[1] + "=" * (-len(parts[1]) % 4)
+    try:
+        claims = json.loads(base64.urlsafe_b64decode(payload))
+    except (ValueError, TypeError):
+        return None
+    return claims if isinstance(claims, dict) else None
+
+
+def jwt_expiry(token: str) -> Optional[float]:
+    """exp 클레임(epoch 초). 없거나 해석할 수 없으면 None."""
+    claims = jwt_claims(token)
+    if not claims:
+        return None
+    exp = claims.get("exp")
+    if isinstance(exp, (int, float)) and not isinstance(exp, bool):
+        return float(exp)
+    return None
+
+
+class TokenStore:
+    """
+    프로세스 전역 토큰 저장소 (인증 상태의 단일 소스).
+
+    토큰이 바뀔 때마다 세대(generation) 번호가 1 씩 증가하고, 그 세대용 Authorization 헤더를
+    미리 만들어 둡니다. 401 을 받은 호출은 자신이 사용한 세대로 reauthenticate() 를 호출하며,
+    같은 세대에 대해서는 로그인이 한 번만 수행되고 나머지는 새 세대의 토큰을 받습니다.
+    기존 코드와의 호환을 위해 EDB_TOKEN 환경변수도 함께 갱신합니다.
+    enable_refresh() 로 로그인 함수를 등록하면 만료 refresh_lead 초 전에 백그라운드에서 갱신합니다.
+    persist_path 를 주면 토큰을 그 파일에 저장하며, identity(로그인 URL + 사용자)가 다른 파일은 무시합니다.
+    설정과 다른 사용자로 로그인한 토큰은 set(token, identity=...) 로 그 사용자의 identity 로 저장되므로
+    재시작 후 설정된 사용자의 토큰으로 재사용되지 않습니다.
+    """
+
+    def __init__(self, refresh_lead: float = 300.0, persist_path: Optional[str] = None, identity: str = ""):
+        self.refresh_lead = float(refresh_lead)
+        self.persist_path = persist_path
+        self.identity = identity
+        self._lock = threading.Lock()
+        self._changed = threading.Condition(self._lock)
+        self._token: Optional[str] = None
+        # 현재 토큰을 발급받은 로그인 URL + 사용자 (토큰 파일에 기록)
+        self._token_identity = identity
+        self._issued_at = 0.0
+        self._expires_at: Optional[float] = None
+        self._generation = 0
+        # (세대, 헤더) 를 한 번에 교체하므로 snapshot() 은 락 없이 읽음
+        self._snapshot: Tuple[int, Dict[str, str]] = (0, {})
+        self._reauthenticating = False
+        self._login: Optional[Callable[[], str]] = None
+        self._login_identity = identity
+        self._thread: Optional[threading.Thread] = None
+        # 서버 시작 시 백그라운드 로그인 완료 신호 (진행 중인 것이 없으면 None)
+        self._startup: Optional[threading.Event] = None
+
+    def set(self, token: str, identity: Optional[str] = None) -> None:
+        """token 을 현재 토큰으로 교체합니다. identity 는 발급받은 로그인 URL + 사용자 (기본: 설정된 사용자)."""
+        now = time.time()
+        expires_at = jwt_expiry(token)
+        with self._lock:
+            self._token = token
+            self._token_identity = self.identity if identity is None else identity
+            self._issued_at = now
+            self._expires_at = expires_at if expires_at is not None else now + DEFAULT_TOKEN_LIFETIME
+            self._generation += 1
+            self._snapshot = (self._generation, {"Authorization": f"Bearer {token}"})
+            os.environ["EDB_TOKEN"] = token
+            self._changed.notify_all()
+            # 락 안에서 기록해 늦게 끝난 이전 세대가 새 토큰을 덮어쓰지 않게 함
+            self._persist()
+
+    def get(self) -> Optional[str]:
+        with self._lock:
+            return self._token
+
+    @property
+    def generation(self) -> int:
+        return self._snapshot[0]
+
+    def snapshot(self) -> Tuple[int, Dict[str, str]]:
+        """현재 세대와 그 세대의 인증 헤더. 반환된 dict 는 수정하지 마세요."""
+        return self._snapshot
+
+    def reauthenticate(self, failed_generation: int, login: Optional[Callable[[], str]] = None) -> Optional[str]:
+        """
+        failed_generation 세대의 토큰이 거절되었을 때 새 토큰을 반환합니다.
+
+        이미 다른 호출이 새 세대로 교체했다면 로그인 없이 그 토큰을, 같은 세대의 로그인이 진행 중이면
+        끝날 때까지 기다렸다 그 결과를 반환합니다. 그 로그인이 실패했다면 다시 시도하지 않고 None.
+        login 이 없으면 enable_refresh() 로 등록된 함수를 사용합니다.
+        """
+        with self._lock:
+            waited = False
+            while True:
+                if self._generation != failed_generation:
+                    return self._token
+                if not self._reauthenticating:
+                    break
+                waited = True
+                self._changed.wait()
+            if waited:
+                return None
+            # 직접 넘긴 login 은 설정된 사용자의 로그인, 등록된 함수는 등록 시의 사용자
+            identity = None if login is not None else self._login_identity
+            login = login or self._login
+            if login is None:
+                return None
+            self._reauthenticating = True
+        try:
+            token = login()
+            self.set(token, identity)
+            return token
+        finally:
+            with self._lock:
+                self._reauthenticating = False
+                self._changed.notify_all()
+
+    @property
+    def expires_at(self) -> Optional[float]:
+        with self._lock:
+            return self._expires_at
+
+    def is_fresh(self, margin: float = 0.0) -> bool:
+        """토큰이 있고 margin 초 뒤에도 만료되지 않았는지."""
+        with self._lock:
+            if not self._token:
+                return False
+            return self._expires_at is None or self._expires_at - margin > time.time()
+
+    def clear(self) -> None:
+        with self._lock:
+            self._token = None
+            self._expires_at = None
+            self._generation += 1
+            self._snapshot = (self._generation, {})
+            os.environ.pop("EDB_TOKEN", None)
+            self._changed.notify_all()
+            self._persist()
+
+    def load(self) -> bool:
+        """
+        persist_path 에 저장된 토큰이 같은 identity 이고 아직 유효하면 현재 토큰으로 사용합니다.
+        만료되었거나 읽을 수 없으면 False (파일은 다음 로그인 때 덮어씀).
+        """
+        if not self.persist_path:
+            return False
+        try:
+            with open(self.persist_path, "r", encoding="utf-8") as f:
+                saved = json.load(f)
+            token = saved["token"]
+            expires_at = float(saved["expiresAt"])
+            issued_at = float(saved.get("issuedAt", 0.0))
+        except FileNotFoundError:
+            return False
+        except (OSError, ValueError, TypeError, KeyError) as e:
+            logger.warning(f"저장된 토큰을 읽을 수 없습니다: {e}")
+            return False
+        if saved.get("identity") != self.identity or not isinstance(token, str) or expires_at <= time.time():
+            return False
+        with self._lock:
+            self._token = token
+            self._token_identity = self.identity
+            self._issued_at = issued_at or time.time()
+            self._expires_at = expires_at
+            self._generation += 1
+            self._snapshot = (self._generation, {"Authorization": f"Bearer {token}"})
+            os.environ["EDB_TOKEN"] = token
+            self._changed.notify_all()
+        logger.info("저장된 토큰 재사용 (로그인 생략)")
+        return True
+
+    def _persist(self) -> None:
+        """현재 토큰을 persist_path 에 원자적으로 기록합니다 (토큰이 없으면 파일 삭제). _lock 안에서 호출."""
+        if not self.persist_path:
+            return
+        try:
+            if self._token is None:
+                try:
+                    os.remove(self.persist_path)
+                except FileNotFoundError:
+                    pass
+                return
+            directory = os.path.dirname(self.persist_path)
+            if directory:
+                os.makedirs(directory, mode=0o700, exist_ok=True)
+            body = json.dumps({
+                "identity": self._token_identity,
+                "token": self._token,
+                "issuedAt": self._issued_at,
+                "expiresAt": self._expires_at,
+            })
+            tmp = f"{self.persist_path}.{os.getpid()}.tmp"
+            # 생성 시점부터 0600 으로 만들어 다른 사용자가 읽을 수 있는 순간이 없게 함
+            fd = os.open(tmp, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                f.write(body)
+            os.replace(tmp, self.persist_path)
+        except OSError as e:
+            logger.warning(f"토큰 파일 저장 실패: {e}")
+
+    def start_login(self, login: Callable[[], Any]) -> None:
+        """
+        서버 시작 시 로그인을 백그라운드 스레드에서 실행해 MCP 핸드셰이크를 막지 않습니다.
+        데이터 도구는 await_login() 으로 이 로그인이 끝날 때까지만 기다립니다.
+        """
+        done = threading.Event()
+        self._startup = done
+
+        def run() -> None:
+            try:
+                login()
+            except Exception as e:
+                logger.warning(f"백그라운드 로그인 실패: {e}")
+            finally:
+                done.set()
+
+        threading.Thread(target=run, name="edb-startup-login", daemon=True).start()
+
+    @property
+    def login_pending(self) -> bool:
+        startup = self._startup
+        return startup is not None and not startup.is_set()
+
+    def wait_for_login(self, timeout: Optional[float] = None) -> bool:
+        """시작 로그인이 끝났으면(또는 없으면) True, timeout 안에 끝나지 않으면 False."""
+        startup = self._startup
+        return startup is None or startup.wait(timeout)
+
+    async def await_login(self) -> None:
+        """
+        시작 로그인이 진행 중이면 현재 마감 시간 안에서 기다립니다. 끝난 뒤에는 비용 없이 반환합니다.
+        끝나지 않은 채 돌아오더라도 이후 401 재인증이 같은 로그인에 합류합니다.
+        """
+        if not self.login_pending:
+            return
+        deadline = current_deadline()
+        await asyncio.to_thread(self.wait_for_login, deadline.remaining() if deadline is not None else None)
+
+    def enable_refresh(self, login: Callable[[], str], identity: Optional[str] = None) -> None:
+        """
+        만료 전 갱신에 사용할 로그인 함수를 등록하고 갱신 스레드를 시작합니다.
+        identity 는 login 이 로그인하는 로그인 URL + 사용자 (기본: 설정된 사용자).
+        EDB_WARM_CONNECTIONS 가 설정되어 있으면 유휴 커넥션 워머도 함께 시작합니다.
+        """
+        with self._lock:
+            self._login = login
+            self._login_identity = self.identity if identity is None else identity
+            self._changed.notify_all()
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._refresh_loop, name="edb-token-refresh", daemon=True)
+                self._thread.start()
+                start_warmer()
+
+    def _refresh_at(self) -> Optional[float]:
+        if self._expires_at is None or self._login is None:
+            return None
+        if self._expires_at <= self._issued_at:
+            # 받을 때 이미 만료된 토큰: 갱신해도 같은 토큰이 올 수 있으므로 예약하지 않고 401 재인증에 맡김
+            return None
+        # 수명이 짧은 토큰은 수명의 1/5 을 남기고 갱신
+        lead = min(self.refresh_lead, max(self._expires_at - self._issued_at, 0.0) / 5)
+        return self._expires_at - lead
+
+    def _refresh_loop(self) -> None:
+        failures = 0
+        not_before = 0.0
+        warned_generation = 0
+        while True:
+            with self._lock:
+                expired = self._expires_at is not None and self._expires_at <= self._issued_at
+                if expired and warned_generation != self._generation:
+                    warned_generation = self._generation
+                    logger.warning("받은 토큰이 이미 만료되어 만료 전 갱신을 예약하지 않습니다")
+                refresh_at = self._refresh_at()
+                wait = None if refresh_at is None else max(refresh_at, not_before) - time.time()
+                if wait is None or wait > 0:
+                    # 토큰이 교체되거나 로그인 함수가 바뀌면 깨어나 다시 계산
+                    self._changed.wait(timeout=wait)
+                    continue
+                login = self._login
+                identity = self._login_identity
+                expires_at = self._expires_at
+            try:
+                token = login()
+            except Exception as e:
+                failures += 1
+                # 만료 전까지 지수 백오프(최대 60초)로 재시도
+                delay = min(5.0 * (2 ** (failures - 1)), 60.0)
+                logger.warning(f"토큰 갱신 실패({failures}회), {delay:.0f}초 후 재시도: {e}")
+                with self._lock:
+                    if self._expires_at == expires_at:
+                        self._changed.wait(timeout=delay)
+                continue
+            failures = 0
+            not_before = time.time() + MIN_REFRESH_INTERVAL
+            self.set(token, identity)
+            logger.info("토큰 만료 전 갱신 완료")
+
+
+def token_identity(login_url: Optional[str], user_id: Optional[str]) -> str:
+    """토큰 파일에 기록하는 로그인 URL + 사용자 식별자."""
+    return f"{login_url}|{user_id or ''}"
+
+
+_TOKEN_STORE: Optional[TokenStore] = None
+_TOKEN_STORE_LOCK = threading.Lock()
+
+
+def get_token_store() -> TokenStore:
+    global _TOKEN_STORE
+    if _TOKEN_STORE is None:
+        with _TOKEN_STORE_LOCK:
+            if _TOKEN_STORE is None:
+                config = Config()
+                store = TokenStore(
+                    refresh_lead=config.token_refresh_lead,
+                    persist_path=config.token_cache_path if config.token_cache_enabled else None,
+                    identity=token_identity(config.login_url, config.user_id),
+                )
+                # .env 등으로 미리 지정된 토큰이 있으면 첫 세대로 사용, 없으면 이전 실행이 저장한 토큰
+                env_token = os.getenv("EDB_TOKEN")
+                if env_token:
+                    store.set(env_token)
+                else:
+                    store.load()
+                _TOKEN_STORE = store
+    return _TOKEN_STORE
@@ -0,0 +1,70 @@
+#!/usr/bin/env python3
+"""
+DrugInfo 응답 디스크 캐시 점검 CLI
+
+    python -m src.cache_cli stats
+    python -m src.cache_cli list --limit 20
+    python -m src.cache_cli prune [--expired]
+    python -m src.cache_cli vacuum
+"""
+import argparse
+import json
+import sys
+from typing import List, Optional
+
+from dotenv import load_dotenv
+try:
+    from src.druginfo.disk_cache import DiskCache
+    from src.utils.config import Config
+except ModuleNotFoundError:
+    import os as _os
+    import sys as _sys
+    _sys.path.append(_os.path.dirname(_os.path.dirname(_os.path.abspath(__file__))))
+    from src.druginfo.disk_cache import DiskCache
+    from src.utils.config import Config
+
+
+def build_arg_parser() -> argparse.ArgumentParser:
+    config = Config()
+    parser = argparse.ArgumentParser(description="Inspect, prune and vacuum the DrugInfo response disk cache")
+    parser.add_argument(
+        "--path",
+        default=config.disk_cache_path,
+        help="Cache database path (env: EDB_DISK_CACHE_PATH)",
+    )
+    sub = parser.add_subparsers(dest="command", required=True)
+    sub.add_parser("stats", help="Print entry counts and sizes")
+    list_parser = sub.add_parser("list", help="List most recently stored entries")
+    list_parser.add_argument("--limit", type=int, default=20)
+    prune_parser = sub.add_parser("prune", help="Delete expired entries older than EDB_DISK_CACHE_MAX_AGE")
+    prune_parser.add_argument("--expired", action="store_true", help="Delete every expired entry instead")
+    sub.add_parser("vacuum", help="Checkpoint WAL and VACUUM the database")
+    sub.add_parser("clear", help="Delete all entries")
+    return parser
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    load_dotenv(".env", override=False)
+    load_dotenv(".env.local", override=False)
+    args = build_arg_parser().parse_args(argv)
+    cache = DiskCache(args.path, max_age=Config().disk_cache_max_age)
+    try:
+        if args.command == "stats":
+            print(json.dumps(cache.stats(), ensure_ascii=False, indent=2))
+        elif args.command == "list":
+            print(json.dumps(cache.entries(args.limit), ensure_ascii=False, indent=2))
+        elif args.command == "prune":
+            print(f"삭제된 항목: {cache.prune(expired_only=args.expired)}")
+        elif args.command == "vacuum":
+            before = cache.stats()["fileBytes"]
+            cache.vacuum()
+            print(f"VACUUM 완료: {before} -> {cache.stats()['fileBytes']} bytes")
+        elif args.command == "clear":
+            print(f"삭제된 항목: {cache.clear()}")
+    finally:
+        cache.close()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -5,6 +5,9 @@ from .client import (
     get_product_by_code,
     DrugInfoError,
     UnauthorizedError,
+    CircuitOpenError,
+    DeadlineExceededError,
+    client_stats,
     list_main_ingredient_drug_effect,
     get_main_ingredient_drug_effect_by_id,
     list_main_ingredient_drug_kind,
@@ -14,6 +17,43 @@ from .client import (
     get_main_ingredient_picto_by_code,
     list_product_edicode,
     list_product_edicode_same_ingredient,
+    async_list_main_ingredient,
+    async_get_main_ingredient_by_code,
+    async_list_product,
+    async_get_product_by_code,
+    async_list_main_ingredient_drug_effect,
+    async_get_main_ingredient_drug_effect_by_id,
+    async_list_main_ingredient_drug_kind,
+    async_list_main_ingredient_guide_a4,
+    async_list_main_ingredient_guide_a5,
+    async_list_main_ingredient_picto,
+    async_get_main_ingredient_picto_by_code,
+    async_list_product_edicode,
+    async_list_product_edicode_same_ingredient,
+)
+from .batch import (
+    get_products_by_codes,
+    get_main_ingredients_by_codes,
+    async_get_products_by_codes,
+    async_get_main_ingredients_by_codes,
+    SearchResolution,
+    search_and_resolve_products,
+    async_search_and_resolve_products,
+)
+from .pagination import (
+    iter_products,
+    iter_main_ingredients,
+    iter_product_edicodes,
+    async_iter_products,
+    async_iter_main_ingredients,
+    async_iter_product_edicodes,
+    ScanResult,
+    scan_products,
+    scan_main_ingredients,
+    scan_product_edicodes,
+    async_scan_products,
+    async_scan_main_ingredients,
+    async_scan_product_edicodes,
 )
 __all__ = [
     "list_main_ingredient",
@@ -22,6 +62,9 @@ __all__ = [
     "get_product_by_code",
     "DrugInfoError",
     "UnauthorizedError",
+    "CircuitOpenError",
+    "DeadlineExceededError",
+    "client_stats",
     "list_main_ingredient_drug_effect",
     "get_main_ingredient_drug_effect_by_id",
     "list_main_ingredient_drug_kind",
@@ -31,6 +74,39 @@ __all__ = [
     "get_main_ingredient_picto_by_code",
     "list_product_edicode",
     "list_product_edicode_same_ingredient",
+    "async_list_main_ingredient",
+    "async_get_main_ingredient_by_code",
+    "async_list_product",
+    "async_get_product_by_code",
+    "async_list_main_ingredient_drug_effect",
+    "async_get_main_ingredient_drug_effect_by_id",
+    "async_list_main_ingredient_drug_kind",
+    "async_list_main_ingredient_guide_a4",
+    "async_list_main_ingredient_guide_a5",
+    "async_list_main_ingredient_picto",
+    "async_get_main_ingredient_picto_by_code",
+    "async_list_product_edicode",
+    "async_list_product_edicode_same_ingredient",
+    "get_products_by_codes",
+    "get_main_ingredients_by_codes",
+    "async_get_products_by_codes",
+    "async_get_main_ingredients_by_codes",
+    "SearchResolution",
+    "search_and_resolve_products",
+    "async_search_and_resolve_products",
+    "iter_products",
+    "iter_main_ingredients",
+    "iter_product_edicodes",
+    "async_iter_products",
+    "async_iter_main_ingredients",
+    "async_iter_product_edicodes",
+    "ScanResult",
+    "scan_products",
+    "scan_main_ingredients",
+    "scan_product_edicodes",
+    "async_scan_products",
+    "async_scan_main_ingredients",
+    "async_scan_product_edicodes",
 ]
 
 
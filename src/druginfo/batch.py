@@ -0,0 +1,145 @@
+"""
+코드 목록으로 상세 정보를 한 번에 조회하는 배치 API.
+
+입력 코드의 중복을 제거하고, 캐시에 있는 코드는 업스트림 호출 없이 바로 채운 뒤
+나머지만 fan-out(계열별 적응형 동시 실행 한도)으로 동시에 조회합니다.
+결과는 입력 순서의 코드 → 응답 dict 이며, 실패한 코드의 값은 DrugInfoError 입니다.
+인증 실패(401)는 코드별 오류로 두지 않고 그대로 발생시켜 호출자가 재인증 후 다시 호출하게 합니다
+(성공한 코드는 캐시에 남으므로 재호출은 실패한 코드만 조회합니다).
+
+search_and_resolve_products 는 "제품 검색 → ProductCode 선택 → 상세 조회" 흐름을 한 번에 수행합니다.
+"""
+
+from typing import Any, Callable, Dict, Iterable, List, NamedTuple, Optional, Tuple, Union
+
+from .client import (
+    DrugInfoError,
+    UnauthorizedError,
+    _Request,
+    _asend,
+    _cached,
+    _get_main_ingredient_by_code_request,
+    _get_product_by_code_request,
+    _list_product_request,
+    _send,
+)
+from .fanout import afan_out, fan_out, limiter_for
+from .page_cache import page_items
+
+BatchResult = Dict[str, Union[Dict[str, Any], DrugInfoError]]
+
+
+def _unique_codes(codes: Iterable[str]) -> List[str]:
+    if isinstance(codes, str):
+        # 문자열 하나는 글자 단위가 아니라 코드 하나로 취급
+        codes = [codes]
+    return list(dict.fromkeys(code.strip() for code in codes if code and code.strip()))
+
+
+def _split(
+    codes: List[str], build: Callable[[str], _Request], timeout: int, use_cache: bool, in_loop: bool
+) -> Tuple[BatchResult, List[str]]:
+    """캐시에서 바로 채울 수 있는 코드와 업스트림 조회가 필요한 코드로 나눕니다."""
+    results: BatchResult = {}
+    misses: List[str] = []
+    for code in codes:
+        if not use_cache:
+            misses.append(code)
+            continue
+        try:
+            data = _cached(build(code), timeout, in_loop)
+        except DrugInfoError as e:
+            results[code] = e
+            continue
+        if data is None:
+            misses.append(code)
+        else:
+            results[code] = data
+    return results, misses
+
+
+def _merge(codes: List[str], results: BatchResult, misses: List[str], fetched: List[Any]) -> BatchResult:
+    for code, outcome in zip(misses, fetched):
+        if isinstance(outcome, UnauthorizedError):
+            raise outcome
+        if isinstance(outcome, Exception) and not isinstance(outcome, DrugInfoError):
+            outcome = DrugInfoError(f"조회 실패: {outcome}")
+        results[code] = outcome
+    return {code: results[code] for code in codes}
+
+
+def _batch(build: Callable[[str], _Request], codes: Iterable[str], timeout: int, use_cache: bool) -> BatchResult:
+    unique = _unique_codes(codes)
+    results, misses = _split(unique, build, timeout, use_cache, in_loop=False)
+    if not misses:
+        return {code: results[code] for code in unique}
+    limiter = limiter_for(build(misses[0]).endpoint)
+    fetched = fan_out([lambda code=code: _send(build(code), timeout, use_cache) for code in misses], limiter)
+    return _merge(unique, results, misses, fetched)
+
+
+async def _abatch(build: Callable[[str], _Request], codes: Iterable[str], timeout: int, use_cache: bool) -> BatchResult:
+    unique = _unique_codes(codes)
+    results, misses = _split(unique, build, timeout, use_cache, in_loop=True)
+    if not misses:
+        return {code: results[code] for code in unique}
+    limiter = limiter_for(build(misses[0]).endpoint)
+    fetched = await afan_out([lambda code=code: _asend(build(code), timeout, use_cache) for code in misses], limiter)
+    return _merge(unique, results, misses, fetched)
+
+
+def get_products_by_codes(codes: Iterable[str], timeout: int = 15, use_cache: bool = True) -> BatchResult:
+    """제품 코드 목록의 상세 정보. 값은 get_product_by_code 응답 또는 DrugInfoError."""
+    return _batch(_get_product_by_code_request, codes, timeout, use_cache)
+
+
+def get_main_ingredients_by_codes(codes: Iterable[str], timeout: int = 15, use_cache: bool = True) -> BatchResult:
+    """주성분 코드 목록의 상세 정보. 값은 get_main_ingredient_by_code 응답 또는 DrugInfoError."""
+    return _batch(_get_main_ingredient_by_code_request, codes, timeout, use_cache)
+
+
+async def async_get_products_by_codes(codes: Iterable[str], timeout: int = 15, use_cache: bool = True) -> BatchResult:
+    return await _abatch(_get_product_by_code_request, codes, timeout, use_cache)
+
+
+async def async_get_main_ingredients_by_codes(codes: Iterable[str], timeout: int = 15, use_cache: bool = True) -> BatchResult:
+    return await _abatch(_get_main_ingredient_by_code_request, codes, timeout, use_cache)
+
+
+class SearchResolution(NamedTuple):
+    # list_product 검색 응답 (PageSize=top)
+    listing: Dict[str, Any]
+    # 검색 순서대로 상위 top 개 제품 코드 → 상세 응답 또는 DrugInfoError
+    details: BatchResult
+
+
+def _search_params(filters: Dict[str, Any], top: int) -> Dict[str, Any]:
+    params = {k: v for k, v in filters.items() if k not in ("Page", "PageSize", "page", "size")}
+    params.update(Page=1, PageSize=max(int(top), 1))
+    return params
+
+
+def _top_codes(listing: Dict[str, Any], top: int) -> List[str]:
+    codes: List[str] = []
+    for item in page_items(listing) or []:
+        code: Optional[Any] = None
+        if isinstance(item, dict):
+            code = item.get("productCode") or item.get("ProductCode")
+        if code:
+            codes.append(str(code))
+    return _unique_codes(codes)[:top]
+
+
+def search_and_resolve_products(
+    top: int = 3, timeout: int = 15, use_cache: bool = True, **filters: Any
+) -> SearchResolution:
+    """list_product(**filters) 로 검색한 뒤 상위 top 개 제품의 상세 정보를 동시에 조회합니다."""
+    listing = _send(_list_product_request(**_search_params(filters, top)), timeout, use_cache)
+    return SearchResolution(listing, get_products_by_codes(_top_codes(listing, top), timeout, use_cache))
+
+
+async def async_search_and_resolve_products(
+    top: int = 3, timeout: int = 15, use_cache: bool = True, **filters: Any
+) -> SearchResolution:
+    listing = await _asend(_list_product_request(**_search_params(filters, top)), timeout, use_cache)
+    return SearchResolution(listing, await async_get_products_by_codes(_top_codes(listing, top), timeout, use_cache))
@@ -0,0 +1,157 @@
+"""DrugInfo API 응답 인메모리 캐시 (TTL 만료 + 총 바이트 기준 LRU 축출)."""
+
+import json
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Mapping, Optional, Tuple
+from urllib.parse import urlencode
+
+from src.utils.config import Config
+
+
+def canonical_key(url: str, params: Optional[Mapping[str, Any]] = None) -> str:
+    """
+    요청을 정규화한 캐시 키를 만듭니다.
+
+    레거시 별칭(q/page/size)은 요청 빌더에서 이미 PascalCase 파라미터로 변환되므로,
+    여기서는 파라미터 정렬과 값의 문자열화만 수행합니다. (5 와 "5" 는 같은 키)
+    """
+    if not params:
+        return url
+    items = sorted((str(k), str(v)) for k, v in params.items() if v is not None)
+    return f"{url}?{urlencode(items)}"
+
+
+class _Entry:
+    __slots__ = ("body", "expires_at", "stale_until")
+
+    def __init__(self, body: bytes, expires_at: float, stale_until: float):
+        self.body = body
+        self.expires_at = expires_at
+        self.stale_until = stale_until
+
+
+class ResponseCache:
+    """
+    스레드 안전한 TTL + LRU 응답 캐시.
+
+    값은 JSON 직렬화된 bytes 로 보관하므로 호출자가 결과를 수정해도 캐시가 오염되지 않고,
+    용량 제한은 항목 수가 아닌 직렬화 바이트 합계 기준으로 적용됩니다.
+    """
+
+    def __init__(self, max_bytes: int = 32 * 1024 * 1024, default_ttl: float = 300.0):
+        self.max_bytes = int(max_bytes)
+        self.default_ttl = float(default_ttl)
+        self._entries: "OrderedDict[str, _Entry]" = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.stale_hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """신선한 항목만 반환합니다."""
+        found = self.lookup(key)
+        if found is None or found[1]:
+            return None
+        return found[0]
+
+    def lookup(self, key: str) -> Optional[Tuple[Dict[str, Any], bool]]:
+        """
+        (값, stale 여부) 를 반환합니다.
+
+        만료되었더라도 stale_ttl 구간 안이면 stale=True 로 반환해
+        호출자가 즉시 응답하고 백그라운드에서 갱신할 수 있게 합니다.
+        """
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            if entry.stale_until <= now:
+                self._remove(key)
+                self.misses += 1
+                return None
+            stale = entry.expires_at <= now
+            self._entries.move_to_end(key)
+            if stale:
+                self.stale_hits += 1
+            else:
+                self.hits += 1
+            body = entry.body
+        return json.loads(body), stale
+
+    def set(self, key: str, value: Dict[str, Any], ttl: Optional[float] = None, stale_ttl: float = 0.0) -> None:
+        ttl = self.default_ttl if ttl is None else float(ttl)
+        if ttl <= 0 and stale_ttl <= 0:
+            return
+        body = json.dumps(value, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+        if len(body) > self.max_bytes:
+            return
+        expires_at = time.monotonic() + max(ttl, 0.0)
+        with self._lock:
+            if key in self._entries:
+                self._remove(key)
+            self._entries[key] = _Entry(body, expires_at, expires_at + max(float(stale_ttl), 0.0))
+            self._bytes += len(body)
+            while self._bytes > self.max_bytes and self._entries:
+                oldest = next(iter(self._entries))
+                self._remove(oldest)
+                self.evictions += 1
+
+    def expires_in(self, key: str) -> Optional[float]:
+        """항목이 신선하게 남은 시간(초, stale 구간이면 음수). 없으면 None. 적중 통계에는 반영하지 않습니다."""
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry.stale_until <= now:
+                return None
+            return entry.expires_at - now
+
+    def invalidate(self, key: str) -> None:
+        with self._lock:
+            if key in self._entries:
+                self._remove(key)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {
+                "entries": len(self._entries),
+                "bytes": self._bytes,
+                "maxBytes": self.max_bytes,
+                "hits": self.hits,
+                "staleHits": self.stale_hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+            }
+
+    def _remove(self, key: str) -> None:
+        entry = self._entries.pop(key)
+        self._bytes -= len(entry.body)
+
+
+_CACHE: Optional[ResponseCache] = None
+_CACHE_RESOLVED = False
+_CACHE_LOCK = threading.Lock()
+
+
+def get_response_cache() -> Optional[ResponseCache]:
+    """Config 기반 프로세스 전역 캐시. EDB_CACHE_ENABLED=false 이면 None."""
+    global _CACHE, _CACHE_RESOLVED
+    if _CACHE_RESOLVED:
+        return _CACHE
+    with _CACHE_LOCK:
+        if not _CACHE_RESOLVED:
+            config = Config()
+            if config.cache_enabled:
+                _CACHE = ResponseCache(max_bytes=config.cache_max_bytes, default_ttl=config.cache_ttl)
+            _CACHE_RESOLVED = True
+        return _CACHE
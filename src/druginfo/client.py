@@ -1,49 +1,724 @@
-from typing import Any, Dict, Optional
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from typing import Any, Callable, Dict, NamedTuple, Optional, Set, Tuple
+import asyncio
+import logging
 import os
+import threading
+import time
 
+import httpx
 import requests
 
+from src.auth.token import get_token_store
+from src.utils.config import Config, api_base_url
+from src.utils.deadline import current_deadline, no_deadline
+from src.utils.http import get_async_client, get_session
+from src.utils.warmer import get_warmer
+
+from .cache import canonical_key, get_response_cache
+from .disk_cache import DiskEntry, get_disk_cache
+from .freshness import FreshnessPolicy, policy_for
+from .hedging import LatencyTracker, ahedged_call, hedged_call
+from .limits import ENDPOINT_FAMILIES, Bulkhead, TokenBucket, adaptive_stats
+from .page_cache import PAGED_ENDPOINTS, PageIndex, slice_window, window_of
+from .refresh_ahead import RefreshAheadScheduler
+from .resilience import RETRYABLE_STATUS, CircuitBreaker, breaker_for, breaker_stats, retry_policy
+from .singleflight import AsyncSingleFlight, SingleFlight
+
+
+logger = logging.getLogger(__name__)
+
 
 class DrugInfoError(RuntimeError):
-    pass
+    """업스트림 호출 실패. status_code 는 HTTP 응답이 있었던 경우의 상태 코드 (네트워크 오류는 None)."""
+
+    def __init__(self, message: str = "", status_code: Optional[int] = None):
+        super().__init__(message)
+        self.status_code = status_code
 
 
 class UnauthorizedError(DrugInfoError):
-    pass
+    """401 응답. generation 은 거절된 요청이 사용한 토큰 세대 (TokenStore.reauthenticate 에 전달)."""
+
+    def __init__(self, message: str = "", status_code: Optional[int] = 401, generation: Optional[int] = None):
+        super().__init__(message, status_code)
+        self.generation = generation
+
+
+class CircuitOpenError(DrugInfoError):
+    """엔드포인트의 연속 실패로 서킷 브레이커가 열려 요청을 즉시 거절한 경우."""
+
+
+class DeadlineExceededError(DrugInfoError):
+    """호출 전체 마감 시간(src.utils.deadline) 안에 응답을 받지 못한 경우."""
+
+
+class _Request(NamedTuple):
+    """엔드포인트 이름, 경로, 쿼리 파라미터로 구성된 GET 요청 명세."""
+
+    endpoint: str
+    path: str
+    params: Dict[str, Any]
+
+
+# 동시에 들어온 동일 요청(캐시 키 기준)은 업스트림 호출 1회를 공유
+_SINGLE_FLIGHT = SingleFlight()
+_ASYNC_SINGLE_FLIGHT = AsyncSingleFlight()
+
+# False 이면 freshness.POLICIES 대신 EDB_CACHE_TTL 하나로 모든 엔드포인트 캐시
+_CACHE_POLICIES_ENABLED = Config().cache_policies_enabled
+
+# stale-while-revalidate 백그라운드 갱신 상태
+_REFRESH_EXECUTOR = ThreadPoolExecutor(max_workers=2, thread_name_prefix="druginfo-refresh")
+_REFRESHING: Set[str] = set()
+_REFRESHING_LOCK = threading.Lock()
+_BACKGROUND_TASKS: "Set[asyncio.Task[None]]" = set()
+
+# 목록 엔드포인트의 캐시된 페이지 윈도우 (작은/오프셋 윈도우를 큰 윈도우에서 잘라 응답)
+_PAGE_INDEX = PageIndex()
 
 
 def _base_url() -> str:
-    base = (os.getenv("EDB_BASE_URL") or "").rstrip("/")
-    if not base:
-        login_url = os.getenv("EDB_LOGIN_URL") or ""
-        if not login_url:
-            raise DrugInfoError("EDB_BASE_URL 또는 EDB_LOGIN_URL 환경변수가 필요합니다")
-        if "://" in login_url:
-            scheme, rest = login_url.split("://", 1)
-            host = rest.split("/", 1)[0]
-            base = f"{scheme}://{host}"
+    base = api_base_url()
+    if not base and not os.getenv("EDB_LOGIN_URL"):
+        raise DrugInfoError("EDB_BASE_URL 또는 EDB_LOGIN_URL 환경변수가 필요합니다")
     return base
 
 
-def _headers() -> Dict[str, str]:
-    headers: Dict[str, str] = {"accept": "application/json"}
-    tok = os.getenv("EDB_TOKEN")
-    if tok:
-        headers["Authorization"] = f"Bearer {tok}"
-    return headers
+_ACCEPT = {"accept": "application/json"}
+# (토큰 세대, 그 세대의 요청 헤더): 토큰이 바뀔 때만 다시 만듦
+_HEADERS: Tuple[int, Dict[str, str]] = (-1, _ACCEPT)
+
+
+def _headers() -> Tuple[int, Dict[str, str]]:
+    """현재 토큰 세대와 미리 만들어 둔 요청 헤더. 반환된 dict 는 공유되므로 수정하지 않습니다."""
+    global _HEADERS
+    generation, auth = get_token_store().snapshot()
+    cached = _HEADERS
+    if cached[0] != generation:
+        cached = (generation, {**_ACCEPT, **auth})
+        _HEADERS = cached
+    return cached
+
+
+class _CacheProbe(NamedTuple):
+    url: str
+    key: str
+    data: Optional[Dict[str, Any]]
+    # 조건부 재검증(ETag / Last-Modified)에 사용할 디스크 항목
+    stale: Optional[DiskEntry]
+    # 이번 응답을 저장할 때 적용할 TTL 과 엔드포인트 신선도 정책
+    ttl: float = 0.0
+    policy: Optional[FreshnessPolicy] = None
+    # data 가 stale-while-revalidate 구간의 값이라 백그라운드 갱신이 필요한지 여부
+    revalidate: bool = False
+
+
+# negative cache 항목 표식: {_NEGATIVE: "오류 메시지"}
+_NEGATIVE = "__druginfo_negative__"
+
+
+def _policy_for(endpoint: str, default_ttl: float) -> FreshnessPolicy:
+    if not _CACHE_POLICIES_ENABLED:
+        return FreshnessPolicy(ttl=default_ttl)
+    return policy_for(endpoint, default_ttl)
+
+
+def _cache_lookup(req: _Request, use_cache: bool) -> _CacheProbe:
+    """
+    메모리 캐시 → 디스크 캐시 순으로 조회합니다.
+
+    - 신선한 항목: 그대로 반환 (디스크 항목은 메모리로 승격)
+    - stale-while-revalidate 구간의 항목: 값을 반환하되 revalidate=True 로 표시
+    - 그 밖의 만료 항목: ETag / Last-Modified 가 있으면 조건부 재검증용으로 반환
+    - negative cache 항목: 저장된 오류를 DrugInfoError 로 다시 발생
+    """
+    probe, need_disk = _memory_lookup(req, use_cache)
+    if not need_disk:
+        return probe
+    disk = get_disk_cache()
+    return _with_disk_entry(req, probe, disk.get(probe.key) if disk is not None else None)
+
+
+async def _acache_lookup(req: _Request, use_cache: bool) -> _CacheProbe:
+    """_cache_lookup 의 asyncio 버전. 디스크 캐시(SQLite/zlib/락)는 스레드에서 읽어 이벤트 루프를 막지 않습니다."""
+    probe, need_disk = _memory_lookup(req, use_cache)
+    if not need_disk:
+        return probe
+    disk = get_disk_cache()
+    return _with_disk_entry(req, probe, await asyncio.to_thread(disk.get, probe.key) if disk is not None else None)
+
+
+def _memory_lookup(req: _Request, use_cache: bool) -> Tuple[_CacheProbe, bool]:
+    """메모리 캐시만 조회합니다. (probe, _with_disk_entry 로 디스크 항목을 더 반영해야 하는지)."""
+    url = f"{_base_url()}{req.path}"
+    key = canonical_key(url, req.params)
+    cache = get_response_cache()
+    if cache is None:
+        return _CacheProbe(url, key, None, None), False
+    policy = _policy_for(req.endpoint, cache.default_ttl)
+    ttl = policy.expires_in()
+    if not use_cache:
+        return _CacheProbe(url, key, None, None, ttl, policy), False
+    found = cache.lookup(key)
+    if found is None:
+        return _CacheProbe(url, key, None, None, ttl, policy), True
+    data, stale = found
+    if _NEGATIVE in data:
+        raise DrugInfoError(data[_NEGATIVE], 404)
+    if not stale:
+        return _CacheProbe(url, key, data, None, ttl, policy), False
+    # stale 구간: 값은 메모리의 것을 쓰고, 조건부 재검증용 검증자만 디스크에서
+    return _CacheProbe(url, key, data, None, ttl, policy, revalidate=True), True
+
+
+def _with_disk_entry(req: _Request, probe: _CacheProbe, entry: Optional[DiskEntry]) -> _CacheProbe:
+    """_memory_lookup 결과에 디스크 항목을 반영합니다."""
+    if probe.revalidate:
+        return probe._replace(stale=_validators(entry))
+    cache = get_response_cache()
+    policy = probe.policy or FreshnessPolicy(ttl=probe.ttl)
+    if entry is None:
+        return probe._replace(data=_subsume(req, probe.url, cache))
+    now = time.time()
+    if entry.fresh:
+        cache.set(probe.key, entry.data, ttl=entry.expires_at - now, stale_ttl=policy.stale_while_revalidate)
+        _remember_window(req, probe.url, probe.key)
+        return probe._replace(data=entry.data)
+    if entry.expires_at + policy.stale_while_revalidate > now:
+        return probe._replace(data=entry.data, stale=_validators(entry), revalidate=True)
+    return probe._replace(data=_subsume(req, probe.url, cache), stale=_validators(entry))
+
+
+def _remember_window(req: _Request, url: str, key: str) -> None:
+    if req.endpoint in PAGED_ENDPOINTS:
+        window = window_of(url, req.params)
+        if window is not None:
+            _PAGE_INDEX.register(key, window)
+
+
+def _subsume(req: _Request, url: str, cache: Any) -> Optional[Dict[str, Any]]:
+    """
+    같은 필터/SortBy 의 신선한 캐시 윈도우가 요청한 페이지를 포함하면 그 items 를 잘라 반환합니다.
+    만료되었거나 축출된 윈도우는 인덱스에서 제거합니다.
+    """
+    if req.endpoint not in PAGED_ENDPOINTS:
+        return None
+    wanted = window_of(url, req.params)
+    if wanted is None:
+        return None
+    for cached_key, cached in _PAGE_INDEX.candidates(wanted.filter_key):
+        data = cache.get(cached_key)
+        if data is None:
+            _PAGE_INDEX.discard(wanted.filter_key, cached_key)
+            continue
+        sliced = slice_window(data, cached, wanted)
+        if sliced is not None:
+            return sliced
+    return None
+
+
+def _validators(entry: Optional[DiskEntry]) -> Optional[DiskEntry]:
+    if entry is not None and (entry.etag or entry.last_modified):
+        return entry
+    return None
+
+
+def _is_empty_result(data: Dict[str, Any]) -> bool:
+    section = data.get("data", data)
+    if section in (None, "", [], {}):
+        return True
+    if isinstance(section, dict):
+        for key in ("items", "list", "results", "rows"):
+            if section.get(key) == []:
+                return True
+    return False
+
+
+def _request_headers(probe: _CacheProbe) -> Tuple[int, Dict[str, str]]:
+    generation, headers = _headers()
+    if probe.stale is not None:
+        headers = dict(headers)
+        if probe.stale.etag:
+            headers["If-None-Match"] = probe.stale.etag
+        if probe.stale.last_modified:
+            headers["If-Modified-Since"] = probe.stale.last_modified
+    return generation, headers
+
+
+def _finish(req: _Request, probe: _CacheProbe, resp: Any) -> Dict[str, Any]:
+    data, disk_write = _settle(req, probe, resp)
+    if disk_write is not None:
+        disk_write()
+    return data
+
+
+async def _afinish(req: _Request, probe: _CacheProbe, resp: Any) -> Dict[str, Any]:
+    """_finish 의 asyncio 버전. 디스크 캐시 기록(압축/SQLite)은 스레드에서 수행합니다."""
+    data, disk_write = _settle(req, probe, resp)
+    if disk_write is not None:
+        await asyncio.to_thread(disk_write)
+    return data
+
+
+def _settle(req: _Request, probe: _CacheProbe, resp: Any) -> Tuple[Dict[str, Any], Optional[Callable[[], None]]]:
+    """
+    응답을 처리하고 메모리 캐시에 반영합니다. 디스크 캐시에 기록할 작업이 있으면 함께 반환합니다.
+
+    304 이면 보관 중인 본문을 재사용하고, 정책에 negative_ttl 이 있으면
+    404 오류와 빈 결과는 그 시간 동안만 (메모리에) 캐시합니다.
+    """
+    cache = get_response_cache()
+    disk = get_disk_cache()
+    policy = probe.policy or FreshnessPolicy(ttl=probe.ttl)
+    if resp.status_code == 304 and probe.stale is not None:
+        data = probe.stale.data
+        if cache is not None:
+            cache.set(probe.key, data, ttl=probe.ttl, stale_ttl=policy.stale_while_revalidate)
+            if disk is not None:
+                return data, partial(disk.touch, probe.key, probe.ttl)
+        return data, None
+    try:
+        data = _handle_response(resp)
+    except DrugInfoError as e:
+        if resp.status_code == 404:
+            _untrack(probe.key)
+            if cache is not None and policy.negative_ttl > 0:
+                cache.set(probe.key, {_NEGATIVE: str(e)}, ttl=policy.negative_ttl)
+        raise
+    empty = _is_empty_result(data)
+    if empty:
+        _untrack(probe.key)
+    if cache is None:
+        return data, None
+    if policy.negative_ttl > 0 and empty:
+        cache.set(probe.key, data, ttl=min(probe.ttl, policy.negative_ttl))
+        return data, None
+    cache.set(probe.key, data, ttl=probe.ttl, stale_ttl=policy.stale_while_revalidate)
+    _remember_window(req, probe.url, probe.key)
+    if disk is None:
+        return data, None
+    return data, partial(
+        disk.set,
+        probe.key,
+        data,
+        probe.ttl,
+        etag=resp.headers.get("ETag"),
+        last_modified=resp.headers.get("Last-Modified"),
+    )
+
+
+# 단건 상세 조회는 P90 지연을 넘기면 같은 요청을 한 번 더 보냄 (EDB_HEDGE)
+_HEDGED_ENDPOINTS = frozenset(
+    {
+        "get_product_by_code",
+        "get_main_ingredient_by_code",
+        "get_main_ingredient_drug_effect_by_id",
+        "get_main_ingredient_picto_by_code",
+    }
+)
+_LATENCY = LatencyTracker()
+_HEDGE_ENABLED = Config().hedge_enabled
+_HEDGE_MIN_DELAY = Config().hedge_min_delay
+_HEDGE_EXECUTOR = ThreadPoolExecutor(max_workers=8, thread_name_prefix="druginfo-hedge")
 
 
-def _handle_response(resp: requests.Response) -> Dict[str, Any]:
+def _hedge_delay(req: _Request, timeout: float) -> Optional[float]:
+    """관측 지연 P90 기반 hedge 지연. 비활성화 / 표본 부족 / 타임아웃 초과면 None."""
+    if not _HEDGE_ENABLED or req.endpoint not in _HEDGED_ENDPOINTS:
+        return None
+    p90 = _LATENCY.percentile(req.endpoint, 0.9)
+    if p90 is None:
+        return None
+    delay = max(p90, _HEDGE_MIN_DELAY)
+    return delay if delay < timeout else None
+
+
+def _make_limits() -> Tuple[TokenBucket, Dict[str, Bulkhead]]:
+    config = Config()
+    bulkheads = {
+        "list": Bulkhead("list", config.bulkhead_list),
+        "detail": Bulkhead("detail", config.bulkhead_detail),
+        "same_ingredient": Bulkhead("same_ingredient", config.bulkhead_same_ingredient),
+        "reference": Bulkhead("reference", config.bulkhead_reference),
+    }
+    return TokenBucket(config.rate_limit, config.rate_burst), bulkheads
+
+
+# 전역 rate limit + 계열별 bulkhead: 목록 대량 페이징이 단건 상세 조회를 굶기지 않도록 분리
+_RATE_LIMITER, _BULKHEADS = _make_limits()
+
+
+def _bulkhead(req: _Request) -> Bulkhead:
+    return _BULKHEADS[ENDPOINT_FAMILIES.get(req.endpoint, "reference")]
+
+
+def _get(req: _Request, probe: _CacheProbe, headers: Dict[str, str], timeout: float) -> Any:
+    bulkhead = _bulkhead(req)
+    if not bulkhead.acquire(_wait_budget(req)):
+        raise DeadlineExceededError(f"{req.endpoint} 요청이 동시 요청 슬롯을 기다리다 마감 시간을 초과했습니다")
+    try:
+        if not _RATE_LIMITER.acquire(_wait_budget(req)):
+            raise DeadlineExceededError(f"{req.endpoint} 요청이 호출 한도를 기다리다 마감 시간을 초과했습니다")
+        # 대기한 만큼 줄어든 남은 시간으로 소켓 타임아웃을 다시 계산
+        timeout = _attempt_timeout(req, timeout)
+        started = time.monotonic()
+        resp = get_session().get(
+            probe.url, headers=headers, params=req.params or None, timeout=timeout
+        )
+    finally:
+        bulkhead.release()
+    if resp.status_code not in RETRYABLE_STATUS:
+        _LATENCY.record(req.endpoint, time.monotonic() - started)
+    return resp
+
+
+async def _aget(req: _Request, probe: _CacheProbe, headers: Dict[str, str], timeout: float) -> Any:
+    bulkhead = _bulkhead(req)
+    if not await bulkhead.aacquire(_wait_budget(req)):
+        raise DeadlineExceededError(f"{req.endpoint} 요청이 동시 요청 슬롯을 기다리다 마감 시간을 초과했습니다")
+    try:
+        if not await _RATE_LIMITER.aacquire(_wait_budget(req)):
+            raise DeadlineExceededError(f"{req.endpoint} 요청이 호출 한도를 기다리다 마감 시간을 초과했습니다")
+        timeout = _attempt_timeout(req, timeout)
+        started = time.monotonic()
+        resp = await get_async_client().get(
+            probe.url, headers=headers, params=req.params or None, timeout=timeout
+        )
+    finally:
+        bulkhead.release()
+    if resp.status_code not in RETRYABLE_STATUS:
+        _LATENCY.record(req.endpoint, time.monotonic() - started)
+    return resp
+
+
+def _hedge_accepts(resp: Any) -> bool:
+    """hedge 승자로 인정할 응답. 재시도 대상 5xx 이면 다른 쪽의 응답을 기다립니다."""
+    return resp.status_code not in RETRYABLE_STATUS
+
+
+def _get_once(req: _Request, probe: _CacheProbe, headers: Dict[str, str], timeout: float) -> Any:
+    delay = _hedge_delay(req, timeout)
+    if delay is None:
+        return _get(req, probe, headers, timeout)
+    # 늦은 쪽 스레드는 취소되지 않고 슬롯/토큰을 계속 쓰므로, bulkhead 에 여유가 있을 때만 hedge
+    return hedged_call(
+        lambda: _get(req, probe, headers, timeout),
+        delay,
+        _HEDGE_EXECUTOR,
+        accept=_hedge_accepts,
+        allow=_bulkhead(req).has_capacity,
+    )
+
+
+async def _aget_once(req: _Request, probe: _CacheProbe, headers: Dict[str, str], timeout: float) -> Any:
+    delay = _hedge_delay(req, timeout)
+    if delay is None:
+        return await _aget(req, probe, headers, timeout)
+    return await ahedged_call(
+        lambda: _aget(req, probe, headers, timeout), delay, accept=_hedge_accepts, allow=_bulkhead(req).has_capacity
+    )
+
+
+def _check_circuit(req: _Request, breaker: CircuitBreaker) -> None:
+    if not breaker.allow():
+        raise CircuitOpenError(
+            f"EDB API 장애로 {req.endpoint} 요청을 일시 차단 중입니다 ({breaker.retry_in():.0f}초 후 재시도)"
+        )
+
+
+def _attempt_timeout(req: _Request, timeout: float) -> float:
+    """이번 시도의 소켓 타임아웃. 마감 시간이 있으면 남은 시간으로 줄입니다."""
+    deadline = current_deadline()
+    if deadline is None:
+        return timeout
+    remaining = deadline.remaining()
+    if remaining <= 0:
+        raise DeadlineExceededError(f"{req.endpoint} 요청 마감 시간을 초과했습니다")
+    return min(float(timeout), remaining)
+
+
+def _wait_budget(req: _Request) -> Optional[float]:
+    """bulkhead/호출 한도 대기에 쓸 수 있는 시간. 마감 시간이 없으면 None(무제한)."""
+    deadline = current_deadline()
+    if deadline is None:
+        return None
+    remaining = deadline.remaining()
+    if remaining <= 0:
+        raise DeadlineExceededError(f"{req.endpoint} 요청 마감 시간을 초과했습니다")
+    return remaining
+
+
+def _retry_delay(req: _Request, attempt: int, retry_after: Optional[str] = None) -> Optional[float]:
+    """
+    재시도 전 대기 시간. 재시도 횟수를 다 썼거나, 마감까지 남은 시간이
+    대기 + 관측 P50 응답 시간보다 짧아 재시도가 끝나지 못할 것 같으면 None.
+    """
+    policy = retry_policy()
+    if attempt >= policy.retries:
+        return None
+    delay = policy.delay(attempt, retry_after)
+    deadline = current_deadline()
+    if deadline is not None:
+        expected = _LATENCY.percentile(req.endpoint, 0.5) or 0.0
+        if deadline.remaining() <= delay + expected:
+            return None
+    return delay
+
+
+def _network_error(req: _Request, e: Exception) -> DrugInfoError:
+    deadline = current_deadline()
+    if deadline is not None and deadline.expired:
+        return DeadlineExceededError(f"{req.endpoint} 요청 마감 시간을 초과했습니다: {e}")
+    return DrugInfoError(f"요청 실패: 네트워크 오류 {e!r}")
+
+
+def _fetch(req: _Request, probe: _CacheProbe, timeout: int) -> Dict[str, Any]:
+    """
+    5xx / 커넥션 오류 / 타임아웃은 백오프 후 재시도하고, 결과를 서킷 브레이커에 반영합니다.
+    각 시도의 타임아웃과 재시도 여부는 현재 마감 시간의 남은 시간으로 결정합니다.
+    """
+    breaker = breaker_for(req.endpoint)
+    attempt = 0
+    while True:
+        _check_circuit(req, breaker)
+        try:
+            generation, headers = _request_headers(probe)
+            resp = _get_once(req, probe, headers, _attempt_timeout(req, timeout))
+        except (requests.ConnectionError, requests.Timeout) as e:
+            breaker.record_failure()
+            delay = _retry_delay(req, attempt)
+            if delay is None:
+                raise _network_error(req, e) from e
+            time.sleep(delay)
+            attempt += 1
+            continue
+        if resp.status_code in RETRYABLE_STATUS:
+            breaker.record_failure()
+            delay = _retry_delay(req, attempt, resp.headers.get("Retry-After"))
+            if delay is not None:
+                logger.debug(f"{req.endpoint} {resp.status_code} 응답, {delay:.2f}초 후 재시도 ({attempt + 1})")
+                time.sleep(delay)
+                attempt += 1
+                continue
+        else:
+            breaker.record_success()
+        if resp.status_code == 401:
+            raise UnauthorizedError("인증 실패(401)", generation=generation)
+        return _finish(req, probe, resp)
+
+
+async def _afetch(req: _Request, probe: _CacheProbe, timeout: int) -> Dict[str, Any]:
+    breaker = breaker_for(req.endpoint)
+    attempt = 0
+    while True:
+        _check_circuit(req, breaker)
+        try:
+            generation, headers = _request_headers(probe)
+            resp = await _aget_once(req, probe, headers, _attempt_timeout(req, timeout))
+        except httpx.TransportError as e:
+            breaker.record_failure()
+            delay = _retry_delay(req, attempt)
+            if delay is None:
+                raise _network_error(req, e) from e
+            await asyncio.sleep(delay)
+            attempt += 1
+            continue
+        if resp.status_code in RETRYABLE_STATUS:
+            breaker.record_failure()
+            delay = _retry_delay(req, attempt, resp.headers.get("Retry-After"))
+            if delay is not None:
+                logger.debug(f"{req.endpoint} {resp.status_code} 응답, {delay:.2f}초 후 재시도 ({attempt + 1})")
+                await asyncio.sleep(delay)
+                attempt += 1
+                continue
+        else:
+            breaker.record_success()
+        if resp.status_code == 401:
+            raise UnauthorizedError("인증 실패(401)", generation=generation)
+        return await _afinish(req, probe, resp)
+
+
+def _begin_refresh(key: str) -> bool:
+    with _REFRESHING_LOCK:
+        if key in _REFRESHING:
+            return False
+        _REFRESHING.add(key)
+        return True
+
+
+def _end_refresh(key: str) -> None:
+    with _REFRESHING_LOCK:
+        _REFRESHING.discard(key)
+
+
+def _schedule_refresh(req: _Request, probe: _CacheProbe, timeout: int) -> None:
+    """stale 값을 반환한 뒤 백그라운드 스레드에서 갱신합니다 (키당 1개)."""
+    if not _begin_refresh(probe.key):
+        return
+    refresh_probe = probe._replace(data=None, revalidate=False)
+
+    def _run() -> None:
+        try:
+            _SINGLE_FLIGHT.do(probe.key, lambda: _fetch(req, refresh_probe, timeout))
+        except Exception as e:
+            logger.debug(f"백그라운드 갱신 실패: {probe.key}: {e}")
+        finally:
+            _end_refresh(probe.key)
+
+    _REFRESH_EXECUTOR.submit(_run)
+
+
+def _schedule_arefresh(req: _Request, probe: _CacheProbe, timeout: int) -> None:
+    """stale 값을 반환한 뒤 같은 이벤트 루프의 백그라운드 태스크로 갱신합니다 (키당 1개)."""
+    if not _begin_refresh(probe.key):
+        return
+    refresh_probe = probe._replace(data=None, revalidate=False)
+
+    async def _run() -> None:
+        try:
+            # 태스크는 호출자의 컨텍스트를 복사하므로 호출자의 마감 시간에서 분리
+            with no_deadline():
+                await _ASYNC_SINGLE_FLIGHT.do(probe.key, lambda: _afetch(req, refresh_probe, timeout))
+        except Exception as e:
+            logger.debug(f"백그라운드 갱신 실패: {probe.key}: {e}")
+        finally:
+            _end_refresh(probe.key)
+
+    task = asyncio.get_running_loop().create_task(_run())
+    _BACKGROUND_TASKS.add(task)
+    task.add_done_callback(_BACKGROUND_TASKS.discard)
+
+
+# 조회 빈도를 추적해 만료 전에 미리 갱신하는 엔드포인트 (사용자 조회가 업스트림 지연을 겪지 않도록)
+_REFRESH_AHEAD_ENDPOINTS = frozenset(
+    {"get_product_by_code", "get_main_ingredient_by_code", "list_product_edicode_same_ingredient"}
+)
+
+
+def _refresh_ahead(key: str, payload: Any) -> None:
+    """refresh-ahead 스케줄러 스레드에서 호출됩니다. 디스크 항목의 ETag 로 조건부 재검증합니다."""
+    req, timeout = payload
+    if not _begin_refresh(key):
+        return
+    try:
+        probe = _cache_lookup(req, use_cache=False)
+        disk = get_disk_cache()
+        if disk is not None:
+            probe = probe._replace(stale=_validators(disk.get(key)))
+        _SINGLE_FLIGHT.do(key, lambda: _fetch(req, probe, timeout))
+    finally:
+        _end_refresh(key)
+
+
+def _make_refresh_ahead() -> Optional[RefreshAheadScheduler]:
+    config = Config()
+    cache = get_response_cache()
+    if cache is None or not config.refresh_ahead_enabled:
+        return None
+    return RefreshAheadScheduler(
+        _refresh_ahead,
+        cache.expires_in,
+        top=config.refresh_ahead_top,
+        lead=config.refresh_ahead_lead,
+        budget=config.refresh_ahead_budget,
+    )
+
+
+_REFRESH_AHEAD = _make_refresh_ahead()
+
+
+def _track(req: _Request, probe: _CacheProbe, timeout: int) -> None:
+    if _REFRESH_AHEAD is None or req.endpoint not in _REFRESH_AHEAD_ENDPOINTS or probe.policy is None:
+        return
+    # 빈 결과는 negative_ttl 이 짧아 항상 만료 임박으로 보이므로 미리 갱신하지 않음
+    if probe.data is not None and _is_empty_result(probe.data):
+        return
+    _REFRESH_AHEAD.record(probe.key, (req, timeout))
+
+
+def _untrack(key: str) -> None:
+    """404 나 빈 결과가 된 키는 refresh-ahead 대상에서 뺍니다 (없는 코드를 계속 다시 받지 않도록)."""
+    if _REFRESH_AHEAD is not None:
+        _REFRESH_AHEAD.forget(key)
+
+
+def client_stats() -> Dict[str, Any]:
+    """캐시 / 부하 제어 / 장애 대응 상태 스냅샷 (대기열 길이 포함)."""
+    cache = get_response_cache()
+    disk = get_disk_cache()
+    warmer = get_warmer()
+    return {
+        "cache": cache.stats() if cache is not None else None,
+        "diskCache": disk.stats() if disk is not None else None,
+        "refreshAhead": _REFRESH_AHEAD.stats() if _REFRESH_AHEAD is not None else None,
+        "rateLimiter": _RATE_LIMITER.stats(),
+        "bulkheads": {name: bulkhead.stats() for name, bulkhead in _BULKHEADS.items()},
+        "fanout": adaptive_stats(),
+        "circuitBreakers": breaker_stats(),
+        "latency": _LATENCY.stats(),
+        "inFlight": _SINGLE_FLIGHT.in_flight() + _ASYNC_SINGLE_FLIGHT.in_flight(),
+        "connectionWarmer": warmer.stats() if warmer is not None else None,
+    }
+
+
+def _send(req: _Request, timeout: int = 15, use_cache: bool = True) -> Dict[str, Any]:
+    """
+    요청을 전송합니다. use_cache=False 이면 캐시 조회를 건너뛰고 업스트림에서 새로 받아
+    캐시를 갱신합니다. 동일한 요청이 동시에 진행 중이면 그 결과를 함께 받습니다.
+    """
+    probe = _cache_lookup(req, use_cache)
+    _track(req, probe, timeout)
+    if probe.data is not None:
+        if probe.revalidate:
+            _schedule_refresh(req, probe, timeout)
+        return probe.data
+    return _SINGLE_FLIGHT.do(probe.key, lambda: _fetch(req, probe, timeout))
+
+
+async def _asend(req: _Request, timeout: int = 15, use_cache: bool = True) -> Dict[str, Any]:
+    probe = await _acache_lookup(req, use_cache)
+    _track(req, probe, timeout)
+    if probe.data is not None:
+        if probe.revalidate:
+            _schedule_arefresh(req, probe, timeout)
+        return probe.data
+    return await _ASYNC_SINGLE_FLIGHT.do(probe.key, lambda: _afetch(req, probe, timeout))
+
+
+def _cached(req: _Request, timeout: int = 15, in_loop: bool = False) -> Optional[Dict[str, Any]]:
+    """
+    업스트림 호출 없이 캐시에서만 응답을 찾습니다 (stale-while-revalidate 구간이면 갱신 예약).
+    없으면 None, negative cache 항목이면 DrugInfoError. in_loop 는 이벤트 루프 안에서 호출하는지 여부로,
+    이때는 루프를 막지 않도록 메모리 캐시만 보고 디스크 조회는 이후 _asend 에 맡깁니다.
+    """
+    if in_loop:
+        probe, need_disk = _memory_lookup(req, True)
+        if need_disk:
+            probe = _with_disk_entry(req, probe, None)
+    else:
+        probe = _cache_lookup(req, True)
+    if probe.data is None:
+        return None
+    _track(req, probe, timeout)
+    if probe.revalidate:
+        (_schedule_arefresh if in_loop else _schedule_refresh)(req, probe, timeout)
+    return probe.data
+
+
+def _handle_response(resp: Any) -> Dict[str, Any]:
+    """requests.Response / httpx.Response 모두 동일하게 처리합니다."""
     if resp.status_code == 401:
         raise UnauthorizedError("인증 실패(401)")
     try:
         resp.raise_for_status()
-    except requests.HTTPError as e:
+    except (requests.HTTPError, httpx.HTTPStatusError) as e:
         try:
             data = resp.json()
         except Exception:
             data = {"text": resp.text}
-        raise DrugInfoError(f"요청 실패: {resp.status_code} {data}") from e
+        raise DrugInfoError(f"요청 실패: {resp.status_code} {data}", resp.status_code) from e
     try:
         data = resp.json()
     except Exception:
@@ -53,7 +728,9 @@ def _handle_response(resp: requests.Response) -> Dict[str, Any]:
     return {"data": data}
 
 
-def list_main_ingredient(
+# --- Request builders (param mapping) ---
+
+def _list_main_ingredient_request(
     a4: Optional[bool] = None,
     a4Off: Optional[bool] = None,
     a5: Optional[bool] = None,
@@ -73,10 +750,7 @@ def list_main_ingredient(
     q: Optional[str] = None,
     page: Optional[int] = None,
     size: Optional[int] = None,
-    timeout: int = 15,
-) -> Dict[str, Any]:
-    base = _base_url()
-    url = f"{base}/v1/druginfo/main-ingredient"
+) -> _Request:
     params: Dict[str, Any] = {}
     def _set(name: str, value: Any) -> None:
         if value is None:
@@ -98,20 +772,16 @@ def list_main_ingredient(
         params["Page"] = int(page)
     if size is not None and "PageSize" not in params:
         params["PageSize"] = int(size)
-    resp = requests.get(url, headers=_headers(), params=params, timeout=timeout)
-    return _handle_response(resp)
+    return _Request("list_main_ingredient", "/v1/druginfo/main-ingredient", params)
 
 
-def get_main_ingredient_by_code(code: str, timeout: int = 15) -> Dict[str, Any]:
+def _get_main_ingredient_by_code_request(code: str) -> _Request:
     if not code:
         raise DrugInfoError("code 가 필요합니다")
-    base = _base_url()
-    url = f"{base}/v1/druginfo/main-ingredient/{code}"
-    resp = requests.get(url, headers=_headers(), timeout=timeout)
-    return _handle_response(resp)
+    return _Request("get_main_ingredient_by_code", f"/v1/druginfo/main-ingredient/{code}", {})
 
 
-def list_product(
+def _list_product_request(
     crop: Optional[bool] = None,
     cropOff: Optional[bool] = None,
     base64: Optional[bool] = None,
@@ -135,10 +805,7 @@ def list_product(
     q: Optional[str] = None,
     page: Optional[int] = None,
     size: Optional[int] = None,
-    timeout: int = 15,
-) -> Dict[str, Any]:
-    base = _base_url()
-    url = f"{base}/v1/druginfo/product"
+) -> _Request:
     params: Dict[str, Any] = {}
     def _set(name: str, value: Any) -> None:
         if value is None:
@@ -161,35 +828,16 @@ def list_product(
         params["Page"] = int(page)
     if size is not None and "PageSize" not in params:
         params["PageSize"] = int(size)
-    resp = requests.get(url, headers=_headers(), params=params, timeout=timeout)
-    return _handle_response(resp)
+    return _Request("list_product", "/v1/druginfo/product", params)
 
 
-def get_product_by_code(code: str, timeout: int = 15) -> Dict[str, Any]:
-    """
-    제품 코드로 제품 상세 정보를 조회합니다.
-
-    참고: 응답의 data.korange 필드는 생물학적 동등성(생동) 관련 정보입니다.
-    """
+def _get_product_by_code_request(code: str) -> _Request:
     if not code:
         raise DrugInfoError("code 가 필요합니다")
-    base = _base_url()
-    url = f"{base}/v1/druginfo/product/{code}"
-    resp = requests.get(url, headers=_headers(), timeout=timeout)
-    return _handle_response(resp)
+    return _Request("get_product_by_code", f"/v1/druginfo/product/{code}", {})
 
 
-# --- Additional endpoints ---
-
-def list_main_ingredient_drug_effect(
-    edit: Optional[str] = None,
-    pageSize: Optional[int] = None,
-    page: Optional[int] = None,
-    sortBy: Optional[str] = None,
-    timeout: int = 15,
-) -> Dict[str, Any]:
-    base = _base_url()
-    url = f"{base}/v1/druginfo/main-ingredient/drug-effect"
+def _reference_list_params(edit: Optional[str], pageSize: Optional[int], page: Optional[int], sortBy: Optional[str]) -> Dict[str, Any]:
     params: Dict[str, Any] = {}
     if edit is not None:
         params["edit"] = edit
@@ -199,61 +847,42 @@ def list_main_ingredient_drug_effect(
         params["Page"] = int(page)
     if sortBy is not None:
         params["SortBy"] = sortBy
-    resp = requests.get(url, headers=_headers(), params=params, timeout=timeout)
-    return _handle_response(resp)
+    return params
 
 
-def list_main_ingredient_drug_kind(edit: Optional[str] = None, pageSize: Optional[int] = None, page: Optional[int] = None, sortBy: Optional[str] = None, timeout: int = 15) -> Dict[str, Any]:
-    base = _base_url()
-    url = f"{base}/v1/druginfo/main-ingredient/drug-kind"
-    params: Dict[str, Any] = {}
-    if edit is not None:
-        params["edit"] = edit
-    if pageSize is not None:
-        params["PageSize"] = int(pageSize)
-    if page is not None:
-        params["Page"] = int(page)
-    if sortBy is not None:
-        params["SortBy"] = sortBy
-    resp = requests.get(url, headers=_headers(), params=params, timeout=timeout)
-    return _handle_response(resp)
+def _list_main_ingredient_drug_effect_request(edit: Optional[str] = None, pageSize: Optional[int] = None, page: Optional[int] = None, sortBy: Optional[str] = None) -> _Request:
+    return _Request(
+        "list_main_ingredient_drug_effect",
+        "/v1/druginfo/main-ingredient/drug-effect",
+        _reference_list_params(edit, pageSize, page, sortBy),
+    )
 
 
-def list_main_ingredient_guide_a4(edit: Optional[str] = None, pageSize: Optional[int] = None, page: Optional[int] = None, sortBy: Optional[str] = None, timeout: int = 15) -> Dict[str, Any]:
-    base = _base_url()
-    url = f"{base}/v1/druginfo/main-ingredient/guide-a4"
-    params: Dict[str, Any] = {}
-    if edit is not None:
-        params["edit"] = edit
-    if pageSize is not None:
-        params["PageSize"] = int(pageSize)
-    if page is not None:
-        params["Page"] = int(page)
-    if sortBy is not None:
-        params["SortBy"] = sortBy
-    resp = requests.get(url, headers=_headers(), params=params, timeout=timeout)
-    return _handle_response(resp)
+def _list_main_ingredient_drug_kind_request(edit: Optional[str] = None, pageSize: Optional[int] = None, page: Optional[int] = None, sortBy: Optional[str] = None) -> _Request:
+    return _Request(
+        "list_main_ingredient_drug_kind",
+        "/v1/druginfo/main-ingredient/drug-kind",
+        _reference_list_params(edit, pageSize, page, sortBy),
+    )
 
 
-def list_main_ingredient_guide_a5(edit: Optional[str] = None, pageSize: Optional[int] = None, page: Optional[int] = None, sortBy: Optional[str] = None, timeout: int = 15) -> Dict[str, Any]:
-    base = _base_url()
-    url = f"{base}/v1/druginfo/main-ingredient/guide-A5"
-    params: Dict[str, Any] = {}
-    if edit is not None:
-        params["edit"] = edit
-    if pageSize is not None:
-        params["PageSize"] = int(pageSize)
-    if page is not None:
-        params["Page"] = int(page)
-    if sortBy is not None:
-        params["SortBy"] = sortBy
-    resp = requests.get(url, headers=_headers(), params=params, timeout=timeout)
-    return _handle_response(resp)
+def _list_main_ingredient_guide_a4_request(edit: Optional[str] = None, pageSize: Optional[int] = None, page: Optional[int] = None, sortBy: Optional[str] = None) -> _Request:
+    return _Request(
+        "list_main_ingredient_guide_a4",
+        "/v1/druginfo/main-ingredient/guide-a4",
+        _reference_list_params(edit, pageSize, page, sortBy),
+    )
+
 
+def _list_main_ingredient_guide_a5_request(edit: Optional[str] = None, pageSize: Optional[int] = None, page: Optional[int] = None, sortBy: Optional[str] = None) -> _Request:
+    return _Request(
+        "list_main_ingredient_guide_a5",
+        "/v1/druginfo/main-ingredient/guide-A5",
+        _reference_list_params(edit, pageSize, page, sortBy),
+    )
 
-def list_main_ingredient_picto(IsDeleted: Optional[str] = None, Title: Optional[str] = None, PageSize: Optional[int] = None, Page: Optional[int] = None, SortBy: Optional[str] = None, timeout: int = 15) -> Dict[str, Any]:
-    base = _base_url()
-    url = f"{base}/v1/druginfo/main-ingredient/picto"
+
+def _list_main_ingredient_picto_request(IsDeleted: Optional[str] = None, Title: Optional[str] = None, PageSize: Optional[int] = None, Page: Optional[int] = None, SortBy: Optional[str] = None) -> _Request:
     params: Dict[str, Any] = {}
     if IsDeleted is not None:
         params["IsDeleted"] = IsDeleted
@@ -265,29 +894,24 @@ def list_main_ingredient_picto(IsDeleted: Optional[str] = None, Title: Optional[
         params["Page"] = int(Page)
     if SortBy is not None:
         params["SortBy"] = SortBy
-    resp = requests.get(url, headers=_headers(), params=params, timeout=timeout)
-    return _handle_response(resp)
+    return _Request("list_main_ingredient_picto", "/v1/druginfo/main-ingredient/picto", params)
 
 
-def get_main_ingredient_picto_by_code(code: str, timeout: int = 15) -> Dict[str, Any]:
+def _get_main_ingredient_picto_by_code_request(code: str) -> _Request:
     if not code:
         raise DrugInfoError("code 가 필요합니다")
-    base = _base_url()
-    url = f"{base}/v1/druginfo/main-ingredient/picto/{code}"
-    resp = requests.get(url, headers=_headers(), timeout=timeout)
-    return _handle_response(resp)
+    return _Request("get_main_ingredient_picto_by_code", f"/v1/druginfo/main-ingredient/picto/{code}", {})
 
 
-def get_main_ingredient_drug_effect_by_id(effect_id: int, timeout: int = 15) -> Dict[str, Any]:
-    base = _base_url()
-    url = f"{base}/v1/druginfo/main-ingredient/drug-effect/{int(effect_id)}"
-    resp = requests.get(url, headers=_headers(), timeout=timeout)
-    return _handle_response(resp)
+def _get_main_ingredient_drug_effect_by_id_request(effect_id: int) -> _Request:
+    return _Request(
+        "get_main_ingredient_drug_effect_by_id",
+        f"/v1/druginfo/main-ingredient/drug-effect/{int(effect_id)}",
+        {},
+    )
 
 
-def list_product_edicode(ProductCode: Optional[str] = None, EdiCode: Optional[str] = None, PageSize: Optional[int] = None, Page: Optional[int] = None, SortBy: Optional[str] = None, timeout: int = 15) -> Dict[str, Any]:
-    base = _base_url()
-    url = f"{base}/v1/druginfo/product/edicode"
+def _list_product_edicode_request(ProductCode: Optional[str] = None, EdiCode: Optional[str] = None, PageSize: Optional[int] = None, Page: Optional[int] = None, SortBy: Optional[str] = None) -> _Request:
     params: Dict[str, Any] = {}
     if ProductCode is not None:
         params["ProductCode"] = ProductCode
@@ -299,24 +923,18 @@ def list_product_edicode(ProductCode: Optional[str] = None, EdiCode: Optional[st
         params["Page"] = int(Page)
     if SortBy is not None:
         params["SortBy"] = SortBy
-    resp = requests.get(url, headers=_headers(), params=params, timeout=timeout)
-    return _handle_response(resp)
+    return _Request("list_product_edicode", "/v1/druginfo/product/edicode", params)
 
 
-def list_product_edicode_same_ingredient(
+def _list_product_edicode_same_ingredient_request(
     ProductCode: Optional[str] = None,
     EdiCode: Optional[str] = None,
     MasterIngredientCode: Optional[str] = None,
-    timeout: int = 15,
-) -> Dict[str, Any]:
+) -> _Request:
     """
-    동일 주성분 제품(EDI 코드 기준) 목록을 조회합니다.
-
     Query parameters (Swagger): ediCode, productCode, masterIngredientCode
-    이 함수는 인자명은 PascalCase를 받되, 실제 쿼리는 lowerCamelCase로 전송합니다.
+    인자명은 PascalCase를 받되, 실제 쿼리는 lowerCamelCase로 전송합니다.
     """
-    base = _base_url()
-    url = f"{base}/v1/druginfo/product/edicode/same-ingredient"
     params: Dict[str, Any] = {}
     if EdiCode is not None:
         params["ediCode"] = EdiCode
@@ -324,13 +942,125 @@ def list_product_edicode_same_ingredient(
         params["productCode"] = ProductCode
     if MasterIngredientCode is not None:
         params["masterIngredientCode"] = MasterIngredientCode
-    resp = requests.get(url, headers=_headers(), params=params, timeout=timeout)
-    return _handle_response(resp)
+    return _Request("list_product_edicode_same_ingredient", "/v1/druginfo/product/edicode/same-ingredient", params)
 
 
-# --- (removed) Helpers for non-GET requests ---
+# --- Blocking endpoints ---
+# 인자는 각 _*_request 빌더와 동일합니다. use_cache=False 로 호출별 캐시 우회.
 
+def list_main_ingredient(*args: Any, timeout: int = 15, use_cache: bool = True, **kwargs: Any) -> Dict[str, Any]:
+    return _send(_list_main_ingredient_request(*args, **kwargs), timeout, use_cache)
+
+
+def get_main_ingredient_by_code(code: str, timeout: int = 15, use_cache: bool = True) -> Dict[str, Any]:
+    return _send(_get_main_ingredient_by_code_request(code), timeout, use_cache)
+
+
+def list_product(*args: Any, timeout: int = 15, use_cache: bool = True, **kwargs: Any) -> Dict[str, Any]:
+    return _send(_list_product_request(*args, **kwargs), timeout, use_cache)
+
+
+def get_product_by_code(code: str, timeout: int = 15, use_cache: bool = True) -> Dict[str, Any]:
+    """
+    제품 코드로 제품 상세 정보를 조회합니다.
+
+    참고: 응답의 data.korange 필드는 생물학적 동등성(생동) 관련 정보입니다.
+    """
+    return _send(_get_product_by_code_request(code), timeout, use_cache)
+
+
+def list_main_ingredient_drug_effect(*args: Any, timeout: int = 15, use_cache: bool = True, **kwargs: Any) -> Dict[str, Any]:
+    return _send(_list_main_ingredient_drug_effect_request(*args, **kwargs), timeout, use_cache)
+
+
+def list_main_ingredient_drug_kind(*args: Any, timeout: int = 15, use_cache: bool = True, **kwargs: Any) -> Dict[str, Any]:
+    return _send(_list_main_ingredient_drug_kind_request(*args, **kwargs), timeout, use_cache)
+
+
+def list_main_ingredient_guide_a4(*args: Any, timeout: int = 15, use_cache: bool = True, **kwargs: Any) -> Dict[str, Any]:
+    return _send(_list_main_ingredient_guide_a4_request(*args, **kwargs), timeout, use_cache)
+
+
+def list_main_ingredient_guide_a5(*args: Any, timeout: int = 15, use_cache: bool = True, **kwargs: Any) -> Dict[str, Any]:
+    return _send(_list_main_ingredient_guide_a5_request(*args, **kwargs), timeout, use_cache)
+
+
+def list_main_ingredient_picto(*args: Any, timeout: int = 15, use_cache: bool = True, **kwargs: Any) -> Dict[str, Any]:
+    return _send(_list_main_ingredient_picto_request(*args, **kwargs), timeout, use_cache)
+
+
+def get_main_ingredient_picto_by_code(code: str, timeout: int = 15, use_cache: bool = True) -> Dict[str, Any]:
+    return _send(_get_main_ingredient_picto_by_code_request(code), timeout, use_cache)
+
+
+def get_main_ingredient_drug_effect_by_id(effect_id: int, timeout: int = 15, use_cache: bool = True) -> Dict[str, Any]:
+    return _send(_get_main_ingredient_drug_effect_by_id_request(effect_id), timeout, use_cache)
+
+
+def list_product_edicode(*args: Any, timeout: int = 15, use_cache: bool = True, **kwargs: Any) -> Dict[str, Any]:
+    return _send(_list_product_edicode_request(*args, **kwargs), timeout, use_cache)
+
+
+def list_product_edicode_same_ingredient(*args: Any, timeout: int = 15, use_cache: bool = True, **kwargs: Any) -> Dict[str, Any]:
+    """동일 주성분 제품(EDI 코드 기준) 목록을 조회합니다."""
+    return _send(_list_product_edicode_same_ingredient_request(*args, **kwargs), timeout, use_cache)
 
-# --- (removed) Non-GET endpoints (Swagger) ---
 
+# --- Async endpoints (shared httpx.AsyncClient pool) ---
 
+async def async_list_main_ingredient(*args: Any, timeout: int = 15, use_cache: bool = True, **kwargs: Any) -> Dict[str, Any]:
+    return await _asend(_list_main_ingredient_request(*args, **kwargs), timeout, use_cache)
+
+
+async def async_get_main_ingredient_by_code(code: str, timeout: int = 15, use_cache: bool = True) -> Dict[str, Any]:
+    return await _asend(_get_main_ingredient_by_code_request(code), timeout, use_cache)
+
+
+async def async_list_product(*args: Any, timeout: int = 15, use_cache: bool = True, **kwargs: Any) -> Dict[str, Any]:
+    return await _asend(_list_product_request(*args, **kwargs), timeout, use_cache)
+
+
+async def async_get_product_by_code(code: str, timeout: int = 15, use_cache: bool = True) -> Dict[str, Any]:
+    return await _asend(_get_product_by_code_request(code), timeout, use_cache)
+
+
+async def async_list_main_ingredient_drug_effect(*args: Any, timeout: int = 15, use_cache: bool = True, **kwargs: Any) -> Dict[str, Any]:
+    return await _asend(_list_main_ingredient_drug_effect_request(*args, **kwargs), timeout, use_cache)
+
+
+async def async_list_main_ingredient_drug_kind(*args: Any, timeout: int = 15, use_cache: bool = True, **kwargs: Any) -> Dict[str, Any]:
+    return await _asend(_list_main_ingredient_drug_kind_request(*args, **kwargs), timeout, use_cache)
+
+
+async def async_list_main_ingredient_guide_a4(*args: Any, timeout: int = 15, use_cache: bool = True, **kwargs: Any) -> Dict[str, Any]:
+    return await _asend(_list_main_ingredient_guide_a4_request(*args, **kwargs), timeout, use_cache)
+
+
+async def async_list_main_ingredient_guide_a5(*args: Any, timeout: int = 15, use_cache: bool = True, **kwargs: Any) -> Dict[str, Any]:
+    return await _asend(_list_main_ingredient_guide_a5_request(*args, **kwargs), timeout, use_cache)
+
+
+async def async_list_main_ingredient_picto(*args: Any, timeout: int = 15, use_cache: bool = True, **kwargs: Any) -> Dict[str, Any]:
+    return await _asend(_list_main_ingredient_picto_request(*args, **kwargs), timeout, use_cache)
+
+
+async def async_get_main_ingredient_picto_by_code(code: str, timeout: int = 15, use_cache: bool = True) -> Dict[str, Any]:
+    return await _asend(_get_main_ingredient_picto_by_code_request(code), timeout, use_cache)
+
+
+async def async_get_main_ingredient_drug_effect_by_id(effect_id: int, timeout: int = 15, use_cache: bool = True) -> Dict[str, Any]:
+    return await _asend(_get_main_ingredient_drug_effect_by_id_request(effect_id), timeout, use_cache)
+
+
+async def async_list_product_edicode(*args: Any, timeout: int = 15, use_cache: bool = True, **kwargs: Any) -> Dict[str, Any]:
+    return await _asend(_list_product_edicode_request(*args, **kwargs), timeout, use_cache)
+
+
+async def async_list_product_edicode_same_ingredient(*args: Any, timeout: int = 15, use_cache: bool = True, **kwargs: Any) -> Dict[str, Any]:
+    return await _asend(_list_product_edicode_same_ingredient_request(*args, **kwargs), timeout, use_cache)
+
+
+# --- (removed) Helpers for non-GET requests ---
+
+
+# --- (removed) Non-GET endpoints (Swagger) ---
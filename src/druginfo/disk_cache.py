@@ -0,0 +1,204 @@
+"""
+DrugInfo API 응답 디스크 캐시 (SQLite WAL).
+
+MCP 서버가 재시작되어도 캐시가 유지되도록 응답을 zlib 압축해 저장하고,
+ETag / Last-Modified 를 함께 보관해 만료 후에는 조건부 요청으로 재검증합니다.
+점검/정리는 CLI(python -m src.cache_cli)를 사용합니다.
+"""
+
+import json
+import os
+import sqlite3
+import threading
+import time
+import zlib
+from typing import Any, Dict, List, NamedTuple, Optional
+
+from src.utils.config import Config
+
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS responses (
+    key TEXT PRIMARY KEY,
+    body BLOB NOT NULL,
+    raw_size INTEGER NOT NULL,
+    etag TEXT,
+    last_modified TEXT,
+    stored_at REAL NOT NULL,
+    expires_at REAL NOT NULL
+)
+"""
+
+
+class DiskEntry(NamedTuple):
+    data: Dict[str, Any]
+    etag: Optional[str]
+    last_modified: Optional[str]
+    stored_at: float
+    expires_at: float
+
+    @property
+    def fresh(self) -> bool:
+        return self.expires_at > time.time()
+
+
+class DiskCache:
+    """
+    SQLite 기반 영속 응답 캐시.
+
+    만료된 항목도 max_age 동안은 보관하여 조건부 재검증(If-None-Match / If-Modified-Since)에 사용합니다.
+    항목은 max(expires_at, stored_at + max_age) 까지 유지되므로, max_age 보다 TTL 이 긴 정책(월 단위)의
+    신선한 항목이 max_age 때문에 먼저 사라지지 않습니다.
+    하나의 커넥션을 락으로 보호해 여러 스레드에서 공유합니다.
+    """
+
+    def __init__(self, path: str, max_age: float = 7 * 24 * 3600, compress_level: int = 6):
+        self.path = path
+        self.max_age = float(max_age)
+        self.compress_level = int(compress_level)
+        self._lock = threading.Lock()
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self._conn = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute(_SCHEMA)
+
+    def get(self, key: str) -> Optional[DiskEntry]:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT body, etag, last_modified, stored_at, expires_at FROM responses WHERE key = ?",
+                (key,),
+            ).fetchone()
+        if row is None:
+            return None
+        body, etag, last_modified, stored_at, expires_at = row
+        if max(expires_at, stored_at + self.max_age) <= time.time():
+            return None
+        try:
+            data = json.loads(zlib.decompress(body))
+        except (zlib.error, ValueError):
+            self.delete(key)
+            return None
+        return DiskEntry(data, etag, last_modified, stored_at, expires_at)
+
+    def set(
+        self,
+        key: str,
+        data: Dict[str, Any],
+        ttl: float,
+        etag: Optional[str] = None,
+        last_modified: Optional[str] = None,
+    ) -> None:
+        raw = json.dumps(data, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+        body = zlib.compress(raw, self.compress_level)
+        now = time.time()
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO responses (key, body, raw_size, etag, last_modified, stored_at, expires_at)"
+                " VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (key, body, len(raw), etag, last_modified, now, now + float(ttl)),
+            )
+
+    def touch(self, key: str, ttl: float) -> None:
+        """304 Not Modified 응답 후 본문은 유지한 채 만료 시각만 연장합니다."""
+        now = time.time()
+        with self._lock:
+            self._conn.execute(
+                "UPDATE responses SET stored_at = ?, expires_at = ? WHERE key = ?",
+                (now, now + float(ttl), key),
+            )
+
+    def delete(self, key: str) -> None:
+        with self._lock:
+            self._conn.execute("DELETE FROM responses WHERE key = ?", (key,))
+
+    def prune(self, expired_only: bool = False) -> int:
+        """
+        max_age 를 넘긴 만료 항목을 삭제합니다. expired_only=True 이면 만료된 항목을 모두 삭제합니다.
+        삭제된 행 수를 반환합니다.
+        """
+        now = time.time()
+        with self._lock:
+            if expired_only:
+                cur = self._conn.execute("DELETE FROM responses WHERE expires_at <= ?", (now,))
+            else:
+                cur = self._conn.execute(
+                    "DELETE FROM responses WHERE stored_at <= ? AND expires_at <= ?", (now - self.max_age, now)
+                )
+            return cur.rowcount
+
+    def clear(self) -> int:
+        with self._lock:
+            return self._conn.execute("DELETE FROM responses").rowcount
+
+    def vacuum(self) -> None:
+        with self._lock:
+            self._conn.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+            self._conn.execute("VACUUM")
+
+    def stats(self) -> Dict[str, Any]:
+        now = time.time()
+        with self._lock:
+            total, fresh, stored, raw = self._conn.execute(
+                "SELECT COUNT(*), COALESCE(SUM(expires_at > ?), 0), COALESCE(SUM(LENGTH(body)), 0),"
+                " COALESCE(SUM(raw_size), 0) FROM responses",
+                (now,),
+            ).fetchone()
+        file_size = os.path.getsize(self.path) if os.path.exists(self.path) else 0
+        return {
+            "path": self.path,
+            "entries": total,
+            "fresh": fresh,
+            "storedBytes": stored,
+            "rawBytes": raw,
+            "fileBytes": file_size,
+        }
+
+    def entries(self, limit: int = 50) -> List[Dict[str, Any]]:
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT key, LENGTH(body), raw_size, etag, last_modified, stored_at, expires_at"
+                " FROM responses ORDER BY stored_at DESC LIMIT ?",
+                (int(limit),),
+            ).fetchall()
+        now = time.time()
+        return [
+            {
+                "key": key,
+                "storedBytes": stored,
+                "rawBytes": raw,
+                "etag": etag,
+                "lastModified": last_modified,
+                "ageSeconds": int(now - stored_at),
+                "ttlSeconds": int(expires_at - now),
+            }
+            for key, stored, raw, etag, last_modified, stored_at, expires_at in rows
+        ]
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+
+_DISK_CACHE: Optional[DiskCache] = None
+_DISK_CACHE_RESOLVED = False
+_DISK_CACHE_LOCK = threading.Lock()
+
+
+def get_disk_cache() -> Optional[DiskCache]:
+    """Config 기반 프로세스 전역 디스크 캐시. 비활성화되었거나 열 수 없으면 None."""
+    global _DISK_CACHE, _DISK_CACHE_RESOLVED
+    if _DISK_CACHE_RESOLVED:
+        return _DISK_CACHE
+    with _DISK_CACHE_LOCK:
+        if not _DISK_CACHE_RESOLVED:
+            config = Config()
+            if config.cache_enabled and config.disk_cache_enabled:
+                try:
+                    _DISK_CACHE = DiskCache(config.disk_cache_path, max_age=config.disk_cache_max_age)
+                except (sqlite3.Error, OSError):
+                    _DISK_CACHE = None
+            _DISK_CACHE_RESOLVED = True
+        return _DISK_CACHE
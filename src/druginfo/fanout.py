@@ -0,0 +1,75 @@
+"""
+다건 조회(배치 조회, 다중 페이지 스캔)용 fan-out 실행기.
+
+동시 실행 수는 엔드포인트 계열별 AdaptiveLimiter 가 업스트림 지연/과부하 오류를 보고 조절하며,
+각 호출의 결과 또는 예외를 입력 순서대로 반환합니다 (한 건의 실패가 나머지를 중단시키지 않음).
+"""
+
+import asyncio
+import contextvars
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Awaitable, Callable, List, Sequence, Union
+
+import httpx
+import requests
+
+from .client import CircuitOpenError, DrugInfoError
+from .limits import ENDPOINT_FAMILIES, AdaptiveLimiter, adaptive_limiter
+from .resilience import RETRYABLE_STATUS
+
+
+def is_overload(exc: BaseException) -> bool:
+    """업스트림 과부하 신호로 볼 실패인지 (5xx/429, 네트워크 오류, 서킷 차단). 404 등은 아님."""
+    if isinstance(exc, CircuitOpenError):
+        return True
+    if not isinstance(exc, DrugInfoError):
+        return False
+    if exc.status_code is not None:
+        return exc.status_code == 429 or exc.status_code in RETRYABLE_STATUS
+    return isinstance(exc.__cause__, (requests.RequestException, httpx.TransportError))
+
+
+def limiter_for(endpoint: str) -> AdaptiveLimiter:
+    return adaptive_limiter(ENDPOINT_FAMILIES.get(endpoint, "reference"))
+
+
+def fan_out(calls: Sequence[Callable[[], Any]], limiter: AdaptiveLimiter) -> List[Union[Any, Exception]]:
+    """스레드로 calls 를 실행합니다. 결과 목록의 각 항목은 반환값 또는 발생한 예외입니다."""
+
+    def run(call: Callable[[], Any]) -> Union[Any, Exception]:
+        with limiter:
+            started = time.monotonic()
+            try:
+                result = call()
+            except Exception as e:
+                limiter.record(time.monotonic() - started, is_overload(e))
+                return e
+            limiter.record(time.monotonic() - started)
+            return result
+
+    if not calls:
+        return []
+    with ThreadPoolExecutor(max_workers=min(len(calls), limiter.max_limit), thread_name_prefix="druginfo-fanout") as pool:
+        # 스레드풀은 컨텍스트를 복사하지 않으므로 호출자의 마감 시간이 이어지도록 호출마다 복사
+        futures = [pool.submit(contextvars.copy_context().run, run, call) for call in calls]
+        return [future.result() for future in futures]
+
+
+async def afan_out(
+    calls: Sequence[Callable[[], Awaitable[Any]]], limiter: AdaptiveLimiter
+) -> List[Union[Any, Exception]]:
+    """fan_out 의 asyncio 버전. 호출자가 취소되면 진행 중인 호출도 모두 취소됩니다."""
+
+    async def run(call: Callable[[], Awaitable[Any]]) -> Union[Any, Exception]:
+        async with limiter:
+            started = time.monotonic()
+            try:
+                result = await call()
+            except Exception as e:
+                limiter.record(time.monotonic() - started, is_overload(e))
+                return e
+            limiter.record(time.monotonic() - started)
+            return result
+
+    return list(await asyncio.gather(*(run(call) for call in calls)))
@@ -0,0 +1,91 @@
+"""
+엔드포인트별 캐시 신선도 정책.
+
+의약품 코드 갱신 주기(참조: handlers/resources.py 의약품 코드 체계)에 맞춰 TTL 과
+벽시계 기준 갱신 경계(월초/주초/자정, KST)를 선언합니다. 캐시 만료 시각은
+min(저장 시각 + TTL, 다음 갱신 경계) 입니다.
+
+- 보험코드(EDI): 월 1회 업데이트 → monthly
+- 표준코드: 매주 업데이트 → weekly
+- 주성분코드: 매월 업데이트 → monthly
+- 품목기준코드: 변경 없음 (제품 상세는 EDI/생동 정보가 함께 내려오므로 monthly 경계 적용)
+"""
+
+from datetime import datetime, timedelta, timezone
+from typing import Dict, NamedTuple, Optional
+
+KST = timezone(timedelta(hours=9))
+
+MINUTE = 60
+HOUR = 60 * MINUTE
+DAY = 24 * HOUR
+
+
+class FreshnessPolicy(NamedTuple):
+    ttl: float
+    # None | "daily" | "weekly" | "monthly"
+    boundary: Optional[str] = None
+    # 만료 후 이 시간 동안은 캐시 값을 즉시 반환하고 백그라운드에서 갱신 (stale-while-revalidate)
+    stale_while_revalidate: float = 0.0
+    # 404 / 빈 결과를 캐시하는 시간 (negative caching)
+    negative_ttl: float = 0.0
+
+    def expires_in(self, now: Optional[datetime] = None) -> float:
+        """지금 저장한 응답이 신선하게 유지되는 시간(초)."""
+        now = now or datetime.now(KST)
+        ttl = float(self.ttl)
+        if self.boundary:
+            ttl = min(ttl, (next_boundary(self.boundary, now) - now).total_seconds())
+        return max(ttl, 0.0)
+
+
+def next_boundary(boundary: str, now: datetime) -> datetime:
+    """now 이후 처음 오는 갱신 경계 시각 (KST 자정 기준)."""
+    local = now.astimezone(KST)
+    midnight = local.replace(hour=0, minute=0, second=0, microsecond=0)
+    if boundary == "daily":
+        return midnight + timedelta(days=1)
+    if boundary == "weekly":
+        # 월요일 00:00
+        return midnight + timedelta(days=7 - local.weekday())
+    if boundary == "monthly":
+        if local.month == 12:
+            return midnight.replace(year=local.year + 1, month=1, day=1)
+        return midnight.replace(month=local.month + 1, day=1)
+    raise ValueError(f"알 수 없는 갱신 경계: {boundary}")
+
+
+# 엔드포인트 이름(_Request.endpoint) → 정책
+POLICIES: Dict[str, FreshnessPolicy] = {
+    # 검색 목록: 신규 품목 반영을 위해 짧게. 목록 정책의 negative_ttl 은 빈 결과용으로,
+    # 나중에 등록된 품목이 positive TTL 동안 "없음"으로 남지 않도록 잠시만 기억
+    "list_product": FreshnessPolicy(ttl=1 * HOUR, boundary="monthly", negative_ttl=5 * MINUTE),
+    "list_main_ingredient": FreshnessPolicy(ttl=6 * HOUR, boundary="monthly", negative_ttl=5 * MINUTE),
+    # 상세: 코드 자체는 고정, EDI/주성분 매핑은 월 단위 갱신.
+    # 약간 오래된 값은 즉시 반환 후 백그라운드 갱신, 존재하지 않는 코드 탐색은 잠시 기억
+    "get_product_by_code": FreshnessPolicy(
+        ttl=7 * DAY, boundary="monthly", stale_while_revalidate=1 * HOUR, negative_ttl=5 * MINUTE
+    ),
+    "get_main_ingredient_by_code": FreshnessPolicy(
+        ttl=31 * DAY, boundary="monthly", stale_while_revalidate=6 * HOUR, negative_ttl=5 * MINUTE
+    ),
+    # EDI 코드 매핑 / 동일 주성분 목록: 월 1회 갱신
+    "list_product_edicode": FreshnessPolicy(ttl=31 * DAY, boundary="monthly", negative_ttl=5 * MINUTE),
+    "list_product_edicode_same_ingredient": FreshnessPolicy(ttl=7 * DAY, boundary="monthly", negative_ttl=5 * MINUTE),
+    # 참조 목록 (약효/약물종류/복약안내/픽토그램): 관리자 편집 반영을 위해 하루
+    "list_main_ingredient_drug_effect": FreshnessPolicy(ttl=1 * DAY, boundary="daily", negative_ttl=5 * MINUTE),
+    "get_main_ingredient_drug_effect_by_id": FreshnessPolicy(
+        ttl=1 * DAY, boundary="daily", stale_while_revalidate=1 * HOUR, negative_ttl=5 * MINUTE
+    ),
+    "list_main_ingredient_drug_kind": FreshnessPolicy(ttl=1 * DAY, boundary="daily", negative_ttl=5 * MINUTE),
+    "list_main_ingredient_guide_a4": FreshnessPolicy(ttl=1 * DAY, boundary="daily", negative_ttl=5 * MINUTE),
+    "list_main_ingredient_guide_a5": FreshnessPolicy(ttl=1 * DAY, boundary="daily", negative_ttl=5 * MINUTE),
+    "list_main_ingredient_picto": FreshnessPolicy(ttl=1 * DAY, boundary="daily", negative_ttl=5 * MINUTE),
+    "get_main_ingredient_picto_by_code": FreshnessPolicy(
+        ttl=1 * DAY, boundary="daily", stale_while_revalidate=1 * HOUR, negative_ttl=5 * MINUTE
+    ),
+}
+
+
+def policy_for(endpoint: str, default_ttl: float) -> FreshnessPolicy:
+    return POLICIES.get(endpoint) or FreshnessPolicy(ttl=default_ttl)
@@ -0,0 +1,125 @@
+"""
+상세 조회의 꼬리 지연(tail latency)을 줄이기 위한 hedged request.
+
+첫 요청이 관측된 업스트림 지연의 P90 안에 끝나지 않으면 같은 요청을 한 번 더 보내고
+먼저 성공한 응답을 사용합니다. "성공"은 예외 없이 끝나고 accept(결과) 가 참인 경우로,
+빠른 5xx 응답이 느리지만 성공할 200 응답을 이기지 않도록 호출자가 판정 함수를 넘깁니다.
+
+늦은 쪽은 asyncio 에서는 취소하지만, 스레드에서는 취소할 수 없어 끝날 때까지 실행되며
+(bulkhead 슬롯과 rate limit 토큰을 계속 사용) 결과만 버립니다. 그래서 allow() 가 거짓이면
+(예: bulkhead 가 이미 가득 참) 두 번째 요청을 보내지 않고 첫 요청을 기다립니다.
+"""
+
+import asyncio
+import threading
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, Executor, Future, TimeoutError as FutureTimeout, wait
+from typing import Any, Awaitable, Callable, Deque, Dict, Iterable, Optional
+
+
+class LatencyTracker:
+    """엔드포인트별 최근 window 개 응답 시간으로 분위수를 계산합니다."""
+
+    def __init__(self, window: int = 200, min_samples: int = 20):
+        self.window = int(window)
+        self.min_samples = int(min_samples)
+        self._lock = threading.Lock()
+        self._samples: Dict[str, Deque[float]] = {}
+
+    def record(self, endpoint: str, seconds: float) -> None:
+        with self._lock:
+            samples = self._samples.get(endpoint)
+            if samples is None:
+                samples = self._samples[endpoint] = deque(maxlen=self.window)
+            samples.append(seconds)
+
+    def percentile(self, endpoint: str, q: float) -> Optional[float]:
+        """표본이 min_samples 미만이면 None."""
+        with self._lock:
+            samples = self._samples.get(endpoint)
+            if samples is None or len(samples) < self.min_samples:
+                return None
+            ordered = sorted(samples)
+        return ordered[min(int(q * len(ordered)), len(ordered) - 1)]
+
+    def stats(self) -> Dict[str, Dict[str, float]]:
+        with self._lock:
+            endpoints = list(self._samples)
+        result = {}
+        for endpoint in endpoints:
+            p50 = self.percentile(endpoint, 0.5)
+            if p50 is not None:
+                result[endpoint] = {
+                    "p50": round(p50, 3),
+                    "p90": round(self.percentile(endpoint, 0.9) or 0.0, 3),
+                    "p99": round(self.percentile(endpoint, 0.99) or 0.0, 3),
+                }
+        return result
+
+
+def _fallback(results: Iterable[Any]) -> Any:
+    """둘 다 성공하지 못했을 때: 예외 없이 끝난 결과(예: 5xx 응답)가 있으면 그것을, 없으면 첫 요청의 오류."""
+    results = list(results)
+    for result in results:
+        if result.exception() is None:
+            return result.result()
+    return results[0].result()
+
+
+def hedged_call(
+    fn: Callable[[], Any],
+    delay: float,
+    executor: Executor,
+    accept: Optional[Callable[[Any], bool]] = None,
+    allow: Optional[Callable[[], bool]] = None,
+) -> Any:
+    """
+    fn 을 실행하고 delay 초 안에 끝나지 않으면 한 번 더 실행해 먼저 성공한 결과를 반환합니다.
+    늦은 쪽 스레드는 취소되지 않고 끝까지 실행됩니다.
+    """
+    first: "Future[Any]" = executor.submit(fn)
+    try:
+        # delay 안에 끝났다면 결과가 무엇이든 그대로 (실패는 호출자의 재시도가 처리)
+        return first.result(timeout=delay)
+    except FutureTimeout:
+        pass
+    if allow is not None and not allow():
+        return first.result()
+    second: "Future[Any]" = executor.submit(fn)
+    pending = {first, second}
+    while pending:
+        done, pending = wait(pending, return_when=FIRST_COMPLETED)
+        for future in done:
+            if future.exception() is None and (accept is None or accept(future.result())):
+                for other in pending:
+                    other.cancel()
+                return future.result()
+    return _fallback((first, second))
+
+
+async def ahedged_call(
+    fn: Callable[[], Awaitable[Any]],
+    delay: float,
+    accept: Optional[Callable[[Any], bool]] = None,
+    allow: Optional[Callable[[], bool]] = None,
+) -> Any:
+    """hedged_call 의 asyncio 버전. 늦은 요청과 (호출자가 취소되면) 두 요청 모두 취소합니다."""
+    first = asyncio.ensure_future(fn())
+    tasks = [first]
+    try:
+        done, _ = await asyncio.wait(tasks, timeout=delay)
+        if done:
+            return first.result()
+        if allow is None or allow():
+            tasks.append(asyncio.ensure_future(fn()))
+        pending = set(tasks)
+        while pending:
+            done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                if task.exception() is None and (accept is None or accept(task.result())):
+                    return task.result()
+        return _fallback(tasks)
+    finally:
+        for task in tasks:
+            if not task.done():
+                task.cancel()
@@ -0,0 +1,294 @@
+"""
+업스트림 부하 제어: 전역 토큰 버킷 rate limiter 와 엔드포인트 계열별 동시 실행 bulkhead.
+
+스레드(동기 API)와 asyncio(비동기 API) 호출자가 같은 한도를 공유하므로
+threading 락 위에 구현하고, asyncio 대기자는 자기 이벤트 루프의 Future 로 깨웁니다.
+"""
+
+import asyncio
+import threading
+import time
+from collections import deque
+from typing import Any, Deque, Dict, Optional, Tuple
+
+from src.utils.config import Config
+
+# 엔드포인트 이름 → bulkhead 계열
+ENDPOINT_FAMILIES: Dict[str, str] = {
+    "list_product": "list",
+    "list_main_ingredient": "list",
+    "list_product_edicode": "list",
+    "get_product_by_code": "detail",
+    "get_main_ingredient_by_code": "detail",
+    "get_main_ingredient_drug_effect_by_id": "detail",
+    "get_main_ingredient_picto_by_code": "detail",
+    "list_product_edicode_same_ingredient": "same_ingredient",
+    "list_main_ingredient_drug_effect": "reference",
+    "list_main_ingredient_drug_kind": "reference",
+    "list_main_ingredient_guide_a4": "reference",
+    "list_main_ingredient_guide_a5": "reference",
+    "list_main_ingredient_picto": "reference",
+}
+
+
+class TokenBucket:
+    """
+    초당 rate 개, 최대 burst 개까지 쌓이는 토큰 버킷.
+
+    reserve() 는 토큰을 미리 차감(음수 허용)하고 기다려야 할 시간을 반환하므로
+    대기 순서가 도착 순서대로 유지됩니다. rate <= 0 이면 제한하지 않습니다.
+    """
+
+    def __init__(self, rate: float, burst: float):
+        self.rate = float(rate)
+        self.burst = max(float(burst), 1.0)
+        self._tokens = self.burst
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+        self.waiting = 0
+
+    def reserve(self) -> float:
+        if self.rate <= 0:
+            return 0.0
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            self._tokens -= 1.0
+            if self._tokens >= 0:
+                return 0.0
+            return -self._tokens / self.rate
+
+    def acquire(self, timeout: Optional[float] = None) -> bool:
+        """토큰을 얻을 때까지 기다립니다. timeout 초 안에 얻을 수 없으면 기다리지 않고 False."""
+        delay = self.reserve()
+        if delay > 0:
+            if timeout is not None and delay > timeout:
+                self._refund()
+                return False
+            self._wait(1)
+            try:
+                time.sleep(delay)
+            finally:
+                self._wait(-1)
+        return True
+
+    async def aacquire(self, timeout: Optional[float] = None) -> bool:
+        delay = self.reserve()
+        if delay > 0:
+            if timeout is not None and delay > timeout:
+                self._refund()
+                return False
+            self._wait(1)
+            try:
+                await asyncio.sleep(delay)
+            finally:
+                self._wait(-1)
+        return True
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            tokens = min(self.burst, self._tokens + (time.monotonic() - self._updated) * self.rate)
+            return {"rate": self.rate, "burst": self.burst, "tokens": round(tokens, 1), "waiting": self.waiting}
+
+    def _wait(self, delta: int) -> None:
+        with self._lock:
+            self.waiting += delta
+
+    def _refund(self) -> None:
+        with self._lock:
+            self._tokens = min(self.burst, self._tokens + 1.0)
+
+
+class Bulkhead:
+    """
+    동시 실행 수를 limit 로 제한하는 FIFO 세마포어. limit <= 0 이면 제한하지 않습니다.
+
+    슬롯이 반환되면 대기열의 첫 대기자에게 바로 넘겨주므로, 새로 도착한 호출이 끼어들지 못합니다.
+    """
+
+    def __init__(self, name: str, limit: int):
+        self.name = name
+        self.limit = int(limit)
+        self._lock = threading.Lock()
+        self._active = 0
+        # (threading.Event, None, None) 또는 (None, loop, Future)
+        self._waiters: Deque[Tuple[Optional[threading.Event], Any, Any]] = deque()
+
+    def acquire(self, timeout: Optional[float] = None) -> bool:
+        """슬롯을 얻을 때까지 기다립니다. timeout 초 안에 얻지 못하면 대기열에서 빠지고 False."""
+        with self._lock:
+            if self._try_enter():
+                return True
+            waiter = (threading.Event(), None, None)
+            self._waiters.append(waiter)
+        if waiter[0].wait(timeout):
+            return True
+        with self._lock:
+            if waiter in self._waiters:
+                self._waiters.remove(waiter)
+                return False
+        # 시간 초과와 동시에 슬롯을 넘겨받음
+        return True
+
+    async def aacquire(self, timeout: Optional[float] = None) -> bool:
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            if self._try_enter():
+                return True
+            future = loop.create_future()
+            waiter = (None, loop, future)
+            self._waiters.append(waiter)
+        try:
+            await asyncio.wait_for(future, timeout)
+            return True
+        except (asyncio.CancelledError, asyncio.TimeoutError) as e:
+            with self._lock:
+                queued = waiter in self._waiters
+                if queued:
+                    self._waiters.remove(waiter)
+            # 슬롯을 넘겨받은 뒤 재개되기 전에 취소되었다면 여기서 반환.
+            # _wake 전에 취소되었다면 Future 도 취소되므로 _wake 가 반환
+            if not queued and future.done() and not future.cancelled():
+                self.release()
+            if isinstance(e, asyncio.TimeoutError):
+                return False
+            raise
+
+    def release(self) -> None:
+        if self.limit <= 0:
+            return
+        with self._lock:
+            # 한도가 줄어든 경우(AdaptiveLimiter)에는 넘기지 않고 반환
+            if not self._waiters or self._active > self.limit:
+                self._active -= 1
+                return
+            waiter = self._waiters.popleft()
+        # 슬롯을 대기자에게 그대로 넘김 (_active 유지)
+        self._hand_off(waiter)
+
+    def __enter__(self) -> "Bulkhead":
+        self.acquire()
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        self.release()
+
+    async def __aenter__(self) -> "Bulkhead":
+        await self.aacquire()
+        return self
+
+    async def __aexit__(self, *exc: Any) -> None:
+        self.release()
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {"limit": self.limit, "active": self._active, "queued": len(self._waiters)}
+
+    def has_capacity(self) -> bool:
+        """지금 acquire 하면 기다리지 않고 바로 들어갈 수 있는지."""
+        with self._lock:
+            return self.limit <= 0 or (self._active < self.limit and not self._waiters)
+
+    def _try_enter(self) -> bool:
+        if self.limit <= 0:
+            return True
+        if self._active < self.limit and not self._waiters:
+            self._active += 1
+            return True
+        return False
+
+    def _hand_off(self, waiter: Tuple[Optional[threading.Event], Any, Any]) -> None:
+        event, loop, future = waiter
+        if event is not None:
+            event.set()
+        else:
+            loop.call_soon_threadsafe(self._wake, future)
+
+    def _wake(self, future: "asyncio.Future[None]") -> None:
+        if future.done():
+            # 대기자가 그 사이 취소됨 → 다음 대기자에게 넘김
+            self.release()
+        else:
+            future.set_result(None)
+
+
+class AdaptiveLimiter(Bulkhead):
+    """
+    fan-out 용 적응형 동시 실행 한도 (AIMD + 지연 기울기).
+
+    지연이 기준선의 tolerance 배 이내로 유지되면 한도를 한 창(window)당 1 씩 늘리고,
+    지연이 커지면 10% 줄이며, 과부하 오류(5xx/타임아웃/서킷 차단)가 나면 절반으로 줄입니다.
+    감소는 최근 응답 시간 안에 한 번만 적용해 같은 장애로 연달아 줄어들지 않게 합니다.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        initial: int = 4,
+        min_limit: int = 1,
+        max_limit: int = 8,
+        tolerance: float = 2.0,
+    ):
+        self.min_limit = max(int(min_limit), 1)
+        self.max_limit = max(int(max_limit), self.min_limit)
+        initial = min(max(int(initial), self.min_limit), self.max_limit)
+        super().__init__(name, initial)
+        self.tolerance = float(tolerance)
+        self._estimate = float(initial)
+        self._baseline: Optional[float] = None
+        self._last_decrease = 0.0
+
+    def record(self, latency: float, overloaded: bool = False) -> None:
+        """호출 하나의 완료를 반영합니다. overloaded 는 업스트림 과부하로 볼 수 있는 실패 여부."""
+        now = time.monotonic()
+        woken = []
+        with self._lock:
+            if self._baseline is None:
+                self._baseline = latency
+            elif not overloaded:
+                self._baseline = self._baseline * 0.95 + latency * 0.05
+            if overloaded or latency > self._baseline * self.tolerance:
+                if now - self._last_decrease >= latency:
+                    self._estimate *= 0.5 if overloaded else 0.9
+                    self._last_decrease = now
+            else:
+                self._estimate += 1.0 / self._estimate
+            self._estimate = min(max(self._estimate, float(self.min_limit)), float(self.max_limit))
+            self.limit = int(self._estimate)
+            while self._waiters and self._active < self.limit:
+                self._active += 1
+                woken.append(self._waiters.popleft())
+        for waiter in woken:
+            self._hand_off(waiter)
+
+    def stats(self) -> Dict[str, Any]:
+        stats: Dict[str, Any] = dict(super().stats())
+        with self._lock:
+            stats["estimate"] = round(self._estimate, 2)
+            stats["baselineLatency"] = round(self._baseline, 3) if self._baseline is not None else None
+        return stats
+
+
+_ADAPTIVE: Dict[str, AdaptiveLimiter] = {}
+_ADAPTIVE_LOCK = threading.Lock()
+
+
+def adaptive_limiter(family: str) -> AdaptiveLimiter:
+    """엔드포인트 계열별로 프로세스 전역에서 공유하는 fan-out 한도."""
+    limiter = _ADAPTIVE.get(family)
+    if limiter is not None:
+        return limiter
+    with _ADAPTIVE_LOCK:
+        limiter = _ADAPTIVE.get(family)
+        if limiter is None:
+            config = Config()
+            limiter = AdaptiveLimiter(f"fanout:{family}", config.fanout_initial, max_limit=config.fanout_max)
+            _ADAPTIVE[family] = limiter
+        return limiter
+
+
+def adaptive_stats() -> Dict[str, Dict[str, Any]]:
+    with _ADAPTIVE_LOCK:
+        limiters = dict(_ADAPTIVE)
+    return {family: limiter.stats() for family, limiter in limiters.items()}
@@ -0,0 +1,154 @@
+"""
+페이지 목록 응답의 부분 윈도우 재사용 (page subsumption).
+
+같은 필터/SortBy 로 더 큰 윈도우(예: PageSize=10, Page=1)를 이미 캐시하고 있으면
+그 안에 포함되는 작은 윈도우나 오프셋 윈도우(예: PageSize=5, Page=2)는 업스트림 호출 없이
+캐시된 items 를 잘라 응답합니다. totalCount 는 그대로 두고 page/pageSize 만 요청 값으로 바꾸므로
+response_filters._meta 의 total/hasMore 계산이 그대로 맞습니다.
+"""
+
+import copy
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, List, Mapping, NamedTuple, Optional, Tuple
+
+from .cache import canonical_key
+
+# page subsumption 을 적용하는 목록 엔드포인트
+PAGED_ENDPOINTS = frozenset({"list_product", "list_main_ingredient", "list_product_edicode"})
+
+_ITEM_KEYS = ("items", "list", "results", "rows", "data")
+_TOTAL_KEYS = ("totalCount", "TotalCount", "count", "total")
+
+
+class Window(NamedTuple):
+    filter_key: str
+    offset: int
+    limit: int
+    page: int
+    page_size: int
+
+
+def window_of(url: str, params: Mapping[str, Any]) -> Optional[Window]:
+    """Page/PageSize 가 모두 지정된 요청의 (필터 키, 오프셋, 크기). 그 외에는 None."""
+    try:
+        page = int(params["Page"])
+        page_size = int(params["PageSize"])
+    except (KeyError, TypeError, ValueError):
+        return None
+    if page < 1 or page_size < 1:
+        return None
+    filters = {k: v for k, v in params.items() if k not in ("Page", "PageSize")}
+    return Window(canonical_key(url, filters), (page - 1) * page_size, page_size, page, page_size)
+
+
+def _locate_items(data: Dict[str, Any]) -> Optional[Tuple[Any, Any, Dict[str, Any]]]:
+    """(items 를 담은 컨테이너, 그 키, 메타데이터 section) 을 찾습니다."""
+    section = data.get("data")
+    if isinstance(section, list):
+        return data, "data", data
+    if not isinstance(section, dict):
+        section = data
+    for key in _ITEM_KEYS:
+        if isinstance(section.get(key), list):
+            return section, key, section
+    return None
+
+
+def _total_of(section: Dict[str, Any]) -> Optional[int]:
+    for key in _TOTAL_KEYS:
+        value = section.get(key)
+        if isinstance(value, (int, float)) and not isinstance(value, bool):
+            return int(value)
+    return None
+
+
+def page_items(data: Dict[str, Any]) -> Optional[List[Any]]:
+    """목록 응답의 items. 목록 형태가 아니면 None."""
+    located = _locate_items(data)
+    if located is None:
+        return None
+    container, key, _section = located
+    return container[key]
+
+
+def page_total(data: Dict[str, Any]) -> Optional[int]:
+    """목록 응답의 전체 항목 수(totalCount 등). 없으면 None."""
+    located = _locate_items(data)
+    return _total_of(located[2]) if located is not None else None
+
+
+def slice_window(data: Dict[str, Any], cached: Window, wanted: Window) -> Optional[Dict[str, Any]]:
+    """
+    cached 윈도우 응답에서 wanted 윈도우 응답을 만듭니다. 포함되지 않으면 None.
+
+    cached 가 total 에 도달했다면 마지막 페이지이므로 그 뒤의 윈도우는 빈 목록으로 응답할 수 있습니다.
+    업스트림이 PageSize 를 상한으로 잘라낼 수 있으므로, items 가 PageSize 보다 적은 것으로
+    마지막 페이지를 판단하는 것은 total 이 없을 때뿐입니다.
+    """
+    located = _locate_items(data)
+    if located is None:
+        return None
+    container, key, section = located
+    items: List[Any] = container[key]
+    total = _total_of(section)
+    end = cached.offset + len(items)
+    is_last = end >= total if total is not None else len(items) < cached.limit
+    wanted_end = wanted.offset + wanted.limit
+    if total is not None:
+        wanted_end = min(wanted_end, total)
+    if wanted.offset < cached.offset:
+        return None
+    if wanted_end > end and not is_last:
+        return None
+
+    result = copy.deepcopy(data)
+    located = _locate_items(result)
+    container, key, section = located
+    start = wanted.offset - cached.offset
+    container[key] = items[start:start + wanted.limit]
+    for name in ("page", "Page"):
+        if name in section:
+            section[name] = wanted.page
+    for name in ("pageSize", "PageSize"):
+        if name in section:
+            section[name] = wanted.page_size
+    return result
+
+
+class PageIndex:
+    """필터 키별로 캐시된 윈도우(캐시 키, 윈도우)를 추적합니다. 필터 키 수는 LRU 로 제한."""
+
+    def __init__(self, max_filters: int = 4096, max_windows: int = 16):
+        self.max_filters = max_filters
+        self.max_windows = max_windows
+        self._lock = threading.Lock()
+        self._windows: "OrderedDict[str, Dict[str, Window]]" = OrderedDict()
+
+    def register(self, cache_key: str, window: Window) -> None:
+        with self._lock:
+            windows = self._windows.pop(window.filter_key, None) or {}
+            windows.pop(cache_key, None)
+            windows[cache_key] = window
+            while len(windows) > self.max_windows:
+                windows.pop(next(iter(windows)))
+            self._windows[window.filter_key] = windows
+            while len(self._windows) > self.max_filters:
+                self._windows.popitem(last=False)
+
+    def candidates(self, filter_key: str) -> List[Tuple[str, Window]]:
+        """큰 윈도우부터 반환합니다."""
+        with self._lock:
+            windows = self._windows.get(filter_key)
+            if not windows:
+                return []
+            self._windows.move_to_end(filter_key)
+            return sorted(windows.items(), key=lambda kv: -kv[1].limit)
+
+    def discard(self, filter_key: str, cache_key: str) -> None:
+        with self._lock:
+            windows = self._windows.get(filter_key)
+            if windows is not None:
+                windows.pop(cache_key, None)
+                if not windows:
+                    del self._windows[filter_key]
@@ -0,0 +1,352 @@
+"""
+목록 엔드포인트 자동 페이지 순회.
+
+iter_products(**filters) 처럼 필터만 주면 Page 를 넘겨 가며 항목을 하나씩 돌려주고,
+현재 페이지를 소비하는 동안 다음 페이지를 미리 받아 둡니다(prefetch).
+PageSize 는 EDB_ITER_PAGE_SIZE(기본 100)와 limit 중 작은 값으로 정하며, 업스트림이 더 작은
+페이지로 잘라 응답하면 그 크기에 맞춰 이후 페이지를 요청합니다.
+각 페이지는 일반 조회와 같은 캐시, 재시도, 마감 시간을 거칩니다 (prefetch 스레드도 호출자의 마감 시간을 따름).
+
+scan_products(**filters) 등은 전체 결과를 한 번에 모읍니다. 첫 페이지의 totalCount 로 남은 페이지 수를 알면
+나머지 페이지를 fan-out(계열별 적응형 동시 실행 한도)으로 동시에 받아 페이지 순서대로 합치고,
+순회 중 업스트림 데이터가 바뀌어 항목이 중복되거나 빠진 경우를 ScanResult 에 표시합니다.
+"""
+
+import asyncio
+import contextvars
+import json
+import logging
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, AsyncIterator, Callable, Dict, Iterator, List, NamedTuple, Optional, Tuple
+
+from src.utils.config import Config
+
+from .client import (
+    _Request,
+    _asend,
+    _list_main_ingredient_request,
+    _list_product_edicode_request,
+    _list_product_request,
+    _send,
+)
+from .fanout import afan_out, fan_out, limiter_for
+from .page_cache import page_items, page_total
+
+logger = logging.getLogger(__name__)
+
+_PREFETCH_EXECUTOR = ThreadPoolExecutor(max_workers=4, thread_name_prefix="druginfo-prefetch")
+_PAGE_SIZE = Config().iter_page_size
+
+# 순회가 직접 관리하는 페이지 인자 (legacy 별칭 포함)
+_PAGE_ARGS = ("Page", "PageSize", "page", "size")
+
+
+def _prepare(filters: Dict[str, Any], page_size: Optional[int], limit: Optional[int]) -> Tuple[Dict[str, Any], int]:
+    hint = page_size or filters.get("PageSize") or filters.get("size")
+    filters = {k: v for k, v in filters.items() if k not in _PAGE_ARGS}
+    size = int(hint) if hint else _PAGE_SIZE
+    if limit is not None:
+        size = min(size, max(int(limit), 1))
+    return filters, max(size, 1)
+
+
+def _page(data: Dict[str, Any]) -> Tuple[List[Any], Optional[int]]:
+    return page_items(data) or [], page_total(data)
+
+
+def _fit_size(items: List[Any], size: int, total: Optional[int]) -> int:
+    """업스트림이 PageSize 를 더 작게 잘랐으면(첫 페이지가 덜 찼는데 total 은 더 큼) 그 크기를 사용."""
+    if items and len(items) < size and total is not None and total > len(items):
+        return len(items)
+    return size
+
+
+def _has_more(items: List[Any], size: int, page: int, total: Optional[int]) -> bool:
+    if len(items) < size:
+        return False
+    if total is not None:
+        return page * size < total
+    return True
+
+
+def _iterate(
+    build: Callable[..., _Request],
+    filters: Dict[str, Any],
+    page_size: Optional[int],
+    limit: Optional[int],
+    timeout: int,
+    use_cache: bool,
+) -> Iterator[Dict[str, Any]]:
+    filters, size = _prepare(filters, page_size, limit)
+
+    def fetch(page: int, size: int) -> Dict[str, Any]:
+        return _send(build(**filters, Page=page, PageSize=size), timeout, use_cache)
+
+    items, total = _page(fetch(1, size))
+    size = _fit_size(items, size, total)
+    page, produced = 1, 0
+    while True:
+        pending: Optional["Future[Dict[str, Any]]"] = None
+        if _has_more(items, size, page, total) and (limit is None or produced + len(items) < limit):
+            # 스레드풀은 컨텍스트를 복사하지 않으므로 마감 시간이 이어지도록 복사해서 실행
+            pending = _PREFETCH_EXECUTOR.submit(contextvars.copy_context().run, fetch, page + 1, size)
+        try:
+            for item in items:
+                yield item
+                produced += 1
+                if limit is not None and produced >= limit:
+                    return
+        except BaseException:
+            # 소비자가 중간에 멈추면(close/예외) 아직 시작하지 않은 prefetch 는 취소
+            if pending is not None:
+                pending.cancel()
+            raise
+        if pending is None:
+            return
+        items, total = _page(pending.result())
+        page += 1
+
+
+async def _aiterate(
+    build: Callable[..., _Request],
+    filters: Dict[str, Any],
+    page_size: Optional[int],
+    limit: Optional[int],
+    timeout: int,
+    use_cache: bool,
+) -> AsyncIterator[Dict[str, Any]]:
+    filters, size = _prepare(filters, page_size, limit)
+
+    async def fetch(page: int, size: int) -> Dict[str, Any]:
+        return await _asend(build(**filters, Page=page, PageSize=size), timeout, use_cache)
+
+    items, total = _page(await fetch(1, size))
+    size = _fit_size(items, size, total)
+    page, produced = 1, 0
+    pending: Optional["asyncio.Task[Dict[str, Any]]"] = None
+    try:
+        while True:
+            pending = None
+            if _has_more(items, size, page, total) and (limit is None or produced + len(items) < limit):
+                pending = asyncio.ensure_future(fetch(page + 1, size))
+            for item in items:
+                yield item
+                produced += 1
+                if limit is not None and produced >= limit:
+                    return
+            if pending is None:
+                return
+            items, total = _page(await pending)
+            page += 1
+    finally:
+        # 소비자가 중간에 그만두거나(break/aclose) 취소되면 받던 다음 페이지도 취소
+        if pending is not None:
+            pending.cancel()
+
+
+def iter_products(
+    page_size: Optional[int] = None, limit: Optional[int] = None, timeout: int = 15, use_cache: bool = True, **filters: Any
+) -> Iterator[Dict[str, Any]]:
+    """list_product 의 모든 항목을 순회합니다. filters 는 list_product 인자(Page/PageSize 제외)."""
+    return _iterate(_list_product_request, filters, page_size, limit, timeout, use_cache)
+
+
+def iter_main_ingredients(
+    page_size: Optional[int] = None, limit: Optional[int] = None, timeout: int = 15, use_cache: bool = True, **filters: Any
+) -> Iterator[Dict[str, Any]]:
+    """list_main_ingredient 의 모든 항목을 순회합니다."""
+    return _iterate(_list_main_ingredient_request, filters, page_size, limit, timeout, use_cache)
+
+
+def iter_product_edicodes(
+    page_size: Optional[int] = None, limit: Optional[int] = None, timeout: int = 15, use_cache: bool = True, **filters: Any
+) -> Iterator[Dict[str, Any]]:
+    """list_product_edicode 의 모든 항목을 순회합니다."""
+    return _iterate(_list_product_edicode_request, filters, page_size, limit, timeout, use_cache)
+
+
+def async_iter_products(
+    page_size: Optional[int] = None, limit: Optional[int] = None, timeout: int = 15, use_cache: bool = True, **filters: Any
+) -> AsyncIterator[Dict[str, Any]]:
+    return _aiterate(_list_product_request, filters, page_size, limit, timeout, use_cache)
+
+
+def async_iter_main_ingredients(
+    page_size: Optional[int] = None, limit: Optional[int] = None, timeout: int = 15, use_cache: bool = True, **filters: Any
+) -> AsyncIterator[Dict[str, Any]]:
+    return _aiterate(_list_main_ingredient_request, filters, page_size, limit, timeout, use_cache)
+
+
+def async_iter_product_edicodes(
+    page_size: Optional[int] = None, limit: Optional[int] = None, timeout: int = 15, use_cache: bool = True, **filters: Any
+) -> AsyncIterator[Dict[str, Any]]:
+    return _aiterate(_list_product_edicode_request, filters, page_size, limit, timeout, use_cache)
+
+
+# 중복/누락 판정에 사용할 항목 식별 필드 (엔드포인트별, 대소문자 변형 포함)
+_ID_FIELDS: Dict[str, Tuple[Tuple[str, ...], ...]] = {
+    "list_product": (("productCode", "ProductCode"),),
+    "list_main_ingredient": (("IngredientCode", "ingredientCode"),),
+    "list_product_edicode": (("productCode", "ProductCode"), ("ediCode", "EdiCode")),
+}
+
+
+class ScanResult(NamedTuple):
+    items: List[Dict[str, Any]]
+    # 첫 페이지가 보고한 전체 항목 수 (없으면 None)
+    total: Optional[int]
+    # 조회한 페이지 수 (totalCount 가 없어 순차 순회로 대체했으면 0)
+    pages: int
+    # 두 번 이상 나온 항목의 식별자 (첫 번째만 items 에 남김)
+    duplicates: List[str]
+    # total(limit 적용) 대비 부족한 항목 수
+    missing: int
+    # 페이지마다 보고한 totalCount 가 달랐는지 (순회 중 데이터 변경)
+    shifted: bool
+
+    @property
+    def complete(self) -> bool:
+        return not self.duplicates and self.missing == 0 and not self.shifted
+
+
+def _item_id(endpoint: str, item: Any) -> str:
+    parts = []
+    for names in _ID_FIELDS.get(endpoint, ()):
+        value = next((item[name] for name in names if isinstance(item, dict) and item.get(name) not in (None, "")), None)
+        if value is None:
+            parts = []
+            break
+        parts.append(str(value))
+    if parts:
+        return "|".join(parts)
+    return json.dumps(item, sort_keys=True, ensure_ascii=False, default=str)
+
+
+def _assemble(endpoint: str, pages: List[Dict[str, Any]], limit: Optional[int]) -> ScanResult:
+    seen = set()
+    items: List[Dict[str, Any]] = []
+    duplicates: List[str] = []
+    totals = set()
+    for data in pages:
+        page, total = _page(data)
+        if total is not None:
+            totals.add(total)
+        for item in page:
+            item_id = _item_id(endpoint, item)
+            if item_id in seen:
+                duplicates.append(item_id)
+                continue
+            seen.add(item_id)
+            items.append(item)
+    if limit is not None:
+        items = items[:limit]
+    total = _page(pages[0])[1] if pages else None
+    expected = total if limit is None or total is None else min(total, limit)
+    missing = max(expected - len(items), 0) if expected is not None else 0
+    result = ScanResult(items, total, len(pages), duplicates, missing, len(totals) > 1)
+    if not result.complete:
+        logger.warning(
+            f"{endpoint} 스캔 중 데이터 변경 감지: 중복 {len(duplicates)}건, 누락 {missing}건, totalCount {sorted(totals)}"
+        )
+    return result
+
+
+def _remaining_pages(size: int, total: Optional[int], limit: Optional[int]) -> List[int]:
+    wanted = total if limit is None else min(total, limit)
+    return list(range(2, -(-wanted // size) + 1))
+
+
+def _scan(
+    build: Callable[..., _Request],
+    filters: Dict[str, Any],
+    page_size: Optional[int],
+    limit: Optional[int],
+    timeout: int,
+    use_cache: bool,
+) -> ScanResult:
+    filters, size = _prepare(filters, page_size, limit)
+    endpoint = build(**filters).endpoint
+
+    def fetch(page: int, size: int) -> Dict[str, Any]:
+        return _send(build(**filters, Page=page, PageSize=size), timeout, use_cache)
+
+    first = fetch(1, size)
+    items, total = _page(first)
+    if total is None:
+        # 전체 수를 모르면 페이지 수도 알 수 없으므로 순차 순회 (첫 페이지는 캐시에서 재사용)
+        pages = [{"items": list(_iterate(build, filters, size, limit, timeout, use_cache))}]
+        return _assemble(endpoint, pages, limit)._replace(pages=0)
+    size = _fit_size(items, size, total)
+    rest = _remaining_pages(size, total, limit) if _has_more(items, size, 1, total) else []
+    fetched = fan_out([lambda page=page: fetch(page, size) for page in rest], limiter_for(endpoint))
+    for outcome in fetched:
+        if isinstance(outcome, Exception):
+            raise outcome
+    return _assemble(endpoint, [first] + fetched, limit)
+
+
+async def _ascan(
+    build: Callable[..., _Request],
+    filters: Dict[str, Any],
+    page_size: Optional[int],
+    limit: Optional[int],
+    timeout: int,
+    use_cache: bool,
+) -> ScanResult:
+    filters, size = _prepare(filters, page_size, limit)
+    endpoint = build(**filters).endpoint
+
+    async def fetch(page: int, size: int) -> Dict[str, Any]:
+        return await _asend(build(**filters, Page=page, PageSize=size), timeout, use_cache)
+
+    first = await fetch(1, size)
+    items, total = _page(first)
+    if total is None:
+        pages = [{"items": [item async for item in _aiterate(build, filters, size, limit, timeout, use_cache)]}]
+        return _assemble(endpoint, pages, limit)._replace(pages=0)
+    size = _fit_size(items, size, total)
+    rest = _remaining_pages(size, total, limit) if _has_more(items, size, 1, total) else []
+    fetched = await afan_out([lambda page=page: fetch(page, size) for page in rest], limiter_for(endpoint))
+    for outcome in fetched:
+        if isinstance(outcome, Exception):
+            raise outcome
+    return _assemble(endpoint, [first] + fetched, limit)
+
+
+def scan_products(
+    page_size: Optional[int] = None, limit: Optional[int] = None, timeout: int = 15, use_cache: bool = True, **filters: Any
+) -> ScanResult:
+    """list_product 의 모든 항목을 페이지 동시 조회로 모읍니다. 한 페이지라도 실패하면 그 오류를 발생시킵니다."""
+    return _scan(_list_product_request, filters, page_size, limit, timeout, use_cache)
+
+
+def scan_main_ingredients(
+    page_size: Optional[int] = None, limit: Optional[int] = None, timeout: int = 15, use_cache: bool = True, **filters: Any
+) -> ScanResult:
+    """list_main_ingredient 의 모든 항목을 페이지 동시 조회로 모읍니다."""
+    return _scan(_list_main_ingredient_request, filters, page_size, limit, timeout, use_cache)
+
+
+def scan_product_edicodes(
+    page_size: Optional[int] = None, limit: Optional[int] = None, timeout: int = 15, use_cache: bool = True, **filters: Any
+) -> ScanResult:
+    """list_product_edicode 의 모든 항목을 페이지 동시 조회로 모읍니다."""
+    return _scan(_list_product_edicode_request, filters, page_size, limit, timeout, use_cache)
+
+
+async def async_scan_products(
+    page_size: Optional[int] = None, limit: Optional[int] = None, timeout: int = 15, use_cache: bool = True, **filters: Any
+) -> ScanResult:
+    return await _ascan(_list_product_request, filters, page_size, limit, timeout, use_cache)
+
+
+async def async_scan_main_ingredients(
+    page_size: Optional[int] = None, limit: Optional[int] = None, timeout: int = 15, use_cache: bool = True, **filters: Any
+) -> ScanResult:
+    return await _ascan(_list_main_ingredient_request, filters, page_size, limit, timeout, use_cache)
+
+
+async def async_scan_product_edicodes(
+    page_size: Optional[int] = None, limit: Optional[int] = None, timeout: int = 15, use_cache: bool = True, **filters: Any
+) -> ScanResult:
+    return await _ascan(_list_product_edicode_request, filters, page_size, limit, timeout, use_cache)
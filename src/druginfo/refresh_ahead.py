@@ -0,0 +1,178 @@
+"""
+자주 조회되는 캐시 항목을 만료 직전에 미리 갱신하는 refresh-ahead 스케줄러.
+
+키별 조회 빈도를 지수 감쇠 LFU 점수로 추적하고, 점수 상위 항목 중 만료가 임박한 것을
+분당 업스트림 호출 예산 안에서 백그라운드 스레드가 다시 받아옵니다.
+"""
+
+import logging
+import threading
+import time
+from collections import deque
+from typing import Any, Callable, Deque, Dict, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+
+class HotnessTracker:
+    """
+    감쇠 LFU 카운터.
+
+    점수는 조회마다 1 씩 늘고 half_life 초마다 절반으로 줄어듭니다.
+    추적 키가 max_keys 를 넘으면 점수가 낮은 키부터 버립니다.
+    """
+
+    def __init__(self, half_life: float = 3600.0, max_keys: int = 5000):
+        self.half_life = float(half_life)
+        self.max_keys = int(max_keys)
+        self._lock = threading.Lock()
+        # key -> [점수, 마지막 갱신 시각, payload]
+        self._scores: Dict[str, List[Any]] = {}
+
+    def _decayed(self, score: float, updated: float, now: float) -> float:
+        return score * 0.5 ** ((now - updated) / self.half_life)
+
+    def record(self, key: str, payload: Any) -> None:
+        now = time.monotonic()
+        with self._lock:
+            slot = self._scores.get(key)
+            if slot is None:
+                self._scores[key] = [1.0, now, payload]
+                if len(self._scores) > self.max_keys:
+                    self._trim(now)
+            else:
+                slot[0] = self._decayed(slot[0], slot[1], now) + 1.0
+                slot[1] = now
+                slot[2] = payload
+
+    def top(self, n: int) -> List[Tuple[str, Any, float]]:
+        """감쇠 점수 상위 n 개의 (key, payload, 점수)."""
+        now = time.monotonic()
+        with self._lock:
+            ranked = [
+                (key, payload, self._decayed(score, updated, now))
+                for key, (score, updated, payload) in self._scores.items()
+            ]
+        ranked.sort(key=lambda item: -item[2])
+        return ranked[:n]
+
+    def forget(self, key: str) -> None:
+        with self._lock:
+            self._scores.pop(key, None)
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._scores)
+
+    def _trim(self, now: float) -> None:
+        # 90% 까지 줄여 매 조회마다 정렬하지 않도록 함
+        keep = int(self.max_keys * 0.9)
+        ranked = sorted(self._scores, key=lambda k: -self._decayed(self._scores[k][0], self._scores[k][1], now))
+        for key in ranked[keep:]:
+            del self._scores[key]
+
+
+class RefreshAheadScheduler:
+    """
+    점수 상위 top 개 중 만료까지 lead 초 이하로 남은 항목을 refresh(key, payload) 로 갱신합니다.
+
+    expires_in(key) 는 캐시 항목의 남은 신선 시간(초)을 반환하며, 캐시에 없으면 None 입니다.
+    업스트림 호출은 최근 60초 동안 budget 회로 제한됩니다. 스레드는 첫 record() 때 시작합니다.
+    """
+
+    def __init__(
+        self,
+        refresh: Callable[[str, Any], None],
+        expires_in: Callable[[str], Optional[float]],
+        top: int = 300,
+        lead: float = 300.0,
+        budget: int = 60,
+        interval: float = 15.0,
+        half_life: float = 3600.0,
+    ):
+        self.refresh = refresh
+        self.expires_in = expires_in
+        self.top = int(top)
+        self.lead = float(lead)
+        self.budget = int(budget)
+        self.interval = float(interval)
+        self.tracker = HotnessTracker(half_life=half_life, max_keys=max(self.top * 10, 1000))
+        self._spent: Deque[float] = deque()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._lock = threading.Lock()
+        self.refreshed = 0
+        self.failed = 0
+        self.deferred = 0
+
+    def record(self, key: str, payload: Any) -> None:
+        self.tracker.record(key, payload)
+        if self._thread is None:
+            self._start()
+
+    def forget(self, key: str) -> None:
+        """key 를 더 이상 추적하지 않습니다 (다시 record() 되기 전까지 갱신 대상에서 제외)."""
+        self.tracker.forget(key)
+
+    def run_once(self) -> int:
+        """한 번 훑어 갱신한 항목 수를 반환합니다."""
+        done = 0
+        for key, payload, _score in self.tracker.top(self.top):
+            if self._stop.is_set():
+                break
+            remaining = self.expires_in(key)
+            if remaining is None or remaining > self.lead:
+                continue
+            if not self._take_budget():
+                self.deferred += 1
+                break
+            try:
+                self.refresh(key, payload)
+                self.refreshed += 1
+                done += 1
+            except Exception as e:
+                self.failed += 1
+                logger.debug(f"refresh-ahead 실패: {key}: {e}")
+        return done
+
+    def stop(self) -> None:
+        self._stop.set()
+
+    def stats(self) -> Dict[str, Any]:
+        now = time.monotonic()
+        with self._lock:
+            while self._spent and self._spent[0] <= now - 60:
+                self._spent.popleft()
+            spent = len(self._spent)
+        return {
+            "tracked": len(self.tracker),
+            "refreshed": self.refreshed,
+            "failed": self.failed,
+            "deferred": self.deferred,
+            "budgetPerMinute": self.budget,
+            "spentLastMinute": spent,
+        }
+
+    def _take_budget(self) -> bool:
+        now = time.monotonic()
+        with self._lock:
+            while self._spent and self._spent[0] <= now - 60:
+                self._spent.popleft()
+            if len(self._spent) >= self.budget:
+                return False
+            self._spent.append(now)
+            return True
+
+    def _start(self) -> None:
+        with self._lock:
+            if self._thread is not None:
+                return
+            self._thread = threading.Thread(target=self._loop, name="druginfo-refresh-ahead", daemon=True)
+            self._thread.start()
+
+    def _loop(self) -> None:
+        while not self._stop.wait(self.interval):
+            try:
+                self.run_once()
+            except Exception as e:
+                logger.debug(f"refresh-ahead 스케줄러 오류: {e}")
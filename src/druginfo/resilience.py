@@ -0,0 +1,119 @@
+"""
+업스트림 장애 대응: 지수 백오프 + jitter 재시도 정책과 엔드포인트별 서킷 브레이커.
+
+재시도 대상은 멱등 GET 의 5xx, 커넥션 리셋, 타임아웃뿐이며 4xx 는 즉시 반환합니다.
+"""
+
+import random
+import threading
+import time
+from typing import Any, Dict, NamedTuple, Optional
+
+from src.utils.config import Config
+
+# 재시도할 HTTP 상태 코드 (501 Not Implemented 는 재시도해도 같은 결과)
+RETRYABLE_STATUS = frozenset({500, 502, 503, 504})
+
+
+class RetryPolicy(NamedTuple):
+    # 첫 시도를 제외한 최대 재시도 횟수
+    retries: int = 2
+    base_delay: float = 0.3
+    max_delay: float = 3.0
+
+    def delay(self, attempt: int, retry_after: Optional[str] = None) -> float:
+        """attempt 번째(0 부터) 재시도 전 대기 시간. full jitter, Retry-After(초) 가 있으면 상한 내에서 따름."""
+        if retry_after:
+            try:
+                return min(max(float(retry_after), 0.0), self.max_delay)
+            except ValueError:
+                pass
+        return random.uniform(0.0, min(self.max_delay, self.base_delay * (2 ** attempt)))
+
+
+class CircuitBreaker:
+    """
+    연속 실패가 threshold 회에 도달하면 reset_timeout 동안 요청을 즉시 거절합니다.
+
+    reset_timeout 이 지나면 요청 하나만 시험 삼아 통과시키고(half-open),
+    성공하면 닫히고 실패하면 다시 reset_timeout 동안 열립니다.
+    """
+
+    def __init__(self, threshold: int = 5, reset_timeout: float = 30.0):
+        self.threshold = int(threshold)
+        self.reset_timeout = float(reset_timeout)
+        self._lock = threading.Lock()
+        self._failures = 0
+        self._opened_at: Optional[float] = None
+
+    def allow(self) -> bool:
+        if self.threshold <= 0:
+            return True
+        with self._lock:
+            if self._opened_at is None:
+                return True
+            now = time.monotonic()
+            if now - self._opened_at >= self.reset_timeout:
+                # 시험 요청 1개만 통과시키고 타이머를 다시 시작
+                self._opened_at = now
+                return True
+            return False
+
+    def retry_in(self) -> float:
+        """다시 시도할 수 있을 때까지 남은 초."""
+        with self._lock:
+            if self._opened_at is None:
+                return 0.0
+            return max(self.reset_timeout - (time.monotonic() - self._opened_at), 0.0)
+
+    def record_success(self) -> None:
+        with self._lock:
+            self._failures = 0
+            self._opened_at = None
+
+    def record_failure(self) -> None:
+        with self._lock:
+            self._failures += 1
+            if self.threshold > 0 and self._failures >= self.threshold:
+                self._opened_at = time.monotonic()
+
+    @property
+    def state(self) -> str:
+        with self._lock:
+            return "closed" if self._opened_at is None else "open"
+
+    def stats(self) -> Dict[str, Any]:
+        return {"state": self.state, "failures": self._failures, "retryIn": round(self.retry_in(), 1)}
+
+
+_BREAKERS: Dict[str, CircuitBreaker] = {}
+_BREAKERS_LOCK = threading.Lock()
+_RETRY_POLICY: Optional[RetryPolicy] = None
+
+
+def retry_policy() -> RetryPolicy:
+    global _RETRY_POLICY
+    if _RETRY_POLICY is None:
+        config = Config()
+        _RETRY_POLICY = RetryPolicy(config.retry_max, config.retry_base_delay, config.retry_max_delay)
+    return _RETRY_POLICY
+
+
+def breaker_for(endpoint: str) -> CircuitBreaker:
+    """엔드포인트 이름별 프로세스 전역 서킷 브레이커."""
+    breaker = _BREAKERS.get(endpoint)
+    if breaker is not None:
+        return breaker
+    with _BREAKERS_LOCK:
+        breaker = _BREAKERS.get(endpoint)
+        if breaker is None:
+            config = Config()
+            breaker = CircuitBreaker(config.breaker_threshold, config.breaker_reset_timeout)
+            _BREAKERS[endpoint] = breaker
+        return breaker
+
+
+def breaker_stats() -> Dict[str, Dict[str, Any]]:
+    with _BREAKERS_LOCK:
+        breakers = dict(_BREAKERS)
+    return {endpoint: breaker.stats() for endpoint, breaker in breakers.items()}
@@ -0,0 +1,107 @@
+"""동일한 업스트림 요청의 동시 실행을 1회로 합치는 single-flight 유틸리티."""
+
+import asyncio
+import copy
+import threading
+from typing import Any, Awaitable, Callable, Dict, Hashable, Optional, Tuple
+
+
+class _Call:
+    __slots__ = ("event", "result", "error", "shared")
+
+    def __init__(self):
+        self.event = threading.Event()
+        self.result: Any = None
+        self.error: Optional[BaseException] = None
+        self.shared = False
+
+
+class SingleFlight:
+    """
+    스레드용 single-flight 그룹.
+
+    같은 key 로 동시에 들어온 호출 중 첫 번째(leader)만 fn 을 실행하고,
+    나머지는 그 결과 또는 예외를 그대로 돌려받습니다. 결과는 호출자마다 복사본을 반환합니다.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._calls: Dict[Hashable, _Call] = {}
+
+    def do(self, key: Hashable, fn: Callable[[], Any]) -> Any:
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = _Call()
+                self._calls[key] = call
+            else:
+                call.shared = True
+        if not leader:
+            call.event.wait()
+            if call.error is not None:
+                raise call.error
+            return copy.deepcopy(call.result)
+        try:
+            call.result = fn()
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                self._calls.pop(key, None)
+            call.event.set()
+        return copy.deepcopy(call.result) if call.shared else call.result
+
+    def in_flight(self) -> int:
+        with self._lock:
+            return len(self._calls)
+
+
+class _AsyncCall:
+    __slots__ = ("task", "waiters")
+
+    def __init__(self, task: "asyncio.Task[Any]"):
+        self.task = task
+        self.waiters = 0
+
+
+class AsyncSingleFlight:
+    """
+    asyncio 용 single-flight 그룹.
+
+    공유 작업은 별도 Task 로 실행되므로 한 호출자가 취소되어도 다른 대기자에게 영향이 없고,
+    모든 대기자가 취소되면 공유 작업도 취소됩니다.
+    """
+
+    def __init__(self):
+        self._calls: Dict[Tuple[int, Hashable], _AsyncCall] = {}
+
+    async def do(self, key: Hashable, fn: Callable[[], Awaitable[Any]]) -> Any:
+        loop = asyncio.get_running_loop()
+        slot = (id(loop), key)
+        call = self._calls.get(slot)
+        if call is None:
+            call = _AsyncCall(loop.create_task(fn()))
+            self._calls[slot] = call
+            call.task.add_done_callback(lambda _t, c=call: self._release(slot, c))
+        call.waiters += 1
+        try:
+            result = await asyncio.shield(call.task)
+        finally:
+            call.waiters -= 1
+            if call.waiters == 0 and not call.task.done():
+                call.task.cancel()
+                if self._calls.get(slot) is call:
+                    del self._calls[slot]
+        return copy.deepcopy(result)
+
+    def in_flight(self) -> int:
+        return len(self._calls)
+
+    def _release(self, slot: Tuple[int, Hashable], call: _AsyncCall) -> None:
+        if self._calls.get(slot) is call:
+            del self._calls[slot]
+        if not call.task.cancelled():
+            # 대기자가 모두 사라진 뒤 실패한 경우 "exception was never retrieved" 경고 방지
+            call.task.exception()
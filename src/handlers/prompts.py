@@ -148,6 +148,10 @@ def setup_prompt_handlers(server: Server):
    druginfo_get_product_by_code(code="선택한_ProductCode")
    → 제품의 상세 정보, korange 필드, 이미지 정보 등 제공
 
+   // 한 번에: 검색 + 상위 N개 상세 조회
+   druginfo_search_and_get_products(pillName="타이레놀", top=3)
+   → products[] 에 검색 순서대로 상세 정보와 korange
+
 3. 주성분 정보 조회:
    druginfo_list_main_ingredient(ingredientNameKor="실데나필", PageSize=10)
 
@@ -197,6 +201,8 @@ def setup_prompt_handlers(server: Server):
        MasterIngredientCode="주성분코드"
    )
 
+1~3 단계는 druginfo_search_and_get_products(pillName="{product_name}", top=3) 한 번으로 수행할 수 있습니다.
+
 이 과정을 통해 제품명, 제조사, 성분, 용량, 생동성 정보, 이미지 등을 종합적으로 제공할 수 있습니다.""",
                     ),
                 ),
@@ -2,21 +2,24 @@
 도구 핸들러 - DrugInfo API 도구들을 MCP 도구로 변환
 """
 
+import asyncio
 import logging
-from typing import Any, Dict, List
+from typing import Any, Awaitable, Callable, Dict, List
 
 from mcp.server import Server
 from mcp.types import Tool
 
 from src.druginfo import (
-    list_main_ingredient,
-    get_main_ingredient_by_code,
-    list_product,
-    get_product_by_code,
-    list_product_edicode_same_ingredient,
+    async_list_main_ingredient,
+    async_get_main_ingredient_by_code,
+    async_list_product,
+    async_get_product_by_code,
+    async_list_product_edicode_same_ingredient,
     UnauthorizedError,
     DrugInfoError,
+    DeadlineExceededError,
 )
+from src.utils.deadline import DeadlineExceeded, deadline_scope
 
 logger = logging.getLogger(__name__)
 
@@ -81,6 +84,30 @@ def _get_schema(tool_name: str) -> Dict[str, Any]:
     return schema
 
 
+async def _call_with_reauth(
+    auth_manager,
+    fn: Callable[..., Awaitable[Dict[str, Any]]],
+    **kwargs: Any,
+) -> Dict[str, Any]:
+    """비동기 API 호출, 401 이면 자동 로그인 후 1회 재시도. 전체 시간은 EDB_DEADLINE 이내"""
+    budget = auth_manager.config.call_deadline
+
+    async def _call() -> Dict[str, Any]:
+        await auth_manager.wait_for_login()
+        try:
+            return await fn(**kwargs)
+        except UnauthorizedError as e:
+            await auth_manager.reauthenticate(e.generation)
+            return await fn(**kwargs)
+
+    with deadline_scope(budget) as deadline:
+        try:
+            # 바깥 범위의 마감이 더 이르면 그 남은 시간까지만
+            return await asyncio.wait_for(_call(), timeout=deadline.remaining())
+        except (asyncio.TimeoutError, DeadlineExceeded):
+            raise DeadlineExceededError("요청 마감 시간을 초과했습니다")
+
+
 def setup_tool_handlers(server: Server, auth_manager):
     """도구 핸들러 설정"""
 
@@ -113,7 +140,12 @@ def setup_tool_handlers(server: Server, auth_manager):
 
     @server.call_tool()
     async def handle_call_tool(name: str, arguments: Dict[str, Any]) -> List[Dict[str, Any]]:
-        """도구 실행 - 실행 시점에 스키마 로드"""
+        """
+        도구 실행 - 실행 시점에 스키마 로드
+
+        Server 는 요청마다 별도 태스크로 핸들러를 실행하므로, 비동기 API 를 사용해
+        여러 도구 호출이 동시에 진행되며 클라이언트 취소 시 진행 중인 요청도 취소됩니다.
+        """
         logger.info(f"도구 실행: {name}, 인자: {arguments}")
 
         # 필요할 때만 상세 스키마 로드 (검증용)
@@ -137,33 +169,22 @@ def setup_tool_handlers(server: Server, auth_manager):
                 page_size = arguments.get("PageSize", 20)
                 page = arguments.get("Page", 1)
 
-                try:
-                    if search_type == "ingredient":
-                        result = list_main_ingredient(
-                            ingredientNameKor=query,
-                            PageSize=page_size,
-                            Page=page
-                        )
-                    else:  # product
-                        result = list_product(
-                            pillName=query,
-                            PageSize=page_size,
-                            Page=page
-                        )
-                except UnauthorizedError:
-                    await auth_manager.auto_login()
-                    if search_type == "ingredient":
-                        result = list_main_ingredient(
-                            ingredientNameKor=query,
-                            PageSize=page_size,
-                            Page=page
-                        )
-                    else:
-                        result = list_product(
-                            pillName=query,
-                            PageSize=page_size,
-                            Page=page
-                        )
+                if search_type == "ingredient":
+                    result = await _call_with_reauth(
+                        auth_manager,
+                        async_list_main_ingredient,
+                        ingredientNameKor=query,
+                        PageSize=page_size,
+                        Page=page,
+                    )
+                else:  # product
+                    result = await _call_with_reauth(
+                        auth_manager,
+                        async_list_product,
+                        pillName=query,
+                        PageSize=page_size,
+                        Page=page,
+                    )
                 return [{"type": "text", "text": str(result)}]
 
             # 상세 조회
@@ -171,26 +192,15 @@ def setup_tool_handlers(server: Server, auth_manager):
                 detail_type = arguments.get("type")
                 code = arguments.get("code")
 
-                try:
-                    if detail_type == "ingredient":
-                        result = get_main_ingredient_by_code(code)
-                    else:  # product
-                        result = get_product_by_code(code)
-                except UnauthorizedError:
-                    await auth_manager.auto_login()
-                    if detail_type == "ingredient":
-                        result = get_main_ingredient_by_code(code)
-                    else:
-                        result = get_product_by_code(code)
+                if detail_type == "ingredient":
+                    result = await _call_with_reauth(auth_manager, async_get_main_ingredient_by_code, code=code)
+                else:  # product
+                    result = await _call_with_reauth(auth_manager, async_get_product_by_code, code=code)
                 return [{"type": "text", "text": str(result)}]
 
             # 동일 성분 검색
             elif name == "find_same_ingredient":
-                try:
-                    result = list_product_edicode_same_ingredient(**arguments)
-                except UnauthorizedError:
-                    await auth_manager.auto_login()
-                    result = list_product_edicode_same_ingredient(**arguments)
+                result = await _call_with_reauth(auth_manager, async_list_product_edicode_same_ingredient, **arguments)
                 return [{"type": "text", "text": str(result)}]
 
             else:
@@ -2,17 +2,17 @@ import os
 from dotenv import load_dotenv
 from mcp.server.fastmcp import FastMCP
 
+# Load env once, before the package imports: src.druginfo builds its cache, limiter and
+# bulkheads from Config() at import time, so EDB_* settings in .env must already be set
+load_dotenv(".env", override=False)
+load_dotenv(".env.local", override=False)
+
 from src.mcp_tools import (
     register_auth_tools,
     register_druginfo_tools,
 )
 
 
-# Load env once
-load_dotenv(".env", override=False)
-load_dotenv(".env.local", override=False)
-
-
 def register_system_prompts(mcp: FastMCP) -> None:
     """DrugInfo MCP 도구 사용 가이드라인을 시스템 프롬프트로 등록"""
     @mcp.prompt()
@@ -31,7 +31,7 @@ DrugInfo MCP 도구 사용 가이드라인:
    - 주성분코드/EDI코드/제품코드가 있으면 바로 활용
    - 단계적 접근: 1) 대표 제품 1건 조회 → 2) 동일성분군 조회
    - 생동PK 필터링은 응답 후 korange.생동PK 필드로 로컬 처리
-   - 의약품 이름 질의 시: pillName으로 검색 → ProductCode 추출 → 상세 정보 제공
+   - 의약품 이름 질의 시: druginfo_search_and_get_products(pillName=...)로 검색과 상위 제품 상세 조회를 한 번에 수행
 
 3. 도구별 사용법:
    - login: 환경변수 설정 시 인자 생략 가능, force=true로 중복로그인 해결
@@ -39,6 +39,8 @@ DrugInfo MCP 도구 사용 가이드라인:
    - druginfo_list_product: 제품 검색, pillName 또는 q 사용
    - druginfo_list_product_edicode_same_ingredient: 동일성분 검색 (토큰 절약)
    - druginfo_get_*_by_code: 상세 조회, code 필수
+   - druginfo_get_products_by_codes / druginfo_get_main_ingredients_by_codes: 코드 여러 개 상세를 한 번에 조회 (코드마다 도구를 따로 호출하지 말 것)
+   - druginfo_batch: 서로 의존하지 않는 도구 호출 여러 개(예: 제품 상세 + 동일성분 목록 + 주성분 상세)를 한 번에 실행
 
 4. 응답 처리:
    - korange 필드: 생물학적동등성 정보 (생동PK, 제네릭, 공공대조약 등)
@@ -103,6 +105,13 @@ DrugInfo 자주 사용하는 쿼리 패턴:
      "code": "선택한_ProductCode"
    })
    → 제품의 상세 정보, korange 필드, 이미지 정보 등 제공
+
+   // 한 번에: 검색 + 상위 N개 상세 (위 두 단계를 도구 호출 1회로)
+   druginfo_search_and_get_products({
+     "pillName": "타이레놀",
+     "top": 3
+   })
+   → products[] 에 검색 순서대로 상세 정보와 korange, total 에 전체 검색 수
    ```
 
 3. 주성분 정보 조회:
@@ -153,10 +162,9 @@ DrugInfo 자주 사용하는 쿼리 패턴:
 
 9. 의약품 이름 질의 처리 워크플로우:
    - 사용자가 "타이레놀 정보 알려줘" 같은 질문을 하면:
-     1) druginfo_list_product로 pillName="타이레놀" 검색 (PageSize=5-10)
-     2) 검색 결과에서 적절한 ProductCode 선택 (여러 개면 사용자에게 선택지 제시)
-     3) druginfo_get_product_by_code로 선택된 ProductCode의 상세 정보 조회
-     4) 제품명, 제조사, 성분, 용량, 생동성 정보, 이미지 등을 종합하여 응답
+     1) druginfo_search_and_get_products로 pillName="타이레놀" 검색 + 상위 제품 상세 조회 (top=3-5)
+     2) 결과가 여러 개면 사용자에게 선택지 제시, 더 필요하면 top 을 늘리거나 druginfo_list_product 로 추가 탐색
+     3) 제품명, 제조사, 성분, 용량, 생동성 정보, 이미지 등을 종합하여 응답
    - 검색 결과가 많을 때는 vendor, 용량 등으로 추가 필터링 가능
 
 10. 요양기관기호 해석:
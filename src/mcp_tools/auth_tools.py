@@ -1,42 +1,65 @@
+import asyncio
 import os
-from typing import Optional
+from typing import Callable, Optional
 
 from mcp.server.fastmcp import FastMCP
 
 try:
     from src.auth import login_and_get_token
+    from src.auth.token import get_token_store, token_identity
 except ModuleNotFoundError:
     import sys as _sys, os as _os
     _sys.path.append(_os.path.dirname(_os.path.dirname(_os.path.abspath(__file__))))
     from src.auth import login_and_get_token
+    from src.auth.token import get_token_store, token_identity
 
 
-_AUTO_TOKEN: Optional[str] = None
-
-
-def _try_auto_login(timeout: int = 15) -> Optional[str]:
-    global _AUTO_TOKEN
-    if _AUTO_TOKEN:
-        return _AUTO_TOKEN
+def _env_login(timeout: int = 15) -> Optional[Callable[[], str]]:
+    """환경변수 자격 증명으로 로그인하는 함수. 자격 증명이 없으면 None."""
     uid = os.getenv("EDB_USER_ID")
     pwd = os.getenv("EDB_PASSWORD")
     login_url = os.getenv("EDB_LOGIN_URL")
     if not uid or not pwd or not login_url:
         return None
+    return lambda: login_and_get_token(login_url, uid, pwd, False, int(timeout))
+
+
+def _reauthenticate(failed_generation: int, timeout: int = 15) -> Optional[str]:
+    """
+    failed_generation 세대 토큰이 거절되었을 때 새 토큰을 얻습니다.
+    동시에 401 을 받은 호출들 중 한 번만 로그인하고, 나머지는 그 결과를 공유합니다.
+    """
+    login = _env_login(timeout)
+    store = get_token_store()
     try:
-        tok = login_and_get_token(login_url, uid, pwd, False, int(timeout))
-        _AUTO_TOKEN = tok
-        os.environ["EDB_TOKEN"] = tok
-        return tok
+        token = store.reauthenticate(failed_generation, login)
     except Exception:
         return None
+    if token and login is not None:
+        store.enable_refresh(login)
+    return token
+
+
+def _try_auto_login(timeout: int = 15) -> Optional[str]:
+    store = get_token_store()
+    if store.is_fresh():
+        # 토큰 파일/EDB_TOKEN 에서 가져온 토큰도 만료 전 갱신 대상
+        login = _env_login(timeout)
+        if login is not None:
+            store.enable_refresh(login)
+        return store.get()
+    return _reauthenticate(store.generation, timeout)
 
 
 def register_auth_tools(mcp: FastMCP) -> None:
-    # 서버 시작 시 1회 자동 로그인 시도 (환경변수가 있는 경우)
-    _try_auto_login()
+    # 서버 시작 시 1회 자동 로그인 시도 (환경변수가 있는 경우). 핸드셰이크를 막지 않도록 백그라운드에서 실행
+    store = get_token_store()
+    if store.is_fresh():
+        _try_auto_login()
+    elif _env_login() is not None:
+        store.start_login(_try_auto_login)
     @mcp.tool()
-    def login(
+    async def login(
         userId: Optional[str] = None,
         password: Optional[str] = None,
         force: bool = False,
@@ -49,9 +72,11 @@ def register_auth_tools(mcp: FastMCP) -> None:
         pwd = password or os.getenv("EDB_PASSWORD")
         if not uid or not pwd:
             raise RuntimeError("userId/password 가 필요합니다. (또는 EDB_USER_ID/EDB_PASSWORD 설정)")
-        token = login_and_get_token(login_url, uid, pwd, bool(force), int(timeout))
-        # 최신 토큰을 캐시에 반영해 도구들이 재사용하도록 함
-        global _AUTO_TOKEN
-        _AUTO_TOKEN = token
-        os.environ["EDB_TOKEN"] = token
+        token = await asyncio.to_thread(login_and_get_token, login_url, uid, pwd, bool(force), int(timeout))
+        # 최신 토큰을 저장소에 반영해 도구들이 재사용하도록 하고, 같은 자격 증명으로 만료 전 갱신 예약.
+        # 토큰 파일에는 실제로 로그인한 사용자로 기록해 재시작 후 설정된 사용자의 토큰으로 쓰이지 않게 함
+        identity = token_identity(login_url, uid)
+        store = get_token_store()
+        store.set(token, identity)
+        store.enable_refresh(lambda: login_and_get_token(login_url, uid, pwd, False, int(timeout)), identity)
         return token
\ No newline at end of file
@@ -1,25 +1,37 @@
-from typing import Optional, Dict, Any
+import asyncio
+from typing import Any, Awaitable, Callable, Dict, List, Optional
 
 from mcp.server.fastmcp import FastMCP
+from mcp.server.fastmcp.exceptions import ToolError
+from mcp.server.fastmcp.tools import Tool
 
 from src.druginfo import (
-    list_main_ingredient,
-    get_main_ingredient_by_code,
-    list_product,
-    get_product_by_code,
     UnauthorizedError,
     DrugInfoError,
-    list_main_ingredient_drug_effect,
-    get_main_ingredient_drug_effect_by_id,
-    list_main_ingredient_drug_kind,
-    list_main_ingredient_guide_a4,
-    list_main_ingredient_guide_a5,
-    list_main_ingredient_picto,
-    get_main_ingredient_picto_by_code,
-    list_product_edicode,
-    list_product_edicode_same_ingredient,
+    async_list_main_ingredient,
+    async_get_main_ingredient_by_code,
+    async_list_product,
+    async_get_product_by_code,
+    async_list_main_ingredient_drug_effect,
+    async_get_main_ingredient_drug_effect_by_id,
+    async_list_main_ingredient_drug_kind,
+    async_list_main_ingredient_guide_a4,
+    async_list_main_ingredient_guide_a5,
+    async_list_main_ingredient_picto,
+    async_get_main_ingredient_picto_by_code,
+    async_list_product_edicode,
+    async_list_product_edicode_same_ingredient,
+    async_get_main_ingredients_by_codes,
+    async_get_products_by_codes,
+    async_search_and_resolve_products,
+    client_stats,
 )
-from src.mcp_tools.auth_tools import _try_auto_login
+from src.druginfo.fanout import afan_out
+from src.druginfo.limits import adaptive_limiter
+from src.auth.token import get_token_store
+from src.mcp_tools.auth_tools import _reauthenticate
+from src.utils.config import Config
+from src.utils.deadline import DeadlineExceeded, deadline_scope
 from src.druginfo.response_filters import (
     compact_generic_list,
     compact_main_ingredient_detail,
@@ -41,9 +53,108 @@ def _safe_compact(compactor, payload):
         return payload
 
 
+_DEADLINE = Config().call_deadline
+
+# 배치 조회 도구 1회의 최대 코드 수 (중복 제거 후)
+_MAX_BATCH_CODES = 100
+
+# druginfo_batch 1회의 최대 하위 호출 수
+_MAX_BATCH_CALLS = 20
+
+
+def _batch_error(e: Exception) -> Exception:
+    """
+    Tool.run 이 ToolError 로 감싼 하위 호출 예외에서 원래 예외를 꺼냅니다.
+    _invoke 가 RuntimeError 로 바꾼 DrugInfoError 까지 찾아 fan-out 한도가 과부하 오류로 인식하게 합니다.
+    """
+    cause = e.__cause__ or e
+    inner: Optional[BaseException] = cause
+    while inner is not None:
+        if isinstance(inner, DrugInfoError):
+            return inner
+        inner = inner.__cause__ or inner.__context__
+    return cause if isinstance(cause, Exception) else e
+
+
+def _compact_batch(compactor):
+    """코드 → 응답/오류 dict 를 {"results": 코드별 압축 응답, "errors": 코드별 오류 메시지} 로 변환."""
+
+    def compact(batch: Dict[str, Any]) -> Dict[str, Any]:
+        results: Dict[str, Any] = {}
+        errors: Dict[str, str] = {}
+        for code, outcome in batch.items():
+            if isinstance(outcome, Exception):
+                errors[code] = str(outcome)
+            else:
+                results[code] = _safe_compact(compactor, outcome)
+        return {"results": results, "errors": errors}
+
+    return compact
+
+
+def _compact_resolution(resolution) -> Dict[str, Any]:
+    """검색 목록 + 상세를 검색 순서대로 하나의 제품 목록으로 합칩니다. 상세 조회에 실패한 제품은 목록 요약과 error."""
+    listing = _safe_compact(compact_product_list, resolution.listing)
+    summaries = {item.get("code"): item for item in listing.get("items", []) if isinstance(item, dict)}
+    products = []
+    for code, outcome in resolution.details.items():
+        if isinstance(outcome, Exception):
+            products.append({**summaries.get(code, {"code": code}), "error": str(outcome)})
+        else:
+            products.append(_safe_compact(compact_product_detail, outcome))
+    payload: Dict[str, Any] = {"products": products}
+    if "total" in listing:
+        payload["total"] = listing["total"]
+    return payload
+
+
+def _batch_codes(codes: List[str]) -> List[str]:
+    unique = list(dict.fromkeys(code.strip() for code in codes if code and code.strip()))
+    if len(unique) > _MAX_BATCH_CODES:
+        raise RuntimeError(f"codes 는 최대 {_MAX_BATCH_CODES}개까지 조회할 수 있습니다 (요청: {len(unique)}개)")
+    return unique
+
+
+async def _invoke(
+    fn: Callable[..., Awaitable[Dict[str, Any]]],
+    compactor,
+    timeout: int,
+    **kwargs: Any,
+) -> Dict[str, Any]:
+    """
+    비동기 API 호출 + 401 시 자동 재로그인 1회 재시도 + 응답 압축.
+
+    timeout 은 요청 1회의 소켓 타임아웃이고, 재로그인과 재시도를 포함한 전체 시간은
+    EDB_DEADLINE 으로 제한됩니다.
+    """
+
+    async def _call() -> Dict[str, Any]:
+        # 서버 시작 직후라면 백그라운드 로그인이 끝날 때까지만 대기
+        await get_token_store().await_login()
+        try:
+            return await fn(timeout=int(timeout), **kwargs)
+        except UnauthorizedError as e:
+            # 같은 토큰 세대로 실패한 동시 호출들은 로그인 1회를 공유
+            await asyncio.to_thread(_reauthenticate, e.generation, timeout)
+            return await fn(timeout=int(timeout), **kwargs)
+
+    with deadline_scope(_DEADLINE) as deadline:
+        try:
+            # 협조적 마감 검사가 닿지 않는 대기(bulkhead, single-flight)까지 포함해 상한 보장.
+            # druginfo_batch 처럼 바깥 범위의 마감이 더 이르면 그 남은 시간까지만
+            payload = await asyncio.wait_for(_call(), timeout=deadline.remaining())
+        except (asyncio.TimeoutError, DeadlineExceeded):
+            raise RuntimeError("요청 마감 시간을 초과했습니다")
+        except DrugInfoError as e:
+            raise RuntimeError(str(e))
+    return _safe_compact(compactor, payload)
+
+
 def register_druginfo_tools(mcp: FastMCP) -> None:
+    # 모든 도구는 async 로 등록되어 이벤트 루프를 막지 않고 동시에 실행되며,
+    # 클라이언트가 요청을 취소하면 진행 중인 업스트림 호출도 함께 취소됩니다.
     @mcp.tool(name="druginfo_list_main_ingredient")
-    def druginfo_list_main_ingredient(
+    async def druginfo_list_main_ingredient(
         a4: Optional[bool] = None,
         a4Off: Optional[bool] = None,
         a5: Optional[bool] = None,
@@ -70,78 +181,36 @@ def register_druginfo_tools(mcp: FastMCP) -> None:
         effective_page_size = PageSize if PageSize is not None else (size if size is not None else default_page_size)
         effective_page = Page if Page is not None else (page if page is not None else default_page)
 
-        try:
-            return _safe_compact(
-                compact_main_ingredient_list,
-                list_main_ingredient(
-                    a4=a4,
-                    a4Off=a4Off,
-                    a5=a5,
-                    a5Off=a5Off,
-                    drugkind=drugkind,
-                    drugkindOff=drugkindOff,
-                    effect=effect,
-                    effectOff=effectOff,
-                    showMapped=showMapped,
-                    IngredientCode=IngredientCode,
-                    ingredientNameKor=ingredientNameKor,
-                    drugKind=drugKind,
-                    PageSize=effective_page_size,
-                    Page=effective_page,
-                    SortBy=SortBy,
-                    q=q,
-                    page=page,
-                    size=size,
-                    timeout=int(timeout),
-                ),
-            )
-        except UnauthorizedError:
-            _try_auto_login(timeout)
-            return _safe_compact(
-                compact_main_ingredient_list,
-                list_main_ingredient(
-                    a4=a4,
-                    a4Off=a4Off,
-                    a5=a5,
-                    a5Off=a5Off,
-                    drugkind=drugkind,
-                    drugkindOff=drugkindOff,
-                    effect=effect,
-                    effectOff=effectOff,
-                    showMapped=showMapped,
-                    IngredientCode=IngredientCode,
-                    ingredientNameKor=ingredientNameKor,
-                    drugKind=drugKind,
-                    PageSize=effective_page_size,
-                    Page=effective_page,
-                    SortBy=SortBy,
-                    q=q,
-                    page=page,
-                    size=size,
-                    timeout=int(timeout),
-                ),
-            )
-        except DrugInfoError as e:
-            raise RuntimeError(str(e))
+        return await _invoke(
+            async_list_main_ingredient,
+            compact_main_ingredient_list,
+            timeout,
+            a4=a4,
+            a4Off=a4Off,
+            a5=a5,
+            a5Off=a5Off,
+            drugkind=drugkind,
+            drugkindOff=drugkindOff,
+            effect=effect,
+            effectOff=effectOff,
+            showMapped=showMapped,
+            IngredientCode=IngredientCode,
+            ingredientNameKor=ingredientNameKor,
+            drugKind=drugKind,
+            PageSize=effective_page_size,
+            Page=effective_page,
+            SortBy=SortBy,
+            q=q,
+            page=page,
+            size=size,
+        )
 
     @mcp.tool(name="druginfo_get_main_ingredient_by_code")
-    def druginfo_get_main_ingredient_by_code(code: str, timeout: int = 15) -> Dict[str, Any]:
-        try:
-            return _safe_compact(
-                compact_main_ingredient_detail,
-                get_main_ingredient_by_code(code=code, timeout=int(timeout)),
-            )
-        except UnauthorizedError:
-            _try_auto_login(timeout)
-            return _safe_compact(
-                compact_main_ingredient_detail,
-                get_main_ingredient_by_code(code=code, timeout=int(timeout)),
-            )
-        except DrugInfoError as e:
-            raise RuntimeError(str(e))
+    async def druginfo_get_main_ingredient_by_code(code: str, timeout: int = 15) -> Dict[str, Any]:
+        return await _invoke(async_get_main_ingredient_by_code, compact_main_ingredient_detail, timeout, code=code)
 
     @mcp.tool(name="druginfo_list_product")
-    def druginfo_list_product(
+    async def druginfo_list_product(
         crop: Optional[bool] = None,
         cropOff: Optional[bool] = None,
         base64: Optional[bool] = None,
@@ -172,86 +241,40 @@ def register_druginfo_tools(mcp: FastMCP) -> None:
         effective_page_size = PageSize if PageSize is not None else (size if size is not None else default_page_size)
         effective_page = Page if Page is not None else (page if page is not None else default_page)
 
-        try:
-            return _safe_compact(
-                compact_product_list,
-                list_product(
-                    crop=crop,
-                    cropOff=cropOff,
-                    base64=base64,
-                    base64Off=base64Off,
-                    watermark=watermark,
-                    watermarkOff=watermarkOff,
-                    confirm=confirm,
-                    confirmOff=confirmOff,
-                    teoulLengthShort=teoulLengthShort,
-                    teoulLengthShortOff=teoulLengthShortOff,
-                    teoulLengthLong=teoulLengthLong,
-                    teoulLengthLongOff=teoulLengthLongOff,
-                    minCount=minCount,
-                    ProductCode=ProductCode,
-                    pillName=pillName,
-                    vendor=vendor,
-                    PageSize=effective_page_size,
-                    Page=effective_page,
-                    SortBy=SortBy,
-                    q=q,
-                    page=page,
-                    size=size,
-                    timeout=int(timeout),
-                ),
-            )
-        except UnauthorizedError:
-            _try_auto_login(timeout)
-            return _safe_compact(
-                compact_product_list,
-                list_product(
-                    crop=crop,
-                    cropOff=cropOff,
-                    base64=base64,
-                    base64Off=base64Off,
-                    watermark=watermark,
-                    watermarkOff=watermarkOff,
-                    confirm=confirm,
-                    confirmOff=confirmOff,
-                    teoulLengthShort=teoulLengthShort,
-                    teoulLengthShortOff=teoulLengthShortOff,
-                    teoulLengthLong=teoulLengthLong,
-                    teoulLengthLongOff=teoulLengthLongOff,
-                    minCount=minCount,
-                    ProductCode=ProductCode,
-                    pillName=pillName,
-                    vendor=vendor,
-                    PageSize=effective_page_size,
-                    Page=effective_page,
-                    SortBy=SortBy,
-                    q=q,
-                    page=page,
-                    size=size,
-                    timeout=int(timeout),
-                ),
-            )
-        except DrugInfoError as e:
-            raise RuntimeError(str(e))
+        return await _invoke(
+            async_list_product,
+            compact_product_list,
+            timeout,
+            crop=crop,
+            cropOff=cropOff,
+            base64=base64,
+            base64Off=base64Off,
+            watermark=watermark,
+            watermarkOff=watermarkOff,
+            confirm=confirm,
+            confirmOff=confirmOff,
+            teoulLengthShort=teoulLengthShort,
+            teoulLengthShortOff=teoulLengthShortOff,
+            teoulLengthLong=teoulLengthLong,
+            teoulLengthLongOff=teoulLengthLongOff,
+            minCount=minCount,
+            ProductCode=ProductCode,
+            pillName=pillName,
+            vendor=vendor,
+            PageSize=effective_page_size,
+            Page=effective_page,
+            SortBy=SortBy,
+            q=q,
+            page=page,
+            size=size,
+        )
 
     @mcp.tool(name="druginfo_get_product_by_code")
-    def druginfo_get_product_by_code(code: str, timeout: int = 15) -> Dict[str, Any]:
-        try:
-            return _safe_compact(
-                compact_product_detail,
-                get_product_by_code(code=code, timeout=int(timeout)),
-            )
-        except UnauthorizedError:
-            _try_auto_login(timeout)
-            return _safe_compact(
-                compact_product_detail,
-                get_product_by_code(code=code, timeout=int(timeout)),
-            )
-        except DrugInfoError as e:
-            raise RuntimeError(str(e))
+    async def druginfo_get_product_by_code(code: str, timeout: int = 15) -> Dict[str, Any]:
+        return await _invoke(async_get_product_by_code, compact_product_detail, timeout, code=code)
 
     @mcp.tool(name="druginfo_list_main_ingredient_drug_effect")
-    def druginfo_list_main_ingredient_drug_effect(
+    async def druginfo_list_main_ingredient_drug_effect(
         edit: Optional[str] = None,
         pageSize: Optional[int] = None,
         page: Optional[int] = None,
@@ -262,155 +285,217 @@ def register_druginfo_tools(mcp: FastMCP) -> None:
             pageSize = 10
         if page is None:
             page = 1
-        try:
-            return _safe_compact(
-                compact_generic_list,
-                list_main_ingredient_drug_effect(edit=edit, pageSize=pageSize, page=page, sortBy=sortBy, timeout=int(timeout)),
-            )
-        except UnauthorizedError:
-            _try_auto_login(timeout)
-            return _safe_compact(
-                compact_generic_list,
-                list_main_ingredient_drug_effect(edit=edit, pageSize=pageSize, page=page, sortBy=sortBy, timeout=int(timeout)),
-            )
-        except DrugInfoError as e:
-            raise RuntimeError(str(e))
+        return await _invoke(
+            async_list_main_ingredient_drug_effect,
+            compact_generic_list,
+            timeout,
+            edit=edit, pageSize=pageSize, page=page, sortBy=sortBy,
+        )
 
     @mcp.tool(name="druginfo_get_main_ingredient_drug_effect_by_id")
-    def druginfo_get_main_ingredient_drug_effect_by_id(effectId: int, timeout: int = 15) -> Dict[str, Any]:
-        try:
-            return get_main_ingredient_drug_effect_by_id(effect_id=int(effectId), timeout=int(timeout))
-        except UnauthorizedError:
-            _try_auto_login(timeout)
-            return get_main_ingredient_drug_effect_by_id(effect_id=int(effectId), timeout=int(timeout))
-        except DrugInfoError as e:
-            raise RuntimeError(str(e))
+    async def druginfo_get_main_ingredient_drug_effect_by_id(effectId: int, timeout: int = 15) -> Dict[str, Any]:
+        return await _invoke(async_get_main_ingredient_drug_effect_by_id, None, timeout, effect_id=int(effectId))
 
     @mcp.tool(name="druginfo_list_main_ingredient_drug_kind")
-    def druginfo_list_main_ingredient_drug_kind(edit: Optional[str] = None, pageSize: Optional[int] = None, page: Optional[int] = None, sortBy: Optional[str] = None, timeout: int = 15) -> Dict[str, Any]:
+    async def druginfo_list_main_ingredient_drug_kind(edit: Optional[str] = None, pageSize: Optional[int] = None, page: Optional[int] = None, sortBy: Optional[str] = None, timeout: int = 15) -> Dict[str, Any]:
         if pageSize is None:
             pageSize = 10
         if page is None:
             page = 1
-        try:
-            return _safe_compact(
-                compact_generic_list,
-                list_main_ingredient_drug_kind(edit=edit, pageSize=pageSize, page=page, sortBy=sortBy, timeout=int(timeout)),
-            )
-        except UnauthorizedError:
-            _try_auto_login(timeout)
-            return _safe_compact(
-                compact_generic_list,
-                list_main_ingredient_drug_kind(edit=edit, pageSize=pageSize, page=page, sortBy=sortBy, timeout=int(timeout)),
-            )
-        except DrugInfoError as e:
-            raise RuntimeError(str(e))
+        return await _invoke(
+            async_list_main_ingredient_drug_kind,
+            compact_generic_list,
+            timeout,
+            edit=edit, pageSize=pageSize, page=page, sortBy=sortBy,
+        )
 
     @mcp.tool(name="druginfo_list_main_ingredient_guide_a4")
-    def druginfo_list_main_ingredient_guide_a4(edit: Optional[str] = None, pageSize: Optional[int] = None, page: Optional[int] = None, sortBy: Optional[str] = None, timeout: int = 15) -> Dict[str, Any]:
+    async def druginfo_list_main_ingredient_guide_a4(edit: Optional[str] = None, pageSize: Optional[int] = None, page: Optional[int] = None, sortBy: Optional[str] = None, timeout: int = 15) -> Dict[str, Any]:
         if pageSize is None:
             pageSize = 10
         if page is None:
             page = 1
-        try:
-            return _safe_compact(
-                compact_generic_list,
-                list_main_ingredient_guide_a4(edit=edit, pageSize=pageSize, page=page, sortBy=sortBy, timeout=int(timeout)),
-            )
-        except UnauthorizedError:
-            _try_auto_login(timeout)
-            return _safe_compact(
-                compact_generic_list,
-                list_main_ingredient_guide_a4(edit=edit, pageSize=pageSize, page=page, sortBy=sortBy, timeout=int(timeout)),
-            )
-        except DrugInfoError as e:
-            raise RuntimeError(str(e))
+        return await _invoke(
+            async_list_main_ingredient_guide_a4,
+            compact_generic_list,
+            timeout,
+            edit=edit, pageSize=pageSize, page=page, sortBy=sortBy,
+        )
 
     @mcp.tool(name="druginfo_list_main_ingredient_guide_a5")
-    def druginfo_list_main_ingredient_guide_a5(edit: Optional[str] = None, pageSize: Optional[int] = None, page: Optional[int] = None, sortBy: Optional[str] = None, timeout: int = 15) -> Dict[str, Any]:
+    async def druginfo_list_main_ingredient_guide_a5(edit: Optional[str] = None, pageSize: Optional[int] = None, page: Optional[int] = None, sortBy: Optional[str] = None, timeout: int = 15) -> Dict[str, Any]:
         if pageSize is None:
             pageSize = 10
         if page is None:
             page = 1
-        try:
-            return _safe_compact(
-                compact_generic_list,
-                list_main_ingredient_guide_a5(edit=edit, pageSize=pageSize, page=page, sortBy=sortBy, timeout=int(timeout)),
-            )
-        except UnauthorizedError:
-            _try_auto_login(timeout)
-            return _safe_compact(
-                compact_generic_list,
-                list_main_ingredient_guide_a5(edit=edit, pageSize=pageSize, page=page, sortBy=sortBy, timeout=int(timeout)),
-            )
-        except DrugInfoError as e:
-            raise RuntimeError(str(e))
+        return await _invoke(
+            async_list_main_ingredient_guide_a5,
+            compact_generic_list,
+            timeout,
+            edit=edit, pageSize=pageSize, page=page, sortBy=sortBy,
+        )
 
     @mcp.tool(name="druginfo_list_main_ingredient_picto")
-    def druginfo_list_main_ingredient_picto(IsDeleted: Optional[str] = None, Title: Optional[str] = None, PageSize: Optional[int] = None, Page: Optional[int] = None, SortBy: Optional[str] = None, timeout: int = 15) -> Dict[str, Any]:
+    async def druginfo_list_main_ingredient_picto(IsDeleted: Optional[str] = None, Title: Optional[str] = None, PageSize: Optional[int] = None, Page: Optional[int] = None, SortBy: Optional[str] = None, timeout: int = 15) -> Dict[str, Any]:
         if PageSize is None:
             PageSize = 5
         if Page is None:
             Page = 1
-        try:
-            return _safe_compact(
-                compact_generic_list,
-                list_main_ingredient_picto(IsDeleted=IsDeleted, Title=Title, PageSize=PageSize, Page=Page, SortBy=SortBy, timeout=int(timeout)),
-            )
-        except UnauthorizedError:
-            _try_auto_login(timeout)
-            return _safe_compact(
-                compact_generic_list,
-                list_main_ingredient_picto(IsDeleted=IsDeleted, Title=Title, PageSize=PageSize, Page=Page, SortBy=SortBy, timeout=int(timeout)),
-            )
-        except DrugInfoError as e:
-            raise RuntimeError(str(e))
+        return await _invoke(
+            async_list_main_ingredient_picto,
+            compact_generic_list,
+            timeout,
+            IsDeleted=IsDeleted, Title=Title, PageSize=PageSize, Page=Page, SortBy=SortBy,
+        )
 
     @mcp.tool(name="druginfo_get_main_ingredient_picto_by_code")
-    def druginfo_get_main_ingredient_picto_by_code(code: str, timeout: int = 15) -> Dict[str, Any]:
-        try:
-            return get_main_ingredient_picto_by_code(code=code, timeout=int(timeout))
-        except UnauthorizedError:
-            _try_auto_login(timeout)
-            return get_main_ingredient_picto_by_code(code=code, timeout=int(timeout))
-        except DrugInfoError as e:
-            raise RuntimeError(str(e))
+    async def druginfo_get_main_ingredient_picto_by_code(code: str, timeout: int = 15) -> Dict[str, Any]:
+        return await _invoke(async_get_main_ingredient_picto_by_code, None, timeout, code=code)
 
     @mcp.tool(name="druginfo_list_product_edicode")
-    def druginfo_list_product_edicode(ProductCode: Optional[str] = None, EdiCode: Optional[str] = None, PageSize: Optional[int] = None, Page: Optional[int] = None, SortBy: Optional[str] = None, timeout: int = 15) -> Dict[str, Any]:
+    async def druginfo_list_product_edicode(ProductCode: Optional[str] = None, EdiCode: Optional[str] = None, PageSize: Optional[int] = None, Page: Optional[int] = None, SortBy: Optional[str] = None, timeout: int = 15) -> Dict[str, Any]:
         if PageSize is None:
             PageSize = 5
         if Page is None:
             Page = 1
-        try:
-            return _safe_compact(
-                compact_product_edicode_list,
-                list_product_edicode(ProductCode=ProductCode, EdiCode=EdiCode, PageSize=PageSize, Page=Page, SortBy=SortBy, timeout=int(timeout)),
-            )
-        except UnauthorizedError:
-            _try_auto_login(timeout)
-            return _safe_compact(
-                compact_product_edicode_list,
-                list_product_edicode(ProductCode=ProductCode, EdiCode=EdiCode, PageSize=PageSize, Page=Page, SortBy=SortBy, timeout=int(timeout)),
-            )
-        except DrugInfoError as e:
-            raise RuntimeError(str(e))
+        return await _invoke(
+            async_list_product_edicode,
+            compact_product_edicode_list,
+            timeout,
+            ProductCode=ProductCode, EdiCode=EdiCode, PageSize=PageSize, Page=Page, SortBy=SortBy,
+        )
 
     @mcp.tool(name="druginfo_list_product_edicode_same_ingredient")
-    def druginfo_list_product_edicode_same_ingredient(ProductCode: Optional[str] = None, EdiCode: Optional[str] = None, MasterIngredientCode: Optional[str] = None, timeout: int = 15) -> Dict[str, Any]:
-        try:
-            return _safe_compact(
-                compact_same_ingredient_list,
-                list_product_edicode_same_ingredient(ProductCode=ProductCode, EdiCode=EdiCode, MasterIngredientCode=MasterIngredientCode, timeout=int(timeout)),
-            )
-        except UnauthorizedError:
-            _try_auto_login(timeout)
-            return _safe_compact(
-                compact_same_ingredient_list,
-                list_product_edicode_same_ingredient(ProductCode=ProductCode, EdiCode=EdiCode, MasterIngredientCode=MasterIngredientCode, timeout=int(timeout)),
-            )
-        except DrugInfoError as e:
-            raise RuntimeError(str(e))
+    async def druginfo_list_product_edicode_same_ingredient(ProductCode: Optional[str] = None, EdiCode: Optional[str] = None, MasterIngredientCode: Optional[str] = None, timeout: int = 15) -> Dict[str, Any]:
+        return await _invoke(
+            async_list_product_edicode_same_ingredient,
+            compact_same_ingredient_list,
+            timeout,
+            ProductCode=ProductCode, EdiCode=EdiCode, MasterIngredientCode=MasterIngredientCode,
+        )
 
-    # --- Non-GET tool wrappers removed (POST-only tools no longer exposed) ---
+    @mcp.tool(name="druginfo_get_products_by_codes")
+    async def druginfo_get_products_by_codes(codes: List[str], timeout: int = 15) -> Dict[str, Any]:
+        """
+        제품 코드 여러 개의 상세 정보를 한 번에 조회합니다 (최대 100개, 중복 제거, 캐시 적중 시 즉시 반환).
+        results 에 코드별 상세, errors 에 실패한 코드별 오류 메시지가 담깁니다.
+        """
+        return await _invoke(
+            async_get_products_by_codes, _compact_batch(compact_product_detail), timeout, codes=_batch_codes(codes)
+        )
 
+    @mcp.tool(name="druginfo_get_main_ingredients_by_codes")
+    async def druginfo_get_main_ingredients_by_codes(codes: List[str], timeout: int = 15) -> Dict[str, Any]:
+        """
+        주성분 코드 여러 개의 상세 정보를 한 번에 조회합니다 (최대 100개, 중복 제거, 캐시 적중 시 즉시 반환).
+        results 에 코드별 상세, errors 에 실패한 코드별 오류 메시지가 담깁니다.
+        """
+        return await _invoke(
+            async_get_main_ingredients_by_codes,
+            _compact_batch(compact_main_ingredient_detail),
+            timeout,
+            codes=_batch_codes(codes),
+        )
+
+    @mcp.tool(name="druginfo_search_and_get_products")
+    async def druginfo_search_and_get_products(
+        pillName: Optional[str] = None,
+        vendor: Optional[str] = None,
+        ProductCode: Optional[str] = None,
+        top: int = 3,
+        q: Optional[str] = None,
+        timeout: int = 15,
+    ) -> Dict[str, Any]:
+        """
+        제품을 검색하고 상위 top 개(최대 10개)의 상세 정보(korange 포함)를 함께 반환합니다.
+        druginfo_list_product → druginfo_get_product_by_code 두 단계를 한 번에 수행합니다.
+        products 는 검색 순서대로이며, total 은 검색 결과 전체 수입니다.
+        """
+        if not (pillName or vendor or ProductCode or q):
+            raise RuntimeError("pillName, vendor, ProductCode, q 중 하나가 필요합니다")
+        return await _invoke(
+            async_search_and_resolve_products,
+            _compact_resolution,
+            timeout,
+            top=min(max(int(top), 1), 10),
+            pillName=pillName,
+            vendor=vendor,
+            ProductCode=ProductCode,
+            q=q,
+        )
+
+    @mcp.tool(name="druginfo_client_stats")
+    async def druginfo_client_stats() -> Dict[str, Any]:
+        """캐시 적중률, rate limiter / bulkhead 대기열, 서킷 브레이커 상태, 업스트림 지연 분위수."""
+        return client_stats()
+
+    # druginfo_batch 로 묶어 실행할 수 있는 도구 (데코레이터는 원래 함수를 그대로 반환).
+    # 등록된 도구와 같은 인자 검증/형 변환을 거치도록 Tool 로 감싸 Tool.run 으로 실행
+    batch_functions: Dict[str, Callable[..., Awaitable[Dict[str, Any]]]] = {
+        "druginfo_list_main_ingredient": druginfo_list_main_ingredient,
+        "druginfo_get_main_ingredient_by_code": druginfo_get_main_ingredient_by_code,
+        "druginfo_list_product": druginfo_list_product,
+        "druginfo_get_product_by_code": druginfo_get_product_by_code,
+        "druginfo_list_main_ingredient_drug_effect": druginfo_list_main_ingredient_drug_effect,
+        "druginfo_get_main_ingredient_drug_effect_by_id": druginfo_get_main_ingredient_drug_effect_by_id,
+        "druginfo_list_main_ingredient_drug_kind": druginfo_list_main_ingredient_drug_kind,
+        "druginfo_list_main_ingredient_guide_a4": druginfo_list_main_ingredient_guide_a4,
+        "druginfo_list_main_ingredient_guide_a5": druginfo_list_main_ingredient_guide_a5,
+        "druginfo_list_main_ingredient_picto": druginfo_list_main_ingredient_picto,
+        "druginfo_get_main_ingredient_picto_by_code": druginfo_get_main_ingredient_picto_by_code,
+        "druginfo_list_product_edicode": druginfo_list_product_edicode,
+        "druginfo_list_product_edicode_same_ingredient": druginfo_list_product_edicode_same_ingredient,
+        "druginfo_get_products_by_codes": druginfo_get_products_by_codes,
+        "druginfo_get_main_ingredients_by_codes": druginfo_get_main_ingredients_by_codes,
+        "druginfo_search_and_get_products": druginfo_search_and_get_products,
+    }
+    batchable: Dict[str, Tool] = {name: Tool.from_function(fn, name=name) for name, fn in batch_functions.items()}
+
+    @mcp.tool(name="druginfo_batch")
+    async def druginfo_batch(calls: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """
+        여러 druginfo_* 도구 호출을 한 번에 동시 실행합니다 (최대 20개).
+        calls 의 각 항목은 {"tool": 도구 이름, "arguments": 인자 dict} 입니다.
+        예: 제품 상세 + 동일 주성분 목록 + 주성분 상세를 한 번의 도구 호출로 조회.
+        results 는 calls 와 같은 순서이며 항목마다 ok/result 또는 ok/error 를 담습니다.
+        """
+        if len(calls) > _MAX_BATCH_CALLS:
+            raise RuntimeError(f"calls 는 최대 {_MAX_BATCH_CALLS}개까지 실행할 수 있습니다 (요청: {len(calls)}개)")
+
+        def run(tool: Tool, arguments: Dict[str, Any]) -> Callable[[], Awaitable[Dict[str, Any]]]:
+            async def _run() -> Dict[str, Any]:
+                try:
+                    return await tool.run(arguments)
+                except ToolError as e:
+                    raise _batch_error(e)
+
+            return _run
+
+        results: List[Dict[str, Any]] = []
+        # (results 의 위치, 도구 이름, 실행 함수)
+        pending: List[Any] = []
+        for call in calls:
+            name = call.get("tool") if isinstance(call, dict) else None
+            tool = batchable.get(name) if isinstance(name, str) else None
+            if tool is None:
+                results.append({"tool": name, "ok": False, "error": f"배치로 실행할 수 없는 도구입니다: {name}"})
+                continue
+            arguments = call.get("arguments") or {}
+            if not isinstance(arguments, dict):
+                results.append({"tool": name, "ok": False, "error": "arguments 는 객체여야 합니다"})
+                continue
+            pending.append((len(results), name, run(tool, arguments)))
+            results.append({"tool": name, "ok": False})
+
+        # 하위 호출은 마감 시간 하나를 공유하고, 캐시/single-flight/재인증(세대당 로그인 1회)도 함께 사용.
+        # 동시 실행 수는 다른 fan-out 과 같은 AIMD 한도("batch" 계열)가 조절
+        with deadline_scope(_DEADLINE):
+            outcomes = await afan_out([item[2] for item in pending], adaptive_limiter("batch"))
+        for (index, name, _call), outcome in zip(pending, outcomes):
+            if isinstance(outcome, Exception):
+                results[index] = {"tool": name, "ok": False, "error": str(outcome) or type(outcome).__name__}
+            else:
+                results[index] = {"tool": name, "ok": True, "result": outcome}
+        return {"results": results}
+
+    # --- Non-GET tool wrappers removed (POST-only tools no longer exposed) ---
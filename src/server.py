@@ -25,14 +25,14 @@ logging.basicConfig(
 )
 logger = logging.getLogger("druginfo-mcp")
 
-# 핸들러 임포트
-from handlers import (
+# 핸들러 임포트 (src. 절대 경로: top-level auth.* 로 로드하면 client 와 다른 TokenStore 가 생김)
+from src.handlers import (
     setup_tool_handlers,
     setup_resource_handlers,
     setup_prompt_handlers,
 )
-from auth.manager import AuthManager
-from utils.config import Config
+from src.auth.manager import AuthManager
+from src.utils.config import Config
 
 
 class DrugInfoServer:
@@ -58,13 +58,9 @@ class DrugInfoServer:
         """서버 초기화"""
         logger.info("DrugInfo MCP 서버 초기화 중...")
 
-        # 자동 로그인 시도
-        if self.config.auto_login_enabled:
-            try:
-                await self.auth_manager.auto_login()
-                logger.info("자동 로그인 성공")
-            except Exception as e:
-                logger.warning(f"자동 로그인 실패: {e}")
+        # 자동 로그인은 백그라운드에서 진행해 initialize/list_tools 응답을 막지 않음.
+        # 첫 데이터 도구 호출만 로그인이 끝날 때까지 대기
+        self.auth_manager.start_auto_login()
 
         # 핸들러 설정
         setup_tool_handlers(self.server, self.auth_manager)
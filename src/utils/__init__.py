@@ -3,5 +3,19 @@
 """
 
 from .config import Config
+from .http import get_session, close_session, get_async_client, aclose_async_client
+from .deadline import Deadline, DeadlineExceeded, current_deadline, deadline_scope, no_deadline, remaining_timeout
 
-__all__ = ["Config"]
\ No newline at end of file
+__all__ = [
+    "Config",
+    "get_session",
+    "close_session",
+    "get_async_client",
+    "aclose_async_client",
+    "Deadline",
+    "DeadlineExceeded",
+    "current_deadline",
+    "deadline_scope",
+    "no_deadline",
+    "remaining_timeout",
+]
\ No newline at end of file
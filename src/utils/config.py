@@ -7,6 +7,23 @@ from typing import Optional
 from urllib.parse import urlparse
 
 
+def api_base_url() -> str:
+    """
+    DrugInfo API 호스트: EDB_BASE_URL, 없으면 EDB_LOGIN_URL 의 scheme://host. 둘 다 없으면 빈 문자열.
+
+    Config.base_url 과 달리 개발 서버 기본값을 쓰지 않습니다. 클라이언트와 커넥션 워머가 같은 호스트를 쓰도록
+    호출 시점의 환경 변수로 계산합니다.
+    """
+    base = (os.getenv("EDB_BASE_URL") or "").rstrip("/")
+    if not base:
+        login_url = os.getenv("EDB_LOGIN_URL") or ""
+        if "://" in login_url:
+            scheme, rest = login_url.split("://", 1)
+            host = rest.split("/", 1)[0]
+            base = f"{scheme}://{host}"
+    return base
+
+
 class Config:
     """환경 설정 관리 클래스"""
 
@@ -27,6 +44,75 @@ class Config:
         self.timeout = int(os.getenv("EDB_TIMEOUT", "15"))
         self.force_login = os.getenv("EDB_FORCE_LOGIN", "false").lower() == "true"
 
+        # 도구 호출 1회의 전체 마감 시간(초): 인증, 재시도, 백오프, 페이지 순회를 모두 포함
+        self.call_deadline = float(os.getenv("EDB_DEADLINE", "30"))
+
+        # HTTP 커넥션 풀
+        self.pool_connections = int(os.getenv("EDB_POOL_CONNECTIONS", "4"))
+        self.pool_maxsize = int(os.getenv("EDB_POOL_MAXSIZE", "16"))
+        self.pool_block = os.getenv("EDB_POOL_BLOCK", "false").lower() == "true"
+        self.http_keepalive = os.getenv("EDB_HTTP_KEEPALIVE", "true").lower() == "true"
+        self.keepalive_expiry = float(os.getenv("EDB_KEEPALIVE_EXPIRY", "60"))
+
+        # 유휴 커넥션 워머: 풀이 EDB_WARM_INTERVAL 초 쉬면 HEAD 요청으로 커넥션 N 개 유지 (0 이면 비활성화)
+        self.warm_connections = int(os.getenv("EDB_WARM_CONNECTIONS", "0"))
+        self.warm_interval = float(os.getenv("EDB_WARM_INTERVAL", "45"))
+
+        # 응답 캐시
+        self.cache_enabled = os.getenv("EDB_CACHE_ENABLED", "true").lower() == "true"
+        self.cache_ttl = float(os.getenv("EDB_CACHE_TTL", "300"))
+        self.cache_max_bytes = int(os.getenv("EDB_CACHE_MAX_BYTES", str(32 * 1024 * 1024)))
+        # 엔드포인트별 신선도 정책(druginfo/freshness.py) 사용 여부, false 이면 EDB_CACHE_TTL 일괄 적용
+        self.cache_policies_enabled = os.getenv("EDB_CACHE_POLICIES", "true").lower() == "true"
+
+        # 디스크 응답 캐시 (재시작 후에도 유지)
+        cache_home = os.getenv("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache")
+        self.disk_cache_enabled = os.getenv("EDB_DISK_CACHE_ENABLED", "true").lower() == "true"
+        self.disk_cache_path = os.getenv(
+            "EDB_DISK_CACHE_PATH", os.path.join(cache_home, "druginfo-mcp", "responses.sqlite3")
+        )
+        self.disk_cache_max_age = float(os.getenv("EDB_DISK_CACHE_MAX_AGE", str(7 * 24 * 3600)))
+
+        # 자주 조회되는 상세/동일 주성분 항목을 만료 직전에 미리 갱신 (refresh-ahead)
+        self.refresh_ahead_enabled = os.getenv("EDB_REFRESH_AHEAD", "true").lower() == "true"
+        self.refresh_ahead_top = int(os.getenv("EDB_REFRESH_AHEAD_TOP", "300"))
+        self.refresh_ahead_lead = float(os.getenv("EDB_REFRESH_AHEAD_LEAD", "300"))
+        self.refresh_ahead_budget = int(os.getenv("EDB_REFRESH_AHEAD_BUDGET", "60"))
+
+        # 업스트림 장애 대응: 5xx/커넥션 오류/타임아웃 재시도와 엔드포인트별 서킷 브레이커
+        self.retry_max = int(os.getenv("EDB_RETRY_MAX", "2"))
+        self.retry_base_delay = float(os.getenv("EDB_RETRY_BASE_DELAY", "0.3"))
+        self.retry_max_delay = float(os.getenv("EDB_RETRY_MAX_DELAY", "3"))
+        self.breaker_threshold = int(os.getenv("EDB_BREAKER_THRESHOLD", "5"))
+        self.breaker_reset_timeout = float(os.getenv("EDB_BREAKER_RESET", "30"))
+
+        # 다건 조회(fan-out) 적응형 동시 실행 한도: 시작값과 상한 (계열 bulkhead 안에서 동작)
+        self.fanout_initial = int(os.getenv("EDB_FANOUT_INITIAL", "4"))
+        self.fanout_max = int(os.getenv("EDB_FANOUT_MAX", "8"))
+
+        # 목록 자동 페이지 순회(iter_*)의 기본 업스트림 PageSize
+        self.iter_page_size = int(os.getenv("EDB_ITER_PAGE_SIZE", "100"))
+
+        # 상세 조회 hedged request: 관측 P90 지연 안에 응답이 없으면 같은 요청을 한 번 더 전송
+        self.hedge_enabled = os.getenv("EDB_HEDGE", "false").lower() == "true"
+        self.hedge_min_delay = float(os.getenv("EDB_HEDGE_MIN_DELAY", "0.05"))
+
+        # 클라이언트 측 rate limit (초당 요청 수, 0 이면 비활성화) 과 엔드포인트 계열별 동시 실행 한도
+        self.rate_limit = float(os.getenv("EDB_RATE_LIMIT", "20"))
+        self.rate_burst = float(os.getenv("EDB_RATE_BURST", "40"))
+        self.bulkhead_list = int(os.getenv("EDB_BULKHEAD_LIST", "4"))
+        self.bulkhead_detail = int(os.getenv("EDB_BULKHEAD_DETAIL", "8"))
+        self.bulkhead_same_ingredient = int(os.getenv("EDB_BULKHEAD_SAME_INGREDIENT", "4"))
+        self.bulkhead_reference = int(os.getenv("EDB_BULKHEAD_REFERENCE", "2"))
+
+        # JWT exp 기준 만료 몇 초 전에 백그라운드로 재로그인할지
+        self.token_refresh_lead = float(os.getenv("EDB_TOKEN_REFRESH_LEAD", "300"))
+        # 토큰 파일 캐시 (0600): 재시작 시 아직 유효한 토큰이 있으면 로그인 생략
+        self.token_cache_enabled = os.getenv("EDB_TOKEN_CACHE", "true").lower() == "true"
+        self.token_cache_path = os.getenv(
+            "EDB_TOKEN_CACHE_PATH", os.path.join(cache_home, "druginfo-mcp", "token.json")
+        )
+
         # 자동 로그인 활성화 여부
         self.auto_login_enabled = bool(self.user_id and self.password)
 
@@ -44,8 +130,17 @@ class Config:
             f"  login_url={self.login_url}\n"
             f"  user_id={'설정됨' if self.user_id else '미설정'}\n"
             f"  password={'설정됨' if self.password else '미설정'}\n"
-            f"  timeout={self.timeout}초\n"
+            f"  timeout={self.timeout}초 (deadline={self.call_deadline}초)\n"
             f"  force_login={self.force_login}\n"
+            f"  pool={self.pool_connections}x{self.pool_maxsize} (block={self.pool_block})\n"
+            f"  keepalive={self.http_keepalive}, warm={self.warm_connections}개/{self.warm_interval}초\n"
+            f"  cache={'활성화' if self.cache_enabled else '비활성화'} (ttl={self.cache_ttl}초, max={self.cache_max_bytes}B)\n"
+            f"  disk_cache={self.disk_cache_path if self.disk_cache_enabled else '비활성화'}\n"
+            f"  refresh_ahead={'활성화' if self.refresh_ahead_enabled else '비활성화'} (top={self.refresh_ahead_top}, budget={self.refresh_ahead_budget}/분)\n"
+            f"  retry={self.retry_max}회 (backoff {self.retry_base_delay}~{self.retry_max_delay}초), breaker={self.breaker_threshold}회/{self.breaker_reset_timeout}초\n"
+            f"  rate_limit={self.rate_limit}/초 (burst={self.rate_burst}), bulkhead=list:{self.bulkhead_list}"
+            f" detail:{self.bulkhead_detail} same_ingredient:{self.bulkhead_same_ingredient} reference:{self.bulkhead_reference}\n"
+            f"  hedge={'활성화' if self.hedge_enabled else '비활성화'}\n"
             f"  auto_login={'활성화' if self.auto_login_enabled else '비활성화'}\n"
             f")"
         )
\ No newline at end of file
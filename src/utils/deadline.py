@@ -0,0 +1,74 @@
+"""
+호출 단위 마감 시간(deadline) 전파.
+
+도구 호출 하나에 전체 마감 시간을 정하고 contextvars 로 인증, 재시도, 백오프, 페이지 순회까지 전달합니다.
+각 단계는 남은 시간으로 소켓 타임아웃을 줄이고, 남은 시간이 부족하면 재시도를 포기합니다.
+asyncio 태스크와 asyncio.to_thread 는 컨텍스트를 복사하므로 자동으로 이어집니다.
+"""
+
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Iterator, Optional
+
+
+class DeadlineExceeded(TimeoutError):
+    """호출 전체 마감 시간을 넘긴 경우."""
+
+
+class Deadline:
+    __slots__ = ("expires_at",)
+
+    def __init__(self, seconds: float):
+        self.expires_at = time.monotonic() + float(seconds)
+
+    def remaining(self) -> float:
+        return max(self.expires_at - time.monotonic(), 0.0)
+
+    @property
+    def expired(self) -> bool:
+        return self.expires_at <= time.monotonic()
+
+    def clamp(self, timeout: float) -> float:
+        """timeout 을 남은 시간으로 줄입니다. 이미 지났으면 DeadlineExceeded."""
+        remaining = self.remaining()
+        if remaining <= 0:
+            raise DeadlineExceeded("요청 마감 시간을 초과했습니다")
+        return min(float(timeout), remaining)
+
+
+_CURRENT: "ContextVar[Optional[Deadline]]" = ContextVar("edb_deadline", default=None)
+
+
+def current_deadline() -> Optional[Deadline]:
+    return _CURRENT.get()
+
+
+def remaining_timeout(timeout: float) -> float:
+    """현재 마감 시간이 있으면 timeout 을 남은 시간으로 줄이고, 없으면 그대로 반환합니다."""
+    deadline = _CURRENT.get()
+    return deadline.clamp(timeout) if deadline is not None else float(timeout)
+
+
+@contextmanager
+def deadline_scope(seconds: float) -> Iterator[Deadline]:
+    """seconds 뒤 마감되는 범위. 바깥 범위의 마감이 더 이르면 그것을 유지합니다."""
+    deadline = Deadline(seconds)
+    parent = _CURRENT.get()
+    if parent is not None and parent.expires_at < deadline.expires_at:
+        deadline = parent
+    token = _CURRENT.set(deadline)
+    try:
+        yield deadline
+    finally:
+        _CURRENT.reset(token)
+
+
+@contextmanager
+def no_deadline() -> Iterator[None]:
+    """백그라운드 작업처럼 호출자의 마감과 무관하게 실행해야 하는 범위."""
+    token = _CURRENT.set(None)
+    try:
+        yield
+    finally:
+        _CURRENT.reset(token)
@@ -0,0 +1,150 @@
+"""
+HTTP 세션 관리 모듈 - EDB API 호출용 공유 커넥션 풀 (동기 requests, 비동기 httpx)
+"""
+
+import asyncio
+import socket
+import threading
+import time
+from http.cookiejar import CookieJar, DefaultCookiePolicy
+from typing import Dict, Optional, Tuple
+
+import httpx
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.connection import HTTPConnection
+
+from .config import Config
+
+
+_SESSION: Optional[requests.Session] = None
+_SESSION_LOCK = threading.Lock()
+
+_ASYNC_CLIENT: Optional[httpx.AsyncClient] = None
+_ASYNC_CLIENT_LOOP: Optional[asyncio.AbstractEventLoop] = None
+
+# 풀별 마지막 사용 시각 (monotonic). 유휴 커넥션 워머(utils/warmer.py)가 참고
+_LAST_USED: Dict[str, Optional[float]] = {"sync": None, "async": None}
+
+
+class KeepAliveAdapter(HTTPAdapter):
+    """TCP keep-alive 소켓 옵션을 적용하는 HTTPAdapter"""
+
+    def __init__(self, keepalive: bool = True, **kwargs):
+        # HTTPAdapter.__init__ 내부에서 init_poolmanager 가 호출되므로 먼저 설정
+        self.keepalive = keepalive
+        super().__init__(**kwargs)
+
+    def init_poolmanager(self, *args, **kwargs):
+        if self.keepalive:
+            kwargs["socket_options"] = HTTPConnection.default_socket_options + [
+                (socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1),
+            ]
+        super().init_poolmanager(*args, **kwargs)
+
+
+def _build_session(config: Config) -> requests.Session:
+    session = requests.Session()
+    # 요청 간 쿠키 공유 방지 (인증은 Bearer 토큰만 사용)
+    session.cookies.set_policy(DefaultCookiePolicy(allowed_domains=[]))
+    adapter = KeepAliveAdapter(
+        keepalive=config.http_keepalive,
+        pool_connections=config.pool_connections,
+        pool_maxsize=config.pool_maxsize,
+        pool_block=config.pool_block,
+    )
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    if config.http_keepalive:
+        session.headers["Connection"] = "keep-alive"
+    return session
+
+
+def get_session(config: Optional[Config] = None) -> requests.Session:
+    """
+    프로세스 전역 공유 세션을 반환합니다.
+
+    최초 호출 시 한 번만 생성되며, 로그인과 모든 데이터 조회가 같은 커넥션 풀을 재사용합니다.
+    urllib3 커넥션 풀은 스레드 안전하므로 여러 스레드에서 동시에 사용해도 됩니다.
+    """
+    global _SESSION
+    mark_used("sync")
+    if _SESSION is not None:
+        return _SESSION
+    with _SESSION_LOCK:
+        if _SESSION is None:
+            _SESSION = _build_session(config or Config())
+        return _SESSION
+
+
+def close_session() -> None:
+    """공유 세션을 닫습니다. 다음 get_session() 호출 시 새로 생성됩니다."""
+    global _SESSION
+    with _SESSION_LOCK:
+        if _SESSION is not None:
+            _SESSION.close()
+            _SESSION = None
+
+
+def _build_async_client(config: Config) -> httpx.AsyncClient:
+    limits = httpx.Limits(
+        max_connections=config.pool_maxsize,
+        max_keepalive_connections=config.pool_maxsize if config.http_keepalive else 0,
+        keepalive_expiry=config.keepalive_expiry,
+    )
+    return httpx.AsyncClient(
+        limits=limits,
+        cookies=httpx.Cookies(CookieJar(policy=DefaultCookiePolicy(allowed_domains=[]))),
+        follow_redirects=True,
+    )
+
+
+def get_async_client(config: Optional[Config] = None) -> httpx.AsyncClient:
+    """
+    현재 이벤트 루프에서 공유하는 httpx.AsyncClient 를 반환합니다.
+
+    httpx 커넥션 풀은 생성된 이벤트 루프에 묶이므로, 루프가 바뀌면(예: asyncio.run 재호출) 새로 생성합니다.
+    """
+    global _ASYNC_CLIENT, _ASYNC_CLIENT_LOOP
+    loop = asyncio.get_running_loop()
+    mark_used("async")
+    if _ASYNC_CLIENT is not None and _ASYNC_CLIENT_LOOP is loop and not _ASYNC_CLIENT.is_closed:
+        return _ASYNC_CLIENT
+    _ASYNC_CLIENT = _build_async_client(config or Config())
+    _ASYNC_CLIENT_LOOP = loop
+    return _ASYNC_CLIENT
+
+
+def mark_used(pool: str) -> None:
+    _LAST_USED[pool] = time.monotonic()
+
+
+def idle_for(pool: str) -> Optional[float]:
+    """pool("sync" / "async") 을 마지막으로 사용한 뒤 지난 초. 한 번도 사용하지 않았으면 None."""
+    last_used = _LAST_USED[pool]
+    if last_used is None:
+        return None
+    return time.monotonic() - last_used
+
+
+def current_session() -> Optional[requests.Session]:
+    """이미 만들어진 공유 세션 (없으면 None). 사용 시각을 갱신하지 않습니다."""
+    return _SESSION
+
+
+def current_async_client() -> Optional[Tuple[httpx.AsyncClient, asyncio.AbstractEventLoop]]:
+    """이미 만들어진 AsyncClient 와 그 이벤트 루프 (없거나 루프가 멈췄으면 None). 사용 시각을 갱신하지 않습니다."""
+    client, loop = _ASYNC_CLIENT, _ASYNC_CLIENT_LOOP
+    if client is None or loop is None or client.is_closed or loop.is_closed() or not loop.is_running():
+        return None
+    return client, loop
+
+
+async def aclose_async_client() -> None:
+    """공유 AsyncClient 를 닫습니다."""
+    global _ASYNC_CLIENT, _ASYNC_CLIENT_LOOP
+    client = _ASYNC_CLIENT
+    _ASYNC_CLIENT = None
+    _ASYNC_CLIENT_LOOP = None
+    if client is not None and not client.is_closed:
+        await client.aclose()
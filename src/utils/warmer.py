@@ -0,0 +1,161 @@
+"""
+유휴 커넥션 워머.
+
+MCP 세션은 요청이 몰렸다 끊기는 패턴이라, 몇 분 쉬면 풀의 커넥션이 업스트림이나 중간 장비에서 끊겨
+다음 호출이 DNS/TCP/TLS 비용을 다시 냅니다. 풀이 interval 초 이상 쉬면 클라이언트와 같은 API 호스트로 가벼운 HEAD 요청을
+connections 개 동시에 보내 그만큼의 커넥션을 살려 둡니다. 실제 호출이 있는 동안에는 아무것도 보내지 않고,
+한 번도 사용하지 않은 풀(예: 동기 경로만 쓰는 프로세스의 비동기 풀)은 데우지 않습니다.
+토큰 갱신 스레드와 함께 시작되며(자격 증명이 있을 때만), 갱신 로그인도 풀 사용으로 집계됩니다.
+"""
+
+import asyncio
+import logging
+import threading
+from typing import Any, Dict, Optional
+
+import httpx
+import requests
+
+from .config import Config, api_base_url
+from .http import current_async_client, current_session, idle_for, mark_used
+
+logger = logging.getLogger(__name__)
+
+
+class ConnectionWarmer:
+    """동기(requests) / 비동기(httpx) 공유 풀을 각각 유휴 시간 기준으로 데웁니다."""
+
+    def __init__(self, url: str, connections: int = 2, interval: float = 45.0, timeout: float = 5.0):
+        self.url = url
+        self.connections = max(int(connections), 1)
+        self.interval = float(interval)
+        self.timeout = float(timeout)
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._lock = threading.Lock()
+        self.pings = 0
+        self.failed = 0
+
+    def start(self) -> None:
+        with self._lock:
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._loop, name="edb-connection-warmer", daemon=True)
+                self._thread.start()
+
+    def stop(self) -> None:
+        self._stop.set()
+
+    def run_once(self) -> float:
+        """유휴 풀을 데우고, 다음 확인까지 기다릴 초를 반환합니다."""
+        wait = self.interval
+        for pool in ("sync", "async"):
+            idle = idle_for(pool)
+            if idle is None:
+                # 실제 요청이 한 번도 없었던 풀은 데우지 않음 (쓰지 않는 쪽 풀에 커넥션을 만들지 않도록)
+                continue
+            if idle >= self.interval:
+                self._warm(pool)
+                idle = 0.0
+            wait = min(wait, self.interval - idle)
+        return max(wait, 1.0)
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "connections": self.connections,
+            "interval": self.interval,
+            "pings": self.pings,
+            "failed": self.failed,
+            "idle": {pool: _rounded(idle_for(pool)) for pool in ("sync", "async")},
+        }
+
+    def _loop(self) -> None:
+        while not self._stop.wait(self.run_once()):
+            pass
+
+    def _warm(self, pool: str) -> None:
+        try:
+            if pool == "sync":
+                ok = self._warm_sync()
+            else:
+                ok = self._warm_async()
+        except Exception as e:
+            logger.debug(f"커넥션 워밍 실패({pool}): {e}")
+            ok = None
+        if ok is None:
+            return
+        self.pings += ok
+        self.failed += self.connections - ok
+        # 워밍도 풀 사용으로 보아 다음 주기까지 다시 보내지 않음
+        mark_used(pool)
+
+    def _warm_sync(self) -> Optional[int]:
+        session = current_session()
+        if session is None:
+            return None
+        results = [False] * self.connections
+
+        def ping(i: int) -> None:
+            try:
+                session.head(self.url, timeout=self.timeout, allow_redirects=False)
+                results[i] = True
+            except requests.RequestException:
+                pass
+
+        # 동시에 보내야 커넥션이 connections 개 유지됨
+        threads = [threading.Thread(target=ping, args=(i,), daemon=True) for i in range(self.connections)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        return sum(results)
+
+    def _warm_async(self) -> Optional[int]:
+        current = current_async_client()
+        if current is None:
+            return None
+        client, loop = current
+
+        async def ping() -> bool:
+            try:
+                await client.head(self.url, timeout=self.timeout)
+                return True
+            except httpx.HTTPError:
+                return False
+
+        async def ping_all() -> int:
+            return sum(await asyncio.gather(*(ping() for _ in range(self.connections))))
+
+        # httpx 풀은 생성된 루프에 묶여 있으므로 그 루프에서 실행
+        return asyncio.run_coroutine_threadsafe(ping_all(), loop).result(self.timeout + 1.0)
+
+
+def _rounded(idle: Optional[float]) -> Optional[float]:
+    return round(idle, 1) if idle is not None else None
+
+
+_WARMER: Optional[ConnectionWarmer] = None
+_WARMER_LOCK = threading.Lock()
+
+
+def get_warmer() -> Optional[ConnectionWarmer]:
+    """설정이 켜져 있으면(EDB_WARM_CONNECTIONS > 0) 프로세스 전역 워머, 아니면 None."""
+    global _WARMER
+    if _WARMER is not None:
+        return _WARMER
+    config = Config()
+    if config.warm_connections <= 0:
+        return None
+    # 클라이언트와 같은 호스트 (EDB_LOGIN_URL 만 설정된 경우 포함). 알 수 없으면 데우지 않음
+    url = api_base_url()
+    if not url:
+        return None
+    with _WARMER_LOCK:
+        if _WARMER is None:
+            _WARMER = ConnectionWarmer(url, config.warm_connections, config.warm_interval, timeout=config.timeout)
+        return _WARMER
+
+
+def start_warmer() -> None:
+    warmer = get_warmer()
+    if warmer is not None:
+        warmer.start()